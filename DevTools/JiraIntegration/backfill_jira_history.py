@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+BetterWYD Jira History Backfill
+
+Links the commits made before the Git hooks were installed to their Jira
+tickets. The whole history is streamed from a single `git log` call, ticket
+references are extracted with extract_jira_info, and (commit, ticket) pairs
+already in the commit -> ticket index are skipped without any network access.
+The rest is queued in the spool in chunks, one comment per ticket per chunk,
+and delivered by a rate-limited concurrent drain.
+
+Progress is checkpointed after every chunk, so an interrupted backfill resumes
+where it stopped. Historical transition hashtags are ignored unless
+--with-transitions is given: re-applying an old '#done' would move tickets that
+have been reopened since.
+
+Usage:
+    python backfill_jira_history.py --dry-run          # count what would be linked
+    python backfill_jira_history.py [--rev main] [--rate 5] [--concurrency 8]
+    python backfill_jira_history.py --restart          # ignore the checkpoint
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+# Get the script directory
+SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+
+# Add the JiraIntegration directory to the Python path
+sys.path.append(str(SCRIPT_DIR))
+
+from jira_integration import JiraAPI, CACHE_DIR
+from jira_spool import JiraSpool, drain_spool
+from update_jira_from_commit import extract_jira_info, iter_git_range, spool_commit_batch
+
+# Progress of an interrupted backfill
+CHECKPOINT_FILE = CACHE_DIR / 'backfill_checkpoint.json'
+
+# Commits spooled (and drained) per chunk
+DEFAULT_CHUNK_SIZE = 500
+
+# Delivery limits: Jira Cloud throttles bursts, so stay well below them
+DEFAULT_RATE = 5.0
+DEFAULT_CONCURRENCY = 8
+
+
+def resolve_commit(revision: str) -> Optional[str]:
+    """
+    Resolve a revision to a commit hash
+
+    Args:
+        revision: Branch, tag or commit
+
+    Returns:
+        The full commit hash, or None if the revision does not exist
+    """
+    result = subprocess.run(['git', 'rev-parse', '--verify', '--quiet', f'{revision}^{{commit}}'],
+                            capture_output=True, text=True)
+    return result.stdout.strip() or None
+
+
+def count_commits(tip: str) -> int:
+    """Number of commits reachable from tip"""
+    return int(subprocess.check_output(['git', 'rev-list', '--count', tip], text=True).strip())
+
+
+def load_checkpoint(path: Path = CHECKPOINT_FILE) -> Optional[Dict[str, Any]]:
+    """Read the checkpoint of an interrupted backfill"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_checkpoint(checkpoint: Dict[str, Any], path: Path = CHECKPOINT_FILE):
+    """Write the checkpoint atomically"""
+    checkpoint["updated_at"] = datetime.now().isoformat(timespec="seconds")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def count_new_references(spool: JiraSpool, commits: List[Dict[str, str]]) -> int:
+    """
+    Count the (commit, ticket) pairs that are not linked yet
+
+    Args:
+        spool: Spool holding the commit -> ticket index
+        commits: Commit information dictionaries
+
+    Returns:
+        Number of pairs a backfill would link
+    """
+    pairs = {(commit['hash'], info['ticket_id'])
+             for commit in commits for info in extract_jira_info(commit['message'])}
+    return len(pairs - spool.known_links(pairs))
+
+
+def backfill(revision: str = "HEAD", chunk_size: int = DEFAULT_CHUNK_SIZE, rate: float = DEFAULT_RATE,
+             concurrency: int = DEFAULT_CONCURRENCY, with_transitions: bool = False,
+             dry_run: bool = False, restart: bool = False) -> bool:
+    """
+    Link the history up to a revision to Jira
+
+    Args:
+        revision: Newest commit to backfill (everything reachable from it is included)
+        chunk_size: Commits spooled and drained per chunk
+        rate: Maximum number of Jira updates per second
+        concurrency: Maximum number of requests in flight
+        with_transitions: Also apply the transition hashtags found in old commits
+        dry_run: Only count what would be linked
+        restart: Ignore the checkpoint of an earlier run
+
+    Returns:
+        True if the backfill completed
+    """
+    checkpoint = None if restart or dry_run else load_checkpoint()
+    if checkpoint and checkpoint.get("revision") == revision:
+        tip = checkpoint["tip"]
+        print(f"Resuming backfill of {revision} at commit {checkpoint['processed']} "
+              f"(checkpoint from {checkpoint.get('updated_at')})")
+    else:
+        tip = resolve_commit(revision)
+        if not tip:
+            print(f"Unknown revision: {revision}")
+            return False
+        checkpoint = {"revision": revision, "tip": tip, "processed": 0, "queued": 0}
+
+    total = count_commits(tip)
+    print(f"Backfilling {total} commits up to {tip[:7]} ({revision})")
+
+    jira = None
+    if not dry_run:
+        try:
+            jira = JiraAPI()
+        except ValueError as e:
+            print(f"Error initializing Jira API: {e}")
+            return False
+
+    started = time.perf_counter()
+    linked = 0
+    check_connection = True
+    try:
+        with JiraSpool() as spool:
+            commits = iter_git_range([tip])
+            # Skip what earlier runs already spooled (the order of a fixed tip is stable)
+            for _ in islice(commits, checkpoint["processed"]):
+                pass
+
+            while True:
+                chunk = list(islice(commits, chunk_size))
+                if not chunk:
+                    break
+
+                if dry_run:
+                    linked += count_new_references(spool, chunk)
+                else:
+                    queued = spool_commit_batch(spool, chunk, transitions=with_transitions, verbose=False)
+                    checkpoint["queued"] += queued
+                    if queued:
+                        stats = drain_spool(jira, spool, check_connection=check_connection,
+                                            concurrency=concurrency, max_rate=rate)
+                        if stats is None:
+                            # Spooled items are durable; the next run delivers them
+                            print("Stopping: Jira is unreachable or another drainer is running")
+                            checkpoint["processed"] += len(chunk)
+                            save_checkpoint(checkpoint)
+                            return False
+                        check_connection = False
+
+                checkpoint["processed"] += len(chunk)
+                if not dry_run:
+                    save_checkpoint(checkpoint)
+                print(f"Processed {checkpoint['processed']}/{total} commits "
+                      f"({time.perf_counter() - started:.1f}s)")
+    except subprocess.CalledProcessError as e:
+        print(f"Error reading the git history: {e}")
+        print("If the history was rewritten, run again with --restart")
+        return False
+    finally:
+        if jira:
+            jira.close()
+
+    if dry_run:
+        print(f"{linked} commit -> ticket links would be added")
+    else:
+        print(f"Backfill complete: {checkpoint['queued']} Jira updates queued")
+        print(f"Jira requests: {jira.scheduler.summary()}")
+        CHECKPOINT_FILE.unlink(missing_ok=True)
+    return True
+
+
+def main():
+    """Parse the command line and run the backfill"""
+    parser = argparse.ArgumentParser(description="Link the whole git history to Jira")
+    parser.add_argument("--rev", default="HEAD", help="Newest commit to backfill (default: HEAD)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"Commits per chunk (default: {DEFAULT_CHUNK_SIZE})")
+    parser.add_argument("--rate", type=float, default=DEFAULT_RATE,
+                        help=f"Maximum Jira updates per second (default: {DEFAULT_RATE})")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                        help=f"Maximum requests in flight (default: {DEFAULT_CONCURRENCY})")
+    parser.add_argument("--with-transitions", action="store_true",
+                        help="Also apply transition hashtags found in old commits")
+    parser.add_argument("--dry-run", action="store_true", help="Only count what would be linked")
+    parser.add_argument("--restart", action="store_true", help="Ignore the checkpoint of an earlier run")
+    args = parser.parse_args()
+
+    completed = backfill(args.rev, args.chunk_size, args.rate, args.concurrency,
+                         args.with_transitions, args.dry_run, args.restart)
+    sys.exit(0 if completed else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+BetterWYD Jira Connection Pooling Benchmark
+
+Measures per-call latency of JiraAPI against the local mock Jira server with
+the pooled keep-alive transport and with a new connection for every call.
+
+The mock server sleeps once per accepted connection (--connection-latency) to
+stand in for the TCP + TLS handshake that a real Jira Cloud call pays.
+
+Usage:
+    python benchmark_pooling.py --calls 200 --connection-latency 0.03
+"""
+
+import os
+import sys
+import time
+import argparse
+import statistics
+from pathlib import Path
+from typing import Dict, List
+
+# Get the script directory
+SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+
+# Add the JiraIntegration directory to the Python path
+sys.path.append(str(SCRIPT_DIR))
+
+from mock_jira_server import MockJiraServer
+
+
+def configure_mock_environment(url: str):
+    """Point JiraAPI at the mock server (overrides values from .env)"""
+    os.environ["JIRA_EMAIL"] = "benchmark@example.com"
+    os.environ["JIRA_API_TOKEN"] = "benchmark-token"
+    os.environ["JIRA_URL"] = url
+    os.environ["JIRA_PROJECT_KEY"] = "BWYD"
+    # Measure the transport, not the client-side rate limit
+    os.environ["JIRA_RATE_LIMIT"] = "0"
+
+
+def run_hook_workload(jira, issue_key: str, calls: int) -> List[float]:
+    """
+    Replay the post-commit hook call pattern and time each call
+
+    Args:
+        jira: JiraAPI instance
+        issue_key: Issue to comment on
+        calls: Number of API calls to make
+
+    Returns:
+        Latency of every call in seconds
+    """
+    operations = [
+        lambda: jira.request("GET", "/rest/api/3/myself"),
+        lambda: jira.request("POST", f"/rest/api/3/issue/{issue_key}/comment",
+                             json={"body": {"type": "doc", "version": 1, "content": []}}),
+        lambda: jira.request("GET", f"/rest/api/3/issue/{issue_key}/transitions"),
+        lambda: jira.request("GET", f"/rest/api/3/issue/{issue_key}"),
+    ]
+
+    latencies = []
+    for i in range(calls):
+        started = time.perf_counter()
+        response = operations[i % len(operations)]()
+        response.content  # make sure the body is fully read before stopping the clock
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def summarize(latencies: List[float]) -> Dict[str, float]:
+    """Compute latency statistics in milliseconds"""
+    ordered = sorted(latencies)
+    return {
+        "mean": statistics.mean(ordered) * 1000,
+        "p50": ordered[len(ordered) // 2] * 1000,
+        "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000,
+        "total": sum(ordered) * 1000,
+    }
+
+
+def main():
+    """Run the pooled vs. unpooled benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark JiraAPI connection pooling")
+    parser.add_argument("--calls", type=int, default=200, help="API calls per scenario")
+    parser.add_argument("--connection-latency", type=float, default=0.03,
+                        help="Simulated handshake cost per new connection (seconds)")
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="Simulated server processing time per request (seconds)")
+    args = parser.parse_args()
+
+    server = MockJiraServer(latency=args.latency, connection_latency=args.connection_latency).start()
+    configure_mock_environment(server.url)
+
+    from jira_integration import JiraAPI
+
+    issue_key = server.state.add_issue({"summary": "Benchmark issue"})["key"]
+
+    print(f"Mock Jira server: {server.url}")
+    print(f"Calls per scenario: {args.calls}, handshake cost: {args.connection_latency * 1000:.1f} ms, "
+          f"server latency: {args.latency * 1000:.1f} ms\n")
+    print(f"{'Scenario':<22}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'total ms':>12}{'connections':>13}")
+
+    results = {}
+    for label, keep_alive in (("new connection/call", False), ("pooled keep-alive", True)):
+        server.state.reset_counters()
+        with JiraAPI(keep_alive=keep_alive) as jira:
+            stats = summarize(run_hook_workload(jira, issue_key, args.calls))
+        results[label] = stats
+        print(f"{label:<22}{stats['mean']:>10.2f}{stats['p50']:>10.2f}{stats['p95']:>10.2f}"
+              f"{stats['total']:>12.1f}{server.state.connections:>13}")
+
+    speedup = results["new connection/call"]["mean"] / results["pooled keep-alive"]["mean"]
+    print(f"\nPooled transport is {speedup:.1f}x faster per call")
+
+    server.stop()
+
+
+if __name__ == "__main__":
+    main()
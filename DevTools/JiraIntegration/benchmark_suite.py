@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+BetterWYD Jira Benchmark Suite
+
+Reproducible, offline performance checks for the Jira integration. Every
+scenario runs against the in-process mock Jira server (mock_jira_server.py),
+seeded with a synthetic project of each requested size, so no Atlassian site
+and no credentials are needed:
+
+- search_scan        stream every issue with iter_project_issues
+- record_scan        the same as compact records with a three-field projection
+- report_client      generate_progress_report() (downloads and counts issues)
+- report_server      generate_progress_report(server_side=True) (count queries)
+- roadmap_seed       setup_jira_project's roadmap sync into an empty project
+- roadmap_resync     the same sync again (must be a no-op)
+- commit_updater     read a range of commits from git, spool and deliver them
+- throttled_comments concurrent comments against a server that answers 429
+
+Each scenario reports wall time, requests sent to the server and 429s
+received. Results can be saved as a baseline and later runs compared against
+it: a scenario regresses if it sends more requests than the baseline (request
+counts are deterministic), takes more than --tolerance times as long, or fails
+its correctness check. The exit status is 1 on any regression.
+
+Usage:
+    python benchmark_suite.py                                  # small and medium scale
+    python benchmark_suite.py --scales 200 2000 10000 --latency 0.002
+    python benchmark_suite.py --save-baseline .jira_cache/benchmark_baseline.json
+    python benchmark_suite.py --baseline .jira_cache/benchmark_baseline.json
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import shutil
+import asyncio
+import argparse
+import tempfile
+import subprocess
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import Dict, List, Any, Callable, Optional
+
+# Get the script directory
+SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+
+# Add the JiraIntegration directory to the Python path
+sys.path.append(str(SCRIPT_DIR))
+
+from mock_jira_server import MockJiraServer
+
+# Named project sizes (number of issues)
+SCALES = {"small": 200, "medium": 2000, "large": 10000}
+DEFAULT_SCALES = ["small", "medium"]
+
+# A run regresses if it is this much slower than the baseline...
+DEFAULT_TOLERANCE = 1.5
+# ...and slower by at least this many seconds (ignores jitter on tiny timings)
+MIN_REGRESSION_SECONDS = 0.05
+
+# Throttled scenario: comments sent, server-side limit and client concurrency
+THROTTLED_COMMENTS = 120
+THROTTLED_SERVER_RATE = 60.0
+THROTTLED_CONCURRENCY = 16
+
+
+def configure_environment(url: str, cache_dir: Path):
+    """
+    Point every integration module at the mock server and a scratch state directory
+
+    Must run before the integration modules are imported: they read
+    JIRA_CACHE_DIR at import time. Values from .env are not used.
+    """
+    os.environ["JIRA_EMAIL"] = "benchmark@example.com"
+    os.environ["JIRA_API_TOKEN"] = "benchmark-token"
+    os.environ["JIRA_URL"] = url
+    os.environ["JIRA_PROJECT_KEY"] = "BWYD"
+    os.environ["JIRA_CACHE_DIR"] = str(cache_dir)
+    # Cold, deterministic runs: no metadata cache, no client-side rate limit
+    os.environ["JIRA_METADATA_CACHE"] = "0"
+    os.environ["JIRA_RATE_LIMIT"] = "0"
+    os.environ.pop("JIRA_METRICS", None)
+
+
+def create_commit_history(repo_dir: Path, issue_keys: List[str], count: int) -> str:
+    """
+    Create a repository with synthetic commits referencing the given issues
+
+    The history is written with a single `git fast-import` call, so thousands
+    of commits take a fraction of a second.
+
+    Args:
+        repo_dir: Directory for the new repository
+        issue_keys: Keys the commit messages refer to
+        count: Number of commits
+
+    Returns:
+        Hash of the newest commit
+    """
+    subprocess.run(["git", "init", "-q", str(repo_dir)], check=True)
+    stream = []
+    for index in range(count):
+        key = issue_keys[(index * 7) % len(issue_keys)]
+        command = " #inprogress" if index % 5 == 0 else ""
+        message = f"{key}{command} Synthetic change {index + 1}\n\nTouches the item drop tables.\n".encode()
+        stream.append(b"commit refs/heads/bench\n")
+        stream.append(f"mark :{index + 1}\n".encode())
+        stream.append(f"committer Bench <bench@example.com> {1700000000 + index * 60} +0000\n".encode())
+        stream.append(f"data {len(message)}\n".encode() + message)
+        if index:
+            stream.append(f"from :{index}\n".encode())
+        stream.append(b"\n")
+    subprocess.run(["git", "fast-import", "--quiet"], input=b"".join(stream), cwd=repo_dir, check=True)
+    return subprocess.check_output(["git", "rev-parse", "refs/heads/bench"], cwd=repo_dir, text=True).strip()
+
+
+class BenchmarkRun:
+    """Runs the scenarios of one scale against a seeded mock server"""
+
+    def __init__(self, scale: int, latency: float, page_cap: int, work_dir: Path):
+        self.scale = scale
+        self.work_dir = work_dir
+        self.server = MockJiraServer(latency=latency, page_cap=page_cap).start()
+        self.issue_keys = self.server.state.seed_issues(scale)
+        self.latency = latency
+        self.page_cap = page_cap
+
+    def measure(self, name: str, scenario: Callable[[], Optional[str]],
+                server: Optional[MockJiraServer] = None, exact_requests: bool = True) -> Dict[str, Any]:
+        """
+        Time one scenario
+
+        Args:
+            name: Scenario name
+            scenario: Function returning None on success or an error message
+            server: Server the scenario talks to (defaults to the seeded one)
+            exact_requests: Whether the request count is deterministic
+
+        Returns:
+            Result dictionary
+        """
+        server = server or self.server
+        server.state.reset_counters()
+        error = None
+        started = time.perf_counter()
+        try:
+            with redirect_stdout(io.StringIO()):
+                error = scenario()
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        seconds = time.perf_counter() - started
+        return {
+            "scenario": name,
+            "scale": self.scale,
+            "seconds": round(seconds, 4),
+            "requests": server.state.requests,
+            "throttled": server.state.throttled,
+            "exact_requests": exact_requests,
+            "error": error,
+        }
+
+    def run(self, scenarios: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Run the selected scenarios (all by default)"""
+        from jira_integration import JiraAPI
+
+        results = []
+        jira = JiraAPI()
+        try:
+            plan = [
+                ("search_scan", lambda: self.search_scan(jira)),
+                ("record_scan", lambda: self.record_scan(jira)),
+                ("report_client", lambda: self.report(jira, server_side=False)),
+                ("report_server", lambda: self.report(jira, server_side=True)),
+                ("commit_updater", lambda: self.commit_updater(jira)),
+            ]
+            for name, scenario in plan:
+                if not scenarios or name in scenarios:
+                    results.append(self.measure(name, scenario))
+        finally:
+            jira.close()
+            self.server.stop()
+
+        if not scenarios or {"roadmap_seed", "roadmap_resync"} & set(scenarios):
+            results += self.roadmap()
+        if not scenarios or "throttled_comments" in scenarios:
+            results.append(self.throttled_comments())
+        return results
+
+    def search_scan(self, jira) -> Optional[str]:
+        """Stream the whole project"""
+        seen = sum(1 for _ in jira.iter_project_issues())
+        if seen != self.scale:
+            return f"scanned {seen} of {self.scale} issues"
+        return None
+
+    def record_scan(self, jira) -> Optional[str]:
+        """Stream the whole project as IssueRecords"""
+        records = list(jira.iter_issue_records())
+        if len(records) != self.scale or any(record.status is None for record in records):
+            return f"decoded {len(records)} of {self.scale} issues"
+        return None
+
+    def report(self, jira, server_side: bool) -> Optional[str]:
+        """Generate a progress report"""
+        report = jira.generate_progress_report(server_side=server_side)
+        if report.get("total_issues") != self.scale:
+            return f"report counted {report.get('total_issues')} of {self.scale} issues"
+        return None
+
+    def commit_updater(self, jira) -> Optional[str]:
+        """Spool and deliver the updates for a range of commits"""
+        from jira_spool import JiraSpool, drain_spool
+        from update_jira_from_commit import iter_git_range, spool_commit_batch
+
+        count = max(50, self.scale // 10)
+        repo_dir = self.work_dir / f"repo-{self.scale}"
+        tip = create_commit_history(repo_dir, self.issue_keys, count)
+        with JiraSpool(self.work_dir / f"spool-{self.scale}.db") as spool:
+            commits = list(iter_git_range([tip], str(repo_dir)))
+            if len(commits) != count:
+                return f"read {len(commits)} of {count} commits"
+            spool_commit_batch(spool, commits, transitions=True, verbose=False)
+            stats = drain_spool(jira, spool, check_connection=False, concurrency=8)
+            if not stats or stats["failed"]:
+                return f"drain failed: {stats}"
+        return None
+
+    def roadmap(self) -> List[Dict[str, Any]]:
+        """Seed the roadmap into an empty project, then sync it again"""
+        from jira_integration import JiraAPI
+        from roadmap_sync import load_roadmap, sync_roadmap
+        with redirect_stdout(io.StringIO()):
+            from setup_jira_project import get_valid_issue_types
+
+        server = MockJiraServer(latency=self.latency, page_cap=self.page_cap).start()
+        os.environ["JIRA_URL"] = server.url
+        jira = JiraAPI()
+        items = load_roadmap()
+        results = []
+        try:
+            with redirect_stdout(io.StringIO()):
+                type_map = get_valid_issue_types(jira)
+
+            def sync(expect_created: int) -> Optional[str]:
+                result = sync_roadmap(jira, items, type_map)
+                if result["failed"] or len(result["created"]) != expect_created:
+                    return f"created {len(result['created'])}, failed {len(result['failed'])}"
+                return None
+
+            results.append(self.measure("roadmap_seed", lambda: sync(len(items)), server))
+            results.append(self.measure("roadmap_resync", lambda: sync(0), server))
+        finally:
+            jira.close()
+            server.stop()
+            os.environ["JIRA_URL"] = self.server.url
+        return results
+
+    def throttled_comments(self) -> Dict[str, Any]:
+        """Comment concurrently on a server that throttles, and lose nothing"""
+        from jira_async import AsyncJiraAPI
+
+        server = MockJiraServer(latency=self.latency, rate_limit=THROTTLED_SERVER_RATE).start()
+        keys = server.state.seed_issues(min(self.scale, THROTTLED_COMMENTS))
+        os.environ["JIRA_URL"] = server.url
+
+        async def comment_all() -> Optional[str]:
+            async with AsyncJiraAPI(concurrency=THROTTLED_CONCURRENCY) as jira:
+                results = await asyncio.gather(*(
+                    jira.add_comment(keys[index % len(keys)], f"Benchmark comment {index}")
+                    for index in range(THROTTLED_COMMENTS)
+                ))
+            lost = sum(1 for result in results if not result)
+            return f"{lost} comments lost" if lost else None
+
+        try:
+            return self.measure("throttled_comments", lambda: asyncio.run(comment_all()), server,
+                                exact_requests=False)
+        finally:
+            server.stop()
+            os.environ["JIRA_URL"] = self.server.url
+
+
+def compare(results: List[Dict[str, Any]], baseline: List[Dict[str, Any]], tolerance: float) -> List[str]:
+    """
+    Find regressions against a baseline
+
+    Args:
+        results: Results of this run
+        baseline: Results of the baseline run
+        tolerance: Allowed slowdown factor
+
+    Returns:
+        One message per regression
+    """
+    previous = {(entry["scenario"], entry["scale"]): entry for entry in baseline}
+    regressions = []
+    for entry in results:
+        label = f"{entry['scenario']} @ {entry['scale']}"
+        if entry["error"]:
+            regressions.append(f"{label}: {entry['error']}")
+            continue
+        before = previous.get((entry["scenario"], entry["scale"]))
+        if not before:
+            continue
+        if entry["exact_requests"] and entry["requests"] > before["requests"]:
+            regressions.append(f"{label}: {entry['requests']} requests (baseline {before['requests']})")
+        if (entry["seconds"] > before["seconds"] * tolerance
+                and entry["seconds"] - before["seconds"] > MIN_REGRESSION_SECONDS):
+            regressions.append(f"{label}: {entry['seconds']:.3f}s (baseline {before['seconds']:.3f}s)")
+    return regressions
+
+
+def main():
+    """Run the benchmark suite"""
+    parser = argparse.ArgumentParser(description="Offline benchmark suite for the Jira integration")
+    parser.add_argument("--scales", nargs="+", default=DEFAULT_SCALES,
+                        help="Project sizes: small, medium, large or a number of issues")
+    parser.add_argument("--scenarios", nargs="+", help="Only run these scenarios")
+    parser.add_argument("--latency", type=float, default=0.001, help="Mock server latency per request (seconds)")
+    parser.add_argument("--page-cap", type=int, default=100, help="Mock server search page cap")
+    parser.add_argument("--json", type=Path, help="Write the results to this file")
+    parser.add_argument("--save-baseline", type=Path, help="Write the results as the new baseline")
+    parser.add_argument("--baseline", type=Path, help="Compare against this baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help=f"Allowed slowdown factor against the baseline (default: {DEFAULT_TOLERANCE})")
+    args = parser.parse_args()
+
+    if not shutil.which("git"):
+        print("git is required for the commit_updater scenario")
+        sys.exit(1)
+
+    scales = [SCALES[scale] if scale in SCALES else int(scale) for scale in args.scales]
+    work_dir = Path(tempfile.mkdtemp(prefix="jira-benchmark-"))
+    results = []
+    try:
+        configure_environment("http://127.0.0.1:0", work_dir / "cache")
+        print(f"{'Scenario':<20}{'issues':>8}{'seconds':>10}{'requests':>10}{'429s':>7}  status")
+        for scale in scales:
+            run = BenchmarkRun(scale, args.latency, args.page_cap, work_dir)
+            os.environ["JIRA_URL"] = run.server.url
+            for entry in run.run(args.scenarios):
+                results.append(entry)
+                print(f"{entry['scenario']:<20}{entry['scale']:>8}{entry['seconds']:>10.3f}"
+                      f"{entry['requests']:>10}{entry['throttled']:>7}  {entry['error'] or 'ok'}")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    for path in (args.json, args.save_baseline):
+        if path:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(results, f, indent=2)
+            print(f"Results written to {path}")
+
+    regressions = [f"{entry['scenario']} @ {entry['scale']}: {entry['error']}" for entry in results if entry["error"]]
+    if args.baseline:
+        try:
+            with open(args.baseline, encoding="utf-8") as f:
+                baseline = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Could not read baseline {args.baseline}: {e}")
+            sys.exit(1)
+        regressions = compare(results, baseline, args.tolerance)
+
+    if regressions:
+        print("\nRegressions:")
+        for message in regressions:
+            print(f"- {message}")
+        sys.exit(1)
+    print("\nNo regressions" if args.baseline else "\nAll scenarios passed")
+
+
+if __name__ == "__main__":
+    main()
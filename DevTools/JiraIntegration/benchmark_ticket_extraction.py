@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+BetterWYD Ticket Extraction Benchmark
+
+Times extract_jira_info on synthetic squash-merge messages of growing size
+against the previous implementation, which re-split the whole message and
+searched for the matching line once per ticket reference.
+
+No Jira access is needed.
+
+Usage:
+    python benchmark_ticket_extraction.py --lines 100 1000 5000
+"""
+
+import os
+import re
+import sys
+import time
+import argparse
+from pathlib import Path
+from typing import Dict, List, Any
+
+# Get the script directory
+SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+
+# Add the JiraIntegration directory to the Python path
+sys.path.append(str(SCRIPT_DIR))
+
+from update_jira_from_commit import (
+    extract_jira_info, JIRA_TICKET_PATTERN, TRANSITION_PATTERN, TRANSITION_MAPPING
+)
+
+COMMANDS = ["done", "review", "start", "fix", ""]
+
+
+def legacy_extract_jira_info(commit_message: str) -> List[Dict[str, Any]]:
+    """The previous implementation: one splitlines() scan per ticket reference"""
+    results = []
+    for match in re.finditer(JIRA_TICKET_PATTERN, commit_message):
+        ticket_id = match.group(1)
+        line_with_ticket = next(
+            (line for line in commit_message.splitlines() if ticket_id in line),
+            ""
+        )
+        transition_match = re.search(TRANSITION_PATTERN, line_with_ticket)
+        transition_command = transition_match.group(1).lower() if transition_match else None
+        results.append({
+            'ticket_id': ticket_id,
+            'transition_command': transition_command,
+            'transition_name': TRANSITION_MAPPING.get(transition_command) if transition_command else None
+        })
+    return results
+
+
+def make_squash_message(lines: int, tickets: int) -> str:
+    """
+    Build a squash-merge style commit message
+
+    Args:
+        lines: Number of bullet lines
+        tickets: Number of distinct tickets referenced (tickets repeat across lines)
+
+    Returns:
+        The commit message
+    """
+    body = []
+    for i in range(lines):
+        command = COMMANDS[i % len(COMMANDS)]
+        hashtag = f" #{command}" if command else ""
+        body.append(f"* BWYD-{i % tickets + 1}{hashtag}: squashed change {i} to the item drop tables")
+    return f"Merge feature branch ({lines} commits)\n\n" + "\n".join(body) + "\n"
+
+
+def time_call(function, message: str, repeat: int) -> float:
+    """Best wall time of a call in milliseconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function(message)
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main():
+    """Run the extraction benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark ticket reference extraction")
+    parser.add_argument("--lines", type=int, nargs="+", default=[10, 100, 1000, 5000],
+                        help="Message sizes (bullet lines) to time")
+    parser.add_argument("--tickets", type=int, default=50, help="Distinct tickets per message")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is kept)")
+    args = parser.parse_args()
+
+    print(f"{'Lines':>8}{'refs':>8}{'tickets':>9}{'legacy ms':>12}{'single pass ms':>16}{'speedup':>10}")
+    for lines in args.lines:
+        message = make_squash_message(lines, args.tickets)
+        references = len(re.findall(JIRA_TICKET_PATTERN, message))
+        legacy = time_call(legacy_extract_jira_info, message, args.repeat)
+        current = time_call(extract_jira_info, message, args.repeat)
+        found = len(extract_jira_info(message))
+        print(f"{lines:>8}{references:>8}{found:>9}{legacy:>12.2f}{current:>16.2f}{legacy / current:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,569 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+BetterWYD Jira Changelog Analytics
+
+Flow metrics computed from issue changelogs: cycle time (first move into an
+in-progress status until the final move to done), lead time (creation until
+done), weekly throughput and per-epic burndown.
+
+Changelogs are pulled with search expand=changelog, with pages (and the rest
+of long changelogs) fetched concurrently, and cached in SQLite
+(.jira_cache/changelog.db). Like the issue mirror, later syncs only fetch
+issues updated since the last high-water mark and replace their events.
+
+The metrics are computed column-wise: status changes are loaded into typed
+arrays (issue row, time, status category) ordered by time, and each metric is
+a single pass over those columns, so thousands of issues take milliseconds.
+
+Usage:
+    python changelog_analytics.py sync [--full] [--workers 8]
+    python changelog_analytics.py cycle [--type Story]
+    python changelog_analytics.py throughput [--weeks 12]
+    python changelog_analytics.py burndown [BWYD-12] [--step 7]
+"""
+
+import os
+import sys
+import json
+import math
+import sqlite3
+import argparse
+import requests
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Any, Optional
+
+# Get the script directory
+SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+
+# Add the JiraIntegration directory to the Python path
+sys.path.append(str(SCRIPT_DIR))
+
+from jira_integration import JiraAPI, JiraAPIError, CACHE_DIR
+from issue_mirror import jql_since, user_time_zone, to_utc_string
+from issue_store import to_epoch
+
+# Default location of the changelog cache
+CHANGELOG_DB = CACHE_DIR / 'changelog.db'
+
+# Fields fetched with each changelog
+CHANGELOG_FIELDS = ["issuetype", "parent", "status", "created", "updated"]
+
+# Status categories as stored in the event columns
+NEW, IN_PROGRESS, DONE = 0, 1, 2
+CATEGORY_CODES = {"new": NEW, "indeterminate": IN_PROGRESS, "done": DONE}
+
+# Category of statuses that no cached issue currently holds, by name
+DONE_NAMES = {"done", "closed", "resolved", "released", "complete", "completed", "cancelled"}
+NEW_NAMES = {"to do", "todo", "open", "backlog", "new", "selected for development"}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    key TEXT PRIMARY KEY,
+    project TEXT NOT NULL,
+    issue_type TEXT,
+    parent_key TEXT,
+    status TEXT,
+    status_category TEXT,
+    created REAL,
+    updated TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_issues_project ON issues (project);
+
+CREATE TABLE IF NOT EXISTS status_changes (
+    key TEXT NOT NULL,
+    history_id TEXT NOT NULL,
+    changed_at REAL NOT NULL,
+    from_status TEXT,
+    to_status TEXT,
+    PRIMARY KEY (key, history_id)
+);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    project TEXT PRIMARY KEY,
+    high_water TEXT,
+    time_zone TEXT,
+    last_sync TEXT
+);
+"""
+
+DAY = 86400.0
+WEEK = 7 * DAY
+
+
+def status_changes(issue: Dict[str, Any]) -> List[tuple]:
+    """
+    Extract the status changes from an issue's changelog
+
+    Args:
+        issue: Issue dictionary with an expanded 'changelog'
+
+    Returns:
+        List of (history id, epoch seconds, from status, to status)
+    """
+    changes = []
+    for history in (issue.get("changelog") or {}).get("histories", []):
+        for item in history.get("items", []):
+            if item.get("field") == "status":
+                changes.append((history.get("id"), to_epoch(history.get("created")),
+                                item.get("fromString"), item.get("toString")))
+    return changes
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of sorted values (NaN if there are none)"""
+    if not sorted_values:
+        return math.nan
+    rank = max(math.ceil(fraction * len(sorted_values)) - 1, 0)
+    return sorted_values[rank]
+
+
+def describe_days(seconds: List[float]) -> Dict[str, Any]:
+    """
+    Summarize durations in days
+
+    Args:
+        seconds: Durations in seconds (NaN entries are ignored)
+
+    Returns:
+        Dictionary with 'count', 'mean', 'p50', 'p85' and 'p95' in days
+    """
+    values = sorted(value / DAY for value in seconds if not math.isnan(value))
+    return {
+        "count": len(values),
+        "mean": round(sum(values) / len(values), 2) if values else None,
+        "p50": round(percentile(values, 0.50), 2) if values else None,
+        "p85": round(percentile(values, 0.85), 2) if values else None,
+        "p95": round(percentile(values, 0.95), 2) if values else None,
+    }
+
+
+class ChangelogCache:
+    """SQLite cache of the project's status changes"""
+
+    def __init__(self, project_key: str, db_path: Path = CHANGELOG_DB):
+        """
+        Open (and create if needed) the cache database
+
+        Args:
+            project_key: Jira project key
+            db_path: Path to the SQLite database file
+        """
+        self.project_key = project_key
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        """Close the database connection"""
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def get_sync_state(self) -> Optional[sqlite3.Row]:
+        """Get the high-water mark and time zone of the last sync"""
+        return self.conn.execute(
+            "SELECT * FROM sync_state WHERE project = ?", (self.project_key,)
+        ).fetchone()
+
+    def store(self, issue: Dict[str, Any]):
+        """
+        Replace the cached state and status changes of one issue
+
+        Args:
+            issue: Issue dictionary with an expanded 'changelog'
+
+        Returns:
+            Number of status changes stored
+        """
+        fields = issue.get("fields", {})
+        status = fields.get("status") or {}
+        self.conn.execute(
+            "INSERT OR REPLACE INTO issues (key, project, issue_type, parent_key, status, status_category, "
+            "created, updated) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (issue["key"], self.project_key, (fields.get("issuetype") or {}).get("name"),
+             (fields.get("parent") or {}).get("key"), status.get("name"),
+             (status.get("statusCategory") or {}).get("key"), to_epoch(fields.get("created")),
+             fields.get("updated"))
+        )
+        self.conn.execute("DELETE FROM status_changes WHERE key = ?", (issue["key"],))
+        changes = [(issue["key"],) + change for change in status_changes(issue) if not math.isnan(change[1])]
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO status_changes (key, history_id, changed_at, from_status, to_status) "
+            "VALUES (?, ?, ?, ?, ?)",
+            changes
+        )
+        return len(changes)
+
+    def sync(self, jira: JiraAPI, full: bool = False, max_workers: int = 8,
+             page_size: int = 100) -> Dict[str, Any]:
+        """
+        Bring the cache up to date
+
+        Args:
+            jira: JiraAPI instance
+            full: Download every changelog again instead of syncing incrementally
+            max_workers: Maximum number of requests in flight
+            page_size: Issues requested per search page
+
+        Returns:
+            Dictionary with 'fetched', 'events' (status changes received),
+            'total' (issues cached), 'high_water' and 'full'
+
+        Raises:
+            JiraAPIError: If part of the data could not be fetched (nothing is stored then)
+        """
+        state = self.get_sync_state()
+        full = full or state is None or not state["high_water"]
+        time_zone = (state["time_zone"] if state else None) or user_time_zone(jira)
+
+        jql = f"project = {self.project_key}"
+        if not full:
+            jql += f' AND updated >= "{jql_since(state["high_water"], time_zone)}"'
+        jql += " ORDER BY key ASC"
+
+        high_water = state["high_water"] if state and not full else None
+        high_water_utc = to_utc_string(high_water)
+        fetched = 0
+        events = 0
+
+        with self.conn:
+            if full:
+                self.conn.execute(
+                    "DELETE FROM status_changes WHERE key IN (SELECT key FROM issues WHERE project = ?)",
+                    (self.project_key,)
+                )
+                self.conn.execute("DELETE FROM issues WHERE project = ?", (self.project_key,))
+
+            for issue in jira.iter_issue_changelogs(jql=jql, fields=CHANGELOG_FIELDS,
+                                                    page_size=page_size, max_workers=max_workers):
+                events += self.store(issue)
+                fetched += 1
+
+                updated = issue.get("fields", {}).get("updated")
+                updated_utc = to_utc_string(updated)
+                if updated_utc and (high_water_utc is None or updated_utc > high_water_utc):
+                    high_water, high_water_utc = updated, updated_utc
+
+            self.conn.execute(
+                "INSERT INTO sync_state (project, high_water, time_zone, last_sync) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(project) DO UPDATE SET high_water = excluded.high_water, "
+                "time_zone = excluded.time_zone, last_sync = excluded.last_sync",
+                (self.project_key, high_water, time_zone, datetime.now(timezone.utc).isoformat())
+            )
+
+        total = self.conn.execute(
+            "SELECT COUNT(*) FROM issues WHERE project = ?", (self.project_key,)
+        ).fetchone()[0]
+        return {"fetched": fetched, "events": events, "total": total, "high_water": high_water, "full": full}
+
+
+class FlowMetrics:
+    """Cycle time, lead time, throughput and burndown over the cached status changes"""
+
+    def __init__(self, cache: ChangelogCache):
+        """
+        Load the cached issues and status changes into columns
+
+        Args:
+            cache: Open changelog cache
+        """
+        project = (cache.project_key,)
+        issues = cache.conn.execute(
+            "SELECT key, issue_type, parent_key, status, status_category, created "
+            "FROM issues WHERE project = ? ORDER BY key", project
+        ).fetchall()
+
+        # Status category of every status name an issue currently holds
+        categories = {row["status"]: CATEGORY_CODES.get(row["status_category"]) for row in issues}
+
+        self.keys = [row["key"] for row in issues]
+        self.row_of = {key: row for row, key in enumerate(self.keys)}
+        self.issue_types = [sys.intern(row["issue_type"] or "") for row in issues]
+        self.created = array("d", (row["created"] if row["created"] is not None else math.nan for row in issues))
+        self.category = array("b", (self._category(categories, row["status"]) for row in issues))
+        self.children: Dict[str, List[int]] = {}
+        for row, issue in enumerate(issues):
+            if issue["parent_key"]:
+                self.children.setdefault(issue["parent_key"], []).append(row)
+
+        # Event columns, ordered by time
+        changes = cache.conn.execute(
+            "SELECT c.key, c.changed_at, c.to_status FROM status_changes c JOIN issues i ON i.key = c.key "
+            "WHERE i.project = ? ORDER BY c.changed_at", project
+        ).fetchall()
+        row_of = self.row_of
+        self.event_row = array("I", (row_of[change[0]] for change in changes))
+        self.event_time = array("d", (change[1] for change in changes))
+        self.event_category = array("b", (self._category(categories, change[2]) for change in changes))
+
+        self.started, self.finished = self._milestones()
+
+    @staticmethod
+    def _category(categories: Dict[str, Optional[int]], status: Optional[str]) -> int:
+        """Category code of a status name"""
+        category = categories.get(status)
+        if category is not None:
+            return category
+        name = (status or "").lower()
+        return DONE if name in DONE_NAMES else NEW if name in NEW_NAMES else IN_PROGRESS
+
+    def _milestones(self) -> tuple:
+        """
+        First start and final completion time per issue
+
+        Returns:
+            (started, finished) arrays of epoch seconds, NaN where the issue never
+            started or is not done now
+        """
+        count = len(self.keys)
+        started = array("d", [math.nan]) * count
+        finished = array("d", [math.nan]) * count
+        # Events are in time order: the first in-progress entry wins, the last done entry wins
+        for row, moment, category in zip(self.event_row, self.event_time, self.event_category):
+            if category == IN_PROGRESS:
+                if math.isnan(started[row]):
+                    started[row] = moment
+            elif category == DONE:
+                finished[row] = moment
+        # Reopened issues are not done
+        finished = array("d", (moment if category == DONE else math.nan
+                               for moment, category in zip(finished, self.category)))
+        return started, finished
+
+    def cycle_times(self) -> array:
+        """Seconds from the first in-progress status to done, per issue (NaN if not applicable)"""
+        return array("d", (end - start for start, end in zip(self.started, self.finished)))
+
+    def lead_times(self) -> array:
+        """Seconds from creation to done, per issue (NaN if not done)"""
+        return array("d", (end - start for start, end in zip(self.created, self.finished)))
+
+    def summary(self, issue_type: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Cycle and lead time statistics, overall and per issue type
+
+        Args:
+            issue_type: Only report this issue type
+
+        Returns:
+            Dictionary mapping 'all' and each issue type to issue counts and
+            cycle/lead time statistics in days
+        """
+        cycle = self.cycle_times()
+        lead = self.lead_times()
+        groups = {"all": None} if issue_type is None else {}
+        for name in sorted(set(self.issue_types)):
+            if issue_type is None or name.lower() == issue_type.lower():
+                groups[name or "(none)"] = name
+
+        result = {}
+        for label, name in groups.items():
+            rows = [row for row, value in enumerate(self.issue_types) if name is None or value == name]
+            result[label] = {
+                "issues": len(rows),
+                "done": sum(1 for row in rows if self.category[row] == DONE),
+                "cycle_days": describe_days([cycle[row] for row in rows]),
+                "lead_days": describe_days([lead[row] for row in rows]),
+            }
+        return result
+
+    def weekly_throughput(self, weeks: int = 12, now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Issues finished per week (weeks start on Monday, UTC)
+
+        Args:
+            weeks: Number of weeks, ending with the current one
+            now: Current time in epoch seconds
+
+        Returns:
+            List of {'week': 'YYYY-MM-DD', 'done': count}, oldest first
+        """
+        now = datetime.now(timezone.utc) if now is None else datetime.fromtimestamp(now, timezone.utc)
+        week_start = (now - timedelta(days=now.weekday())).replace(hour=0, minute=0, second=0, microsecond=0)
+        origin = week_start.timestamp()
+        # Week offset of every completion relative to the current week (0 = this week)
+        counts = Counter(math.floor((moment - origin) / WEEK) for moment in self.finished if not math.isnan(moment))
+        return [
+            {"week": (week_start + timedelta(weeks=offset)).strftime("%Y-%m-%d"), "done": counts.get(offset, 0)}
+            for offset in range(1 - weeks, 1)
+        ]
+
+    def epics(self) -> List[Dict[str, Any]]:
+        """
+        Progress of every issue with children
+
+        Returns:
+            List of {'key', 'children', 'done', 'remaining'}, most remaining first
+        """
+        result = []
+        for key, rows in self.children.items():
+            done = sum(1 for row in rows if self.category[row] == DONE)
+            result.append({"key": key, "children": len(rows), "done": done, "remaining": len(rows) - done})
+        result.sort(key=lambda epic: (-epic["remaining"], epic["key"]))
+        return result
+
+    def burndown(self, epic_key: str, step_days: float = 1.0, now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Scope and remaining work of an epic over time
+
+        Scope counts children created by each point in time, done counts
+        children whose final move to done happened by then (so a reopened
+        issue counts as remaining throughout).
+
+        Args:
+            epic_key: Key of the parent issue
+            step_days: Days between points
+            now: Current time in epoch seconds
+
+        Returns:
+            List of {'date', 'scope', 'done', 'remaining'}, oldest first
+            (empty if the issue has no cached children)
+        """
+        rows = self.children.get(epic_key, [])
+        created = sorted(self.created[row] for row in rows if not math.isnan(self.created[row]))
+        if not created:
+            return []
+        finished = sorted(self.finished[row] for row in rows if not math.isnan(self.finished[row]))
+        now = datetime.now(timezone.utc).timestamp() if now is None else now
+        start = math.floor(created[0] / DAY) * DAY
+        step = step_days * DAY
+
+        points = []
+        moment = start
+        while True:
+            moment = min(moment, now)
+            scope = bisect_right(created, moment)
+            done = bisect_right(finished, moment)
+            points.append({
+                "date": datetime.fromtimestamp(moment, timezone.utc).strftime("%Y-%m-%d"),
+                "scope": scope,
+                "done": done,
+                "remaining": scope - done,
+            })
+            if moment >= now:
+                return points
+            moment += step
+
+
+def print_table(rows: List[List[Any]]):
+    """Print rows as left-aligned columns"""
+    widths = [max(len(str(row[column])) for row in rows) for column in range(len(rows[0]))]
+    for row in rows:
+        print("  ".join(str(value).ljust(width) for value, width in zip(row, widths)).rstrip())
+
+
+def positive_number(kind: type) -> Callable[[str], Any]:
+    """Build an argparse type accepting only numbers above zero"""
+    def parse(value: str):
+        try:
+            number = kind(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid number: '{value}'")
+        if number <= 0:
+            raise argparse.ArgumentTypeError(f"must be greater than 0: '{value}'")
+        return number
+    return parse
+
+
+def main():
+    """Command line interface for the changelog analytics"""
+    parser = argparse.ArgumentParser(description="Cycle time, throughput and burndown from Jira changelogs")
+    parser.add_argument("--db", type=Path, default=CHANGELOG_DB, help="Changelog cache file")
+    parser.add_argument("--json", action="store_true", help="Print JSON")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    sync_parser = subparsers.add_parser("sync", help="Fetch changelogs of issues updated since the last sync")
+    sync_parser.add_argument("--full", action="store_true", help="Download every changelog again")
+    sync_parser.add_argument("--workers", type=positive_number(int), default=8,
+                             help="Maximum number of requests in flight")
+
+    cycle_parser = subparsers.add_parser("cycle", help="Cycle and lead time per issue type")
+    cycle_parser.add_argument("--type", dest="issue_type", help="Only this issue type")
+
+    throughput_parser = subparsers.add_parser("throughput", help="Issues finished per week")
+    throughput_parser.add_argument("--weeks", type=positive_number(int), default=12, help="Number of weeks")
+
+    burndown_parser = subparsers.add_parser("burndown", help="Epic burndown (lists epics without a key)")
+    burndown_parser.add_argument("epic", nargs="?", help="Epic key")
+    burndown_parser.add_argument("--step", type=positive_number(float), default=7, help="Days between points")
+
+    args = parser.parse_args()
+
+    project_key = os.getenv("JIRA_PROJECT_KEY")
+    if not project_key:
+        print("Please set JIRA_PROJECT_KEY in your .env file.")
+        sys.exit(1)
+
+    with ChangelogCache(project_key, args.db) as cache:
+        if args.command == "sync":
+            try:
+                jira = JiraAPI()
+            except ValueError as e:
+                print(f"Error initializing Jira API: {e}")
+                sys.exit(1)
+            try:
+                result = cache.sync(jira, full=args.full, max_workers=args.workers)
+            except (JiraAPIError, requests.RequestException) as e:
+                print(f"Sync failed, nothing was stored: {e}")
+                sys.exit(1)
+            mode = "Full" if result["full"] else "Incremental"
+            print(f"{mode} sync fetched {result['fetched']} changelogs ({result['events']} status changes); "
+                  f"cache holds {result['total']} issues")
+            return
+
+        metrics = FlowMetrics(cache)
+        if not metrics.keys:
+            print("The changelog cache is empty; run 'python changelog_analytics.py sync' first.")
+            sys.exit(1)
+
+        if args.command == "cycle":
+            result = metrics.summary(args.issue_type)
+            if args.json:
+                print(json.dumps(result, indent=2))
+                return
+            rows = [["type", "issues", "done", "cycle p50", "p85", "p95", "lead p50", "p85", "p95"]]
+            for label, stats in result.items():
+                cycle, lead = stats["cycle_days"], stats["lead_days"]
+                rows.append([label, stats["issues"], stats["done"], cycle["p50"], cycle["p85"], cycle["p95"],
+                             lead["p50"], lead["p85"], lead["p95"]])
+            print_table(rows)
+            print("(days)")
+        elif args.command == "throughput":
+            weeks = metrics.weekly_throughput(args.weeks)
+            if args.json:
+                print(json.dumps(weeks, indent=2))
+                return
+            most = max(week["done"] for week in weeks) or 1
+            for week in weeks:
+                print(f"{week['week']}  {week['done']:>4}  {'#' * round(week['done'] / most * 50)}")
+        elif args.command == "burndown":
+            result = metrics.burndown(args.epic, args.step) if args.epic else metrics.epics()
+            if args.json:
+                print(json.dumps(result, indent=2))
+                return
+            if not result:
+                print(f"No cached children of {args.epic}" if args.epic else
+                      "No cached issue has children, so there is no epic to burn down")
+                sys.exit(1)
+            if args.epic:
+                print_table([["date", "scope", "done", "remaining"]] +
+                            [[point["date"], point["scope"], point["done"], point["remaining"]] for point in result])
+            else:
+                print_table([["epic", "children", "done", "remaining"]] +
+                            [[epic["key"], epic["children"], epic["done"], epic["remaining"]] for epic in result])
+
+
+if __name__ == "__main__":
+    main()
@@ -45,12 +45,10 @@ def print_issue_types():
     print("Connected to Jira successfully. Fetching issue types...")
     
     # Fetch available issue types from the Jira API
-    url = f"{jira.jira_url}/rest/api/3/issuetype"
     response = None
     
     try:
-        import requests
-        response = requests.get(url, headers=jira.headers)
+        response = jira.request("GET", "/rest/api/3/issuetype")
     except Exception as e:
         print(f"Error making request: {str(e)}")
         return
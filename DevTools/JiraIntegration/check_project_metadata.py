@@ -5,11 +5,13 @@
 Jira Project Metadata Diagnostic Tool
 
 This script checks what issue types can be created in your specific Jira project.
+
+Usage:
+    python check_project_metadata.py [--refresh]
 """
 
 import os
 import sys
-import json
 from pathlib import Path
 
 # Get the script directory
@@ -20,12 +22,18 @@ sys.path.append(str(SCRIPT_DIR))
 
 try:
     from jira_integration import JiraAPI, configure_urllib3
+    from metadata_cache import make_key
 except Exception as e:
     print(f"Error importing JiraAPI: {e}")
     sys.exit(1)
 
-def check_project_metadata():
-    """Check project metadata including valid issue types for the project"""
+def check_project_metadata(refresh: bool = False):
+    """
+    Check project metadata including valid issue types for the project
+    
+    Args:
+        refresh: Ignore cached metadata and fetch it again
+    """
     print("Starting Jira project metadata diagnostic...")
     
     # Configure urllib3 to suppress LibreSSL warnings
@@ -45,35 +53,19 @@ def check_project_metadata():
     
     print("Connected to Jira successfully. Fetching project metadata...")
     
-    # Fetch issue creation metadata for this specific project
-    url = f"{jira.jira_url}/rest/api/3/issue/createmeta?projectKeys={jira.project_key}&expand=projects.issuetypes"
-    response = None
-    
-    try:
-        import requests
-        response = requests.get(url, headers=jira.headers)
-    except Exception as e:
-        print(f"Error making request: {str(e)}")
-        return
-    
-    if not response or response.status_code != 200:
-        print(f"Failed to get project metadata. Status code: {response.status_code if response else 'None'}")
-        if response:
-            print(f"Response: {response.text}")
-        return
+    # Fetch issue creation metadata for this specific project (served from the
+    # metadata cache when fresh; run with --refresh to bypass it)
+    if refresh and jira.metadata_cache is not None:
+        jira.metadata_cache.invalidate(make_key(jira.jira_url, "createmeta", jira.project_key))
     
     # Parse and print project metadata
     try:
-        metadata = response.json()
-        projects = metadata.get('projects', [])
+        issue_types = jira.get_create_meta()
         
-        if not projects:
-            print(f"No project found with key: {jira.project_key}")
+        if not issue_types:
+            print("Failed to get project metadata.")
             return
         
-        project = projects[0]
-        issue_types = project.get('issuetypes', [])
-        
         print(f"\n==== Available Issue Types for Project {jira.project_key} ====")
         print(f"Found {len(issue_types)} issue types that can be created in this project:")
         
@@ -114,4 +106,4 @@ def check_project_metadata():
         traceback.print_exc()
 
 if __name__ == "__main__":
-    check_project_metadata()
\ No newline at end of file
+    check_project_metadata(refresh="--refresh" in sys.argv[1:])
\ No newline at end of file
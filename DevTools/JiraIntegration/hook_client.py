@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+BetterWYD Jira Hook Client
+
+Tiny client used by the Git hooks to hand a commit off to the background hook
+daemon (hook_daemon.py). It only uses the standard library, so it starts in a
+few milliseconds and never touches the network: the daemon does the Jira work
+after the commit has returned.
+
+Exit status:
+    0  the daemon accepted the commit
+    1  no daemon is running (the hook then runs update_jira_from_commit.py itself)
+
+Usage:
+    python hook_client.py <commit_hash> [--repo <repository root>]
+    python hook_client.py --ping
+"""
+
+import os
+import sys
+import json
+import socket
+import argparse
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+# Get the script directory
+SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+
+# Local state directory shared with the other integration scripts
+CACHE_DIR = Path(os.getenv("JIRA_CACHE_DIR") or SCRIPT_DIR / '.jira_cache')
+
+# The daemon publishes its address (Unix socket path or localhost port) and an
+# access token here
+DAEMON_ADDRESS_FILE = CACHE_DIR / 'hook_daemon.json'
+
+# Seconds to wait for the daemon before falling back
+CONNECT_TIMEOUT = 0.5
+REPLY_TIMEOUT = 2.0
+
+
+def read_daemon_address(path: Path = DAEMON_ADDRESS_FILE) -> Optional[Dict[str, Any]]:
+    """
+    Read the address published by a running daemon
+
+    Args:
+        path: Address file written by hook_daemon.py
+
+    Returns:
+        Dictionary with 'family' ('unix' or 'tcp'), 'address', 'token' and 'pid',
+        or None if no daemon has published an address
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def send_request(request: Dict[str, Any], address_file: Path = DAEMON_ADDRESS_FILE) -> Optional[Dict[str, Any]]:
+    """
+    Send one request to the daemon and wait for its reply
+
+    Args:
+        request: Request with a 'command' ('commit', 'ping', 'metrics' or 'stop') and its arguments
+        address_file: Address file written by hook_daemon.py
+
+    Returns:
+        The daemon's reply, or None if the daemon is not reachable
+    """
+    info = read_daemon_address(address_file)
+    if not info:
+        return None
+
+    try:
+        if info["family"] == "unix":
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            address = info["address"]
+        else:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            address = tuple(info["address"])
+
+        with sock:
+            sock.settimeout(CONNECT_TIMEOUT)
+            sock.connect(address)
+            sock.settimeout(REPLY_TIMEOUT)
+            payload = dict(request, token=info.get("token"))
+            sock.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as reader:
+                reply = reader.readline()
+        return json.loads(reply) if reply else None
+    except (OSError, ValueError, KeyError, AttributeError):
+        # Stale address file, daemon gone, or AF_UNIX unavailable on this platform
+        return None
+
+
+def main():
+    """Hand a commit off to the hook daemon"""
+    parser = argparse.ArgumentParser(description="Queue a commit for the Jira hook daemon")
+    parser.add_argument("commit_hash", nargs="?", help="Commit to process")
+    parser.add_argument("--repo", default=None, help="Repository root (defaults to the current directory)")
+    parser.add_argument("--ping", action="store_true", help="Only check whether the daemon is running")
+    args = parser.parse_args()
+
+    if args.ping or not args.commit_hash:
+        reply = send_request({"command": "ping"})
+        if not reply:
+            print("Jira hook daemon is not running")
+            sys.exit(1)
+        print(f"Jira hook daemon running (pid {reply.get('pid')}, "
+              f"{reply.get('processed', 0)} commits processed, {reply.get('queued', 0)} queued)")
+        sys.exit(0)
+
+    reply = send_request({
+        "command": "commit",
+        "commit": args.commit_hash,
+        "repo": os.path.abspath(args.repo or os.getcwd())
+    })
+    if not reply or not reply.get("ok"):
+        sys.exit(1)
+
+    print(f"Queued Jira update for commit {args.commit_hash[:7]} (hook daemon)")
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
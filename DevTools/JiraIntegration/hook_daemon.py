@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+BetterWYD Jira Hook Daemon
+
+Optional long-lived background process for the Git hooks. It loads the Jira
+credentials and tests the connection once, then keeps the pooled connections
+and metadata caches warm between commits. The hooks hand it a commit hash through
+hook_client.py and return immediately; the daemon journals each commit's
+updates in the spool (jira_spool.py) and delivers them in the background, in
+the order the commits were made, retrying failed updates when they are due.
+
+The daemon listens on a Unix socket in the local state directory. On platforms
+without Unix sockets (Windows) it listens on a random localhost port instead.
+In both cases the address and a per-run access token are published in
+.jira_cache/hook_daemon.json, which only the current user can read. When no
+daemon is running, the hooks fall back to running update_jira_from_commit.py
+directly.
+
+Usage:
+    python hook_daemon.py start     # start in the background (log: .jira_cache/hook_daemon.log)
+    python hook_daemon.py status
+    python hook_daemon.py stop
+    python hook_daemon.py run       # run in the foreground
+    python hook_daemon.py metrics [--prometheus]   # request latency per endpoint
+
+Restart the daemon after changing .env.
+"""
+
+import os
+import sys
+import json
+import time
+import queue
+import signal
+import socket
+import hashlib
+import secrets
+import tempfile
+import argparse
+import threading
+import subprocess
+import socketserver
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+# Get the script directory
+SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+
+# Add the JiraIntegration directory to the Python path
+sys.path.append(str(SCRIPT_DIR))
+
+from jira_integration import JiraAPI
+from hook_client import CACHE_DIR, DAEMON_ADDRESS_FILE, send_request
+from jira_spool import JiraSpool, drain_spool
+from request_metrics import RequestMetrics, format_table, process_metrics
+from update_jira_from_commit import process_commit
+
+# Daemon output (when started in the background)
+DAEMON_LOG = CACHE_DIR / 'hook_daemon.log'
+
+# Seconds to wait for a background daemon to come up
+STARTUP_TIMEOUT = 15.0
+
+# Seconds between checks for spooled updates that are due for a retry
+RETRY_INTERVAL = 60.0
+
+# Requests are a single JSON line; anything longer is rejected
+MAX_REQUEST_BYTES = 64 * 1024
+
+# Unix socket paths are limited to ~104 bytes (macOS) / 108 bytes (Linux)
+MAX_SOCKET_PATH = 100
+
+
+def default_socket_path() -> Path:
+    """
+    Get the Unix socket path for this checkout
+
+    Returns:
+        A path inside the cache directory, or a short per-checkout path in the
+        temp directory if that would exceed the platform's socket path limit
+    """
+    path = CACHE_DIR / 'hook_daemon.sock'
+    if len(str(path)) > MAX_SOCKET_PATH:
+        digest = hashlib.sha1(str(CACHE_DIR).encode("utf-8")).hexdigest()[:12]
+        path = Path(tempfile.gettempdir()) / f"bwyd-jira-{digest}.sock"
+    return path
+
+
+def log(message: str):
+    """Print a timestamped log line"""
+    print(f"[{datetime.now():%Y-%m-%d %H:%M:%S}] {message}", flush=True)
+
+
+class HookRequestHandler(socketserver.StreamRequestHandler):
+    """Reads one JSON request line and writes one JSON reply line"""
+
+    def handle(self):
+        line = self.rfile.readline(MAX_REQUEST_BYTES)
+        try:
+            request = json.loads(line)
+        except ValueError:
+            reply = {"ok": False, "error": "Malformed request"}
+        else:
+            reply = self.server.hook_daemon.handle_request(request)
+        self.wfile.write(json.dumps(reply).encode("utf-8") + b"\n")
+
+
+class ThreadingTCPHookServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    """Localhost TCP server (used where Unix sockets are not available)"""
+    daemon_threads = True
+
+
+if hasattr(socket, "AF_UNIX"):
+    class ThreadingUnixHookServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        """Unix socket server"""
+        daemon_threads = True
+else:
+    ThreadingUnixHookServer = None
+
+
+class HookDaemon:
+    """Accepts commits from the hook client and updates Jira in the background"""
+
+    def __init__(self, jira: JiraAPI, spool: Optional[JiraSpool] = None, address_file: Path = DAEMON_ADDRESS_FILE,
+                 socket_path: Optional[Path] = None, use_unix_socket: Optional[bool] = None):
+        """
+        Bind the listening socket and start the worker thread
+
+        Args:
+            jira: Connected JiraAPI instance, reused for every commit
+            spool: Spool the commits are journaled in (defaults to the shared spool)
+            address_file: File the address and access token are published in
+            socket_path: Unix socket path (defaults to default_socket_path())
+            use_unix_socket: Force Unix socket (True) or localhost TCP (False);
+                             defaults to Unix sockets where available
+        """
+        self.jira = jira
+        self.spool = spool or JiraSpool()
+        self.address_file = Path(address_file)
+        self.token = secrets.token_hex(16)
+        self.queue = queue.Queue()
+        self.processed = 0
+        self.failed = 0
+
+        # Always collect request metrics; the daemon serves them on demand
+        self.metrics = process_metrics()
+        if self.metrics is None:
+            self.metrics = RequestMetrics()
+            jira.add_request_hook(self.metrics.record)
+
+        if use_unix_socket is None:
+            use_unix_socket = ThreadingUnixHookServer is not None
+        if use_unix_socket:
+            self.socket_path = Path(socket_path or default_socket_path())
+            self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+            if self.socket_path.exists():
+                # Left behind by a daemon that did not shut down cleanly
+                self.socket_path.unlink()
+            self.server = ThreadingUnixHookServer(str(self.socket_path), HookRequestHandler)
+            os.chmod(self.socket_path, 0o600)
+            self.address = {"family": "unix", "address": str(self.socket_path)}
+        else:
+            self.socket_path = None
+            self.server = ThreadingTCPHookServer(("127.0.0.1", 0), HookRequestHandler)
+            self.address = {"family": "tcp", "address": list(self.server.server_address[:2])}
+        self.server.hook_daemon = self
+
+        self._worker = threading.Thread(target=self._work, name="jira-hook-worker", daemon=True)
+        self._worker.start()
+        self._publish_address()
+
+    def _publish_address(self):
+        """Write the address file (readable only by the current user)"""
+        self.address_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.address_file.with_suffix(f".{os.getpid()}.tmp")
+        fd = os.open(str(tmp_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(dict(self.address, token=self.token, pid=os.getpid()), f)
+        os.replace(tmp_path, self.address_file)
+
+    def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle one client request
+
+        Args:
+            request: Request with 'token', 'command' and the command's arguments
+
+        Returns:
+            Reply for the client
+        """
+        if not secrets.compare_digest(str(request.get("token")), self.token):
+            return {"ok": False, "error": "Invalid token"}
+
+        command = request.get("command")
+        if command == "commit":
+            commit = request.get("commit")
+            if not commit:
+                return {"ok": False, "error": "Missing commit"}
+            self.queue.put((commit, request.get("repo")))
+            return {"ok": True, "queued": self.queue.qsize()}
+        if command == "ping":
+            return {"ok": True, "pid": os.getpid(), "queued": self.queue.qsize(),
+                    "processed": self.processed, "failed": self.failed}
+        if command == "metrics":
+            if request.get("format") == "prometheus":
+                return {"ok": True, "text": self.metrics.to_prometheus()}
+            return {"ok": True, "metrics": self.metrics.to_dict()}
+        if command == "stop":
+            # shutdown() blocks until serve_forever() returns, so call it off this thread
+            threading.Thread(target=self.stop).start()
+            return {"ok": True}
+        return {"ok": False, "error": f"Unknown command '{command}'"}
+
+    def _work(self):
+        """Process queued commits in order, and retry spooled updates when due"""
+        while True:
+            try:
+                item = self.queue.get(timeout=RETRY_INTERVAL)
+            except queue.Empty:
+                if self.spool.due_items():
+                    log("Retrying spooled Jira updates")
+                    try:
+                        drain_spool(self.jira, self.spool)
+                    except Exception as e:
+                        log(f"Failed to drain the spool: {e}")
+                continue
+            if item is None:
+                break
+            commit, repo = item
+            log(f"Updating Jira from commit {commit[:7]} in {repo}")
+            try:
+                process_commit(self.jira, self.spool, commit, repo)
+                self.processed += 1
+            except (Exception, SystemExit) as e:
+                # get_git_commit_info exits on git errors; keep the daemon alive
+                self.failed += 1
+                log(f"Failed to process commit {commit[:7]}: {e}")
+
+    def serve_forever(self):
+        """Accept requests until stop() is called"""
+        log(f"Jira hook daemon listening on {self.address['address']} (pid {os.getpid()})")
+        self.server.serve_forever()
+
+    def stop(self):
+        """Stop accepting requests, finish queued commits and clean up"""
+        self.server.shutdown()
+        self.server.server_close()
+        self.queue.put(None)
+        self._worker.join()
+        if self.socket_path and self.socket_path.exists():
+            self.socket_path.unlink()
+        info = None
+        try:
+            with open(self.address_file, encoding="utf-8") as f:
+                info = json.load(f)
+        except (OSError, ValueError):
+            pass
+        # Only remove the address file if it is still ours
+        if info and info.get("pid") == os.getpid():
+            self.address_file.unlink()
+        self.spool.close()
+        self.jira.close()
+        log("Jira hook daemon stopped")
+
+
+def run_daemon():
+    """Run the daemon in the foreground"""
+    if send_request({"command": "ping"}):
+        print("Jira hook daemon is already running")
+        sys.exit(0)
+
+    try:
+        jira = JiraAPI()
+    except ValueError as e:
+        print(f"Error initializing Jira API: {e}")
+        sys.exit(1)
+
+    if not jira.test_connection():
+        print("Failed to connect to Jira. Please check your credentials.")
+        sys.exit(1)
+
+    daemon = HookDaemon(jira)
+    signal.signal(signal.SIGTERM, lambda signum, frame: threading.Thread(target=daemon.stop).start())
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        daemon.stop()
+
+
+def start_daemon() -> bool:
+    """
+    Start the daemon as a detached background process
+
+    Returns:
+        True if the daemon is running
+    """
+    if send_request({"command": "ping"}):
+        print("Jira hook daemon is already running")
+        return True
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    options = {}
+    if os.name == "nt":
+        options["creationflags"] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        options["start_new_session"] = True
+
+    with open(DAEMON_LOG, "a", encoding="utf-8") as log_file:
+        process = subprocess.Popen(
+            [sys.executable, "-u", str(Path(__file__).resolve()), "run"],
+            stdin=subprocess.DEVNULL,
+            stdout=log_file,
+            stderr=subprocess.STDOUT,
+            cwd=str(SCRIPT_DIR),
+            **options
+        )
+
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        reply = send_request({"command": "ping"})
+        if reply:
+            print(f"Jira hook daemon started (pid {reply['pid']}, log: {DAEMON_LOG})")
+            return True
+        if process.poll() is not None:
+            break
+        time.sleep(0.1)
+
+    print(f"Jira hook daemon failed to start, see {DAEMON_LOG}")
+    return False
+
+
+def stop_daemon() -> bool:
+    """
+    Ask a running daemon to finish its queue and exit
+
+    Returns:
+        True if a daemon was stopped
+    """
+    if not send_request({"command": "stop"}):
+        print("Jira hook daemon is not running")
+        return False
+    print("Jira hook daemon stopping (queued commits are finished first)")
+    return True
+
+
+def main():
+    """Control the hook daemon"""
+    parser = argparse.ArgumentParser(description="Background daemon for the Jira Git hooks")
+    parser.add_argument("action", choices=["start", "stop", "status", "run", "metrics"], help="What to do")
+    parser.add_argument("--prometheus", action="store_true",
+                        help="metrics: print the Prometheus text format instead of a table")
+    args = parser.parse_args()
+
+    if args.action == "run":
+        run_daemon()
+    elif args.action == "start":
+        sys.exit(0 if start_daemon() else 1)
+    elif args.action == "stop":
+        sys.exit(0 if stop_daemon() else 1)
+    elif args.action == "metrics":
+        reply = send_request({"command": "metrics", "format": "prometheus" if args.prometheus else "json"})
+        if not reply:
+            print("Jira hook daemon is not running")
+            sys.exit(1)
+        if args.prometheus:
+            print(reply["text"], end="")
+        else:
+            for line in format_table(reply["metrics"]):
+                print(line)
+    else:
+        reply = send_request({"command": "ping"})
+        if not reply:
+            print("Jira hook daemon is not running")
+            sys.exit(1)
+        print(f"Jira hook daemon running (pid {reply['pid']}): {reply['processed']} commits processed, "
+              f"{reply['failed']} failed, {reply['queued']} queued")
+
+
+if __name__ == "__main__":
+    main()
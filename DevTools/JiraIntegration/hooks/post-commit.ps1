@@ -10,6 +10,9 @@
 # Example commit messages:
 # - "BWYD-123: Add new feature"  --> Just adds a comment to BWYD-123
 # - "BWYD-123 #done: Fix bug"   --> Adds comment and transitions BWYD-123 to Done status
+#
+# If the hook daemon is running (python DevTools/JiraIntegration/hook_daemon.py start),
+# the commit is handed off to it and the hook returns immediately.
 
 # Get the repository root directory
 $repoRoot = git rev-parse --show-toplevel
@@ -26,6 +29,15 @@ if (-not (Test-Path $jiraScript)) {
 # Get the latest commit hash
 $commitHash = git rev-parse HEAD
 
+# Hand the commit off to the hook daemon, if one is running
+$hookClient = Join-Path $repoRoot "DevTools\JiraIntegration\hook_client.py"
+if (Test-Path $hookClient) {
+    python $hookClient $commitHash --repo $repoRoot
+    if ($LASTEXITCODE -eq 0) {
+        exit 0
+    }
+}
+
 # Run the script
 Write-Host "Updating Jira from commit $commitHash..."
 python $jiraScript $commitHash
@@ -10,6 +10,9 @@
 # Example commit messages:
 # - "BWYD-123: Add new feature"  --> Just adds a comment to BWYD-123
 # - "BWYD-123 #done: Fix bug"   --> Adds comment and transitions BWYD-123 to Done status
+#
+# If the hook daemon is running (python DevTools/JiraIntegration/hook_daemon.py start),
+# the commit is handed off to it and the hook returns immediately.
 
 # Get the repository root directory
 repo_root=$(git rev-parse --show-toplevel)
@@ -26,6 +29,12 @@ fi
 # Get the latest commit hash
 commit_hash=$(git rev-parse HEAD)
 
+# Hand the commit off to the hook daemon, if one is running
+hook_client="$repo_root/DevTools/JiraIntegration/hook_client.py"
+if [ -f "$hook_client" ] && python "$hook_client" "$commit_hash" --repo "$repo_root"; then
+    exit 0
+fi
+
 # Run the script
 echo "Updating Jira from commit $commit_hash..."
 python "$jira_script" "$commit_hash"
@@ -0,0 +1,26 @@
+#!/usr/bin/env pwsh
+
+# BetterWYD - Git post-rewrite hook to update Jira tickets
+#
+# This hook runs after `git commit --amend` and `git rebase` and updates the
+# Jira tickets mentioned in the rewritten commits, with one comment per ticket
+# listing all of its commits. Commits already handled by the post-commit hook
+# are not updated twice.
+
+# Get the repository root directory
+$repoRoot = git rev-parse --show-toplevel
+
+# Path to the Jira integration script
+$jiraScript = Join-Path $repoRoot "DevTools\JiraIntegration\update_jira_from_commit.py"
+
+# Check if the script exists
+if (-not (Test-Path $jiraScript)) {
+    Write-Error "Error: Jira integration script not found at $jiraScript"
+    exit 1
+}
+
+# Git passes the old and new commit hashes on stdin, which the script reads
+$input | python $jiraScript --post-rewrite
+
+# Exit with the same status as the script
+exit $LASTEXITCODE
@@ -0,0 +1,26 @@
+#!/bin/sh
+
+# BetterWYD - Git post-rewrite hook to update Jira tickets
+#
+# This hook runs after `git commit --amend` and `git rebase` and updates the
+# Jira tickets mentioned in the rewritten commits, with one comment per ticket
+# listing all of its commits. Commits already handled by the post-commit hook
+# are not updated twice.
+
+# Get the repository root directory
+repo_root=$(git rev-parse --show-toplevel)
+
+# Path to the Jira integration script
+jira_script="$repo_root/DevTools/JiraIntegration/update_jira_from_commit.py"
+
+# Check if the script exists
+if [ ! -f "$jira_script" ]; then
+    echo "Error: Jira integration script not found at $jira_script"
+    exit 1
+fi
+
+# Git passes the old and new commit hashes on stdin, which the script reads
+python "$jira_script" --post-rewrite
+
+# Exit with the same status as the script
+exit $?
@@ -0,0 +1,29 @@
+#!/usr/bin/env pwsh
+
+# BetterWYD - Git pre-push hook to update Jira tickets
+#
+# This hook runs before a push and updates the Jira tickets mentioned in every
+# commit being pushed, with one comment per ticket listing all of its commits.
+# Transition hashtags (#inprogress, #review, #done) are applied in commit order.
+#
+# Use it instead of the post-commit hook if you prefer to update Jira only when
+# your work is pushed. The updates are queued locally and delivered in the
+# background, so the push never waits for Jira and is never blocked by it.
+
+# Get the repository root directory
+$repoRoot = git rev-parse --show-toplevel
+
+# Path to the Jira integration script
+$jiraScript = Join-Path $repoRoot "DevTools\JiraIntegration\update_jira_from_commit.py"
+
+# Check if the script exists
+if (-not (Test-Path $jiraScript)) {
+    Write-Warning "Jira integration script not found at $jiraScript"
+    exit 0
+}
+
+# Git passes the pushed refs on stdin, which the script reads
+$input | python $jiraScript --pre-push $args[0]
+
+# Never block the push
+exit 0
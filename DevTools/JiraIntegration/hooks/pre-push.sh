@@ -0,0 +1,29 @@
+#!/bin/sh
+
+# BetterWYD - Git pre-push hook to update Jira tickets
+#
+# This hook runs before a push and updates the Jira tickets mentioned in every
+# commit being pushed, with one comment per ticket listing all of its commits.
+# Transition hashtags (#inprogress, #review, #done) are applied in commit order.
+#
+# Use it instead of the post-commit hook if you prefer to update Jira only when
+# your work is pushed. The updates are queued locally and delivered in the
+# background, so the push never waits for Jira and is never blocked by it.
+
+# Get the repository root directory
+repo_root=$(git rev-parse --show-toplevel)
+
+# Path to the Jira integration script
+jira_script="$repo_root/DevTools/JiraIntegration/update_jira_from_commit.py"
+
+# Check if the script exists
+if [ ! -f "$jira_script" ]; then
+    echo "Warning: Jira integration script not found at $jira_script"
+    exit 0
+fi
+
+# Git passes the pushed refs on stdin, which the script reads
+python "$jira_script" --pre-push "$1"
+
+# Never block the push
+exit 0
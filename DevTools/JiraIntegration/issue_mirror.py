@@ -0,0 +1,445 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+BetterWYD Jira Issue Mirror
+
+Keeps a local SQLite copy of the project's issues so reports and listings run
+at local-disk speed instead of downloading the whole project every time.
+
+A sync only fetches issues changed since the last high-water mark (JQL
+`updated >= X`), and upserts them by key. Issues are indexed by key, status,
+issue type, assignee, parent and updated time.
+
+Usage:
+    python issue_mirror.py sync [--full]
+    python issue_mirror.py list [--status "In Progress"] [--type Story] [--assignee "Jane Doe"] [--limit 20]
+    python issue_mirror.py report
+
+Note: an incremental sync cannot see deleted issues; run `sync --full`
+occasionally to rebuild the mirror from scratch.
+"""
+
+import os
+import sys
+import json
+import sqlite3
+import argparse
+import requests
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Any, Iterator, Optional
+
+# Get the script directory
+SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+
+# Add the JiraIntegration directory to the Python path
+sys.path.append(str(SCRIPT_DIR))
+
+from jira_integration import JiraAPI, JiraAPIError, CACHE_DIR, build_progress_report
+from issue_records import parse_jira_timestamp
+
+# Default location of the mirror database
+MIRROR_DB = CACHE_DIR / 'issues.db'
+
+# Fields stored in the mirror (descriptions are not needed for reports)
+MIRROR_FIELDS = ["summary", "status", "issuetype", "assignee", "priority", "parent", "labels", "created", "updated"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    key TEXT PRIMARY KEY,
+    id TEXT,
+    project TEXT NOT NULL,
+    summary TEXT,
+    status TEXT,
+    status_category TEXT,
+    issue_type TEXT,
+    assignee TEXT,
+    assignee_id TEXT,
+    priority TEXT,
+    parent_key TEXT,
+    labels TEXT,
+    created TEXT,
+    updated TEXT,
+    updated_utc TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_issues_status ON issues (project, status);
+CREATE INDEX IF NOT EXISTS idx_issues_type ON issues (project, issue_type);
+CREATE INDEX IF NOT EXISTS idx_issues_assignee ON issues (project, assignee);
+CREATE INDEX IF NOT EXISTS idx_issues_parent ON issues (parent_key);
+CREATE INDEX IF NOT EXISTS idx_issues_updated ON issues (project, updated_utc);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    project TEXT PRIMARY KEY,
+    high_water TEXT,
+    time_zone TEXT,
+    last_sync TEXT
+);
+"""
+
+
+def to_utc_string(value: Optional[str]) -> Optional[str]:
+    """Normalize a Jira timestamp to a sortable UTC string"""
+    parsed = parse_jira_timestamp(value)
+    if parsed is None:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def jql_since(high_water: str, time_zone: Optional[str]) -> str:
+    """
+    Convert a high-water mark into a JQL date in the user's time zone
+
+    JQL dates have minute precision and are interpreted in the Jira user's
+    time zone, so the mark is converted and rounded down to the minute.
+    Issues updated in that minute are fetched again and simply re-upserted.
+    """
+    since = parse_jira_timestamp(high_water) or datetime.now(timezone.utc)
+    try:
+        from zoneinfo import ZoneInfo
+        since = since.astimezone(ZoneInfo(time_zone or "UTC"))
+    except Exception:
+        # Unknown zone (or no tz database): widen the window to cover any offset
+        since = since.astimezone(timezone.utc) - timedelta(hours=14)
+    return since.strftime("%Y-%m-%d %H:%M")
+
+
+def user_time_zone(jira: JiraAPI) -> Optional[str]:
+    """Look up the Jira user's time zone (used to interpret JQL dates)"""
+    try:
+        response = jira.request("GET", "/rest/api/3/myself")
+        if response.status_code == 200:
+            return response.json().get("timeZone")
+    except Exception as e:
+        print(f"Could not read Jira user time zone: {str(e)}")
+    return None
+
+
+def flatten_issue(issue: Dict[str, Any], project_key: str) -> Dict[str, Any]:
+    """
+    Flatten a search result into a mirror row
+
+    Args:
+        issue: Issue dictionary from the Jira search API
+        project_key: Project the issue belongs to
+
+    Returns:
+        Dictionary with one entry per mirror column
+    """
+    fields = issue.get("fields", {})
+    status = fields.get("status") or {}
+    assignee = fields.get("assignee") or {}
+    return {
+        "key": issue["key"],
+        "id": issue.get("id"),
+        "project": project_key,
+        "summary": fields.get("summary"),
+        "status": status.get("name"),
+        "status_category": (status.get("statusCategory") or {}).get("key"),
+        "issue_type": (fields.get("issuetype") or {}).get("name"),
+        "assignee": assignee.get("displayName"),
+        "assignee_id": assignee.get("accountId"),
+        "priority": (fields.get("priority") or {}).get("name"),
+        "parent_key": (fields.get("parent") or {}).get("key"),
+        "labels": json.dumps(fields.get("labels") or []),
+        "created": fields.get("created"),
+        "updated": fields.get("updated"),
+        "updated_utc": to_utc_string(fields.get("updated")),
+    }
+
+
+class IssueMirror:
+    """Local SQLite mirror of a Jira project's issues"""
+
+    def __init__(self, project_key: str, db_path: Path = MIRROR_DB):
+        """
+        Open (and create if needed) the mirror database
+
+        Args:
+            project_key: Jira project key
+            db_path: Path to the SQLite database file
+        """
+        self.project_key = project_key
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        """Close the database connection"""
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def get_sync_state(self) -> Optional[sqlite3.Row]:
+        """Get the high-water mark and time zone of the last sync"""
+        return self.conn.execute(
+            "SELECT * FROM sync_state WHERE project = ?", (self.project_key,)
+        ).fetchone()
+
+    def upsert(self, issues: List[Dict[str, Any]], deltas: Optional[Dict[str, Counter]] = None) -> int:
+        """
+        Insert or update issues in the mirror
+
+        Args:
+            issues: Issue dictionaries from the Jira search API
+            deltas: If given, the changes to the status and type counts are
+                    added to it (see count_changes)
+
+        Returns:
+            Number of issues written
+        """
+        # A key can appear twice when pages overlap; the last copy wins
+        rows = list({issue["key"]: flatten_issue(issue, self.project_key) for issue in issues}.values())
+        if not rows:
+            return 0
+        if deltas is not None:
+            self.count_changes(rows, deltas)
+        columns = list(rows[0])
+        updates = ", ".join(f"{column} = excluded.{column}" for column in columns if column != "key")
+        self.conn.executemany(
+            f"INSERT INTO issues ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)}) "
+            f"ON CONFLICT(key) DO UPDATE SET {updates}",
+            [tuple(row[column] for column in columns) for row in rows]
+        )
+        return len(rows)
+
+    def count_changes(self, rows: List[Dict[str, Any]], deltas: Dict[str, Counter]):
+        """
+        Compare flattened rows with the mirrored state before they are written
+
+        Args:
+            rows: Mirror rows about to be upserted
+            deltas: Dictionary whose 'status' and 'issue_type' counters receive
+                    the change of each count, and whose 'transitions' counter
+                    receives 'old -> new' status moves (new issues come from None)
+        """
+        previous = {}
+        keys = [row["key"] for row in rows]
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            for old in self.conn.execute(
+                f"SELECT key, status, issue_type FROM issues WHERE key IN ({', '.join('?' for _ in chunk)})", chunk
+            ):
+                previous[old["key"]] = old
+
+        for row in rows:
+            old = previous.get(row["key"])
+            old_status = old["status"] if old else None
+            if old:
+                deltas["status"][old_status] -= 1
+                deltas["issue_type"][old["issue_type"]] -= 1
+            deltas["status"][row["status"]] += 1
+            deltas["issue_type"][row["issue_type"]] += 1
+            if old is None or old_status != row["status"]:
+                deltas["transitions"][(old_status, row["status"])] += 1
+
+    def sync(self, jira: JiraAPI, full: bool = False, page_size: int = 100,
+             expected_total: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Bring the mirror up to date
+
+        Args:
+            jira: JiraAPI instance
+            full: Rebuild the mirror from scratch instead of syncing incrementally
+            page_size: Issues requested per search page
+            expected_total: Number of project issues the server reported before
+                            a full sync; fetching fewer fails the sync
+
+        Returns:
+            Dictionary with 'fetched' (issues downloaded), 'total' (issues in the
+            mirror), 'high_water', 'full' and 'deltas' (how the fetched issues
+            changed the status and type counts, see count_changes)
+
+        Raises:
+            JiraAPIError: If the search failed part way, or a full sync fetched
+                          fewer than expected_total issues; the mirror and its
+                          high-water mark are then left exactly as they were
+        """
+        state = self.get_sync_state()
+        full = full or state is None or not state["high_water"]
+        time_zone = (state["time_zone"] if state else None) or user_time_zone(jira)
+
+        jql = f"project = {self.project_key}"
+        if not full:
+            jql += f' AND updated >= "{jql_since(state["high_water"], time_zone)}"'
+        # Page in key order: an issue updated during the sync keeps its place,
+        # whereas in updated order it would move to the end and shift every
+        # later offset, so the issue at the next page boundary would be skipped
+        jql += " ORDER BY key ASC"
+
+        high_water = state["high_water"] if state and not full else None
+        high_water_utc = to_utc_string(high_water)
+        started = datetime.now(timezone.utc)
+        fetched = 0
+        batch = []
+        deltas = {"status": Counter(), "issue_type": Counter(), "transitions": Counter()}
+
+        # One transaction: if the search raises, the delete and every upsert
+        # are rolled back, and the sync state is only written after the last page
+        with self.conn:
+            if full:
+                self.conn.execute("DELETE FROM issues WHERE project = ?", (self.project_key,))
+
+            for issue in jira.iter_project_issues(jql=jql, fields=MIRROR_FIELDS, page_size=page_size):
+                batch.append(issue)
+                fetched += 1
+
+                updated = issue.get("fields", {}).get("updated")
+                updated_utc = to_utc_string(updated)
+                if updated_utc and (high_water_utc is None or updated_utc > high_water_utc):
+                    high_water, high_water_utc = updated, updated_utc
+
+                if len(batch) >= page_size:
+                    self.upsert(batch, deltas)
+                    batch = []
+
+            self.upsert(batch, deltas)
+            # An issue updated after its page was fetched must not fall below the
+            # mark, so the mark never passes the time the sync started
+            started_utc = started.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+            if high_water_utc and high_water_utc > started_utc:
+                high_water = started.strftime("%Y-%m-%dT%H:%M:%S.") + f"{started.microsecond // 1000:03d}+0000"
+            if full and expected_total is not None and fetched < expected_total:
+                raise JiraAPIError(f"Full sync fetched {fetched} of {expected_total} issues")
+            self.conn.execute(
+                "INSERT INTO sync_state (project, high_water, time_zone, last_sync) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(project) DO UPDATE SET high_water = excluded.high_water, "
+                "time_zone = excluded.time_zone, last_sync = excluded.last_sync",
+                (self.project_key, high_water, time_zone, datetime.now(timezone.utc).isoformat())
+            )
+
+        total = self.conn.execute(
+            "SELECT COUNT(*) FROM issues WHERE project = ?", (self.project_key,)
+        ).fetchone()[0]
+        return {"fetched": fetched, "total": total, "high_water": high_water, "full": full, "deltas": deltas}
+
+    def get_issue(self, key: str) -> Optional[sqlite3.Row]:
+        """
+        Look up a single mirrored issue
+
+        Args:
+            key: Issue key (e.g., 'BWYD-123')
+
+        Returns:
+            The mirror row, or None if the issue is not mirrored
+        """
+        return self.conn.execute("SELECT * FROM issues WHERE key = ?", (key,)).fetchone()
+
+    def list_issues(self, status: Optional[str] = None, issue_type: Optional[str] = None,
+                    assignee: Optional[str] = None, limit: Optional[int] = None) -> Iterator[sqlite3.Row]:
+        """
+        List mirrored issues, newest first
+
+        Args:
+            status: Only issues in this status
+            issue_type: Only issues of this type
+            assignee: Only issues assigned to this display name
+            limit: Maximum number of issues to return
+
+        Returns:
+            Iterator of rows (key, summary, status, issue_type, assignee, ...)
+        """
+        clauses = ["project = ?"]
+        params: List[Any] = [self.project_key]
+        for column, value in (("status", status), ("issue_type", issue_type), ("assignee", assignee)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+
+        query = f"SELECT * FROM issues WHERE {' AND '.join(clauses)} ORDER BY created DESC"
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+        return self.conn.execute(query, params)
+
+    def count_by(self, column: str) -> Dict[str, int]:
+        """
+        Count mirrored issues grouped by a column
+
+        Args:
+            column: One of 'status', 'issue_type', 'assignee', 'priority'
+
+        Returns:
+            Dictionary mapping column value to issue count
+        """
+        if column not in ("status", "issue_type", "assignee", "priority"):
+            raise ValueError(f"Cannot group by {column}")
+        rows = self.conn.execute(
+            f"SELECT {column}, COUNT(*) FROM issues WHERE project = ? GROUP BY {column}",
+            (self.project_key,)
+        )
+        return {value: count for value, count in rows}
+
+    def progress_report(self) -> Dict[str, Any]:
+        """
+        Generate the progress report from the mirror (no network access)
+
+        Returns:
+            Dictionary with project statistics (same format as JiraAPI.generate_progress_report)
+        """
+        status_counts = self.count_by("status")
+        issue_type_counts = self.count_by("issue_type")
+        report = build_progress_report(self.project_key, sum(status_counts.values()),
+                                       status_counts, issue_type_counts)
+        state = self.get_sync_state()
+        report["mirror_synced_at"] = state["last_sync"] if state else None
+        return report
+
+
+def main():
+    """Command line interface for the issue mirror"""
+    parser = argparse.ArgumentParser(description="Local SQLite mirror of Jira project issues")
+    parser.add_argument("--db", type=Path, default=MIRROR_DB, help="Mirror database file")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    sync_parser = subparsers.add_parser("sync", help="Fetch issues changed since the last sync")
+    sync_parser.add_argument("--full", action="store_true", help="Rebuild the mirror from scratch")
+
+    list_parser = subparsers.add_parser("list", help="List mirrored issues")
+    list_parser.add_argument("--status", help="Only issues in this status")
+    list_parser.add_argument("--type", dest="issue_type", help="Only issues of this type")
+    list_parser.add_argument("--assignee", help="Only issues assigned to this person")
+    list_parser.add_argument("--limit", type=int, default=50, help="Maximum number of issues")
+
+    subparsers.add_parser("report", help="Print the progress report from the mirror")
+
+    args = parser.parse_args()
+
+    project_key = os.getenv("JIRA_PROJECT_KEY")
+    if not project_key:
+        print("Please set JIRA_PROJECT_KEY in your .env file.")
+        sys.exit(1)
+
+    with IssueMirror(project_key, args.db) as mirror:
+        if args.command == "sync":
+            try:
+                jira = JiraAPI()
+            except ValueError as e:
+                print(f"Error initializing Jira API: {e}")
+                sys.exit(1)
+            try:
+                result = mirror.sync(jira, full=args.full)
+            except (JiraAPIError, requests.RequestException) as e:
+                print(f"Sync failed, mirror unchanged: {e}")
+                sys.exit(1)
+            mode = "Full" if result["full"] else "Incremental"
+            print(f"{mode} sync fetched {result['fetched']} issues; mirror holds {result['total']} "
+                  f"(high-water mark: {result['high_water']})")
+        elif args.command == "list":
+            for row in mirror.list_issues(args.status, args.issue_type, args.assignee, args.limit):
+                print(f"{row['key']}: {row['summary']} - {row['status']}")
+        elif args.command == "report":
+            print(json.dumps(mirror.progress_report(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
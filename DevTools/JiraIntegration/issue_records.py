@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+BetterWYD Jira Issue Records
+
+Compact, slot-based representation of search results. A raw search hit is a
+tree of nested dictionaries (status, status category, issue type, avatars,
+self links, ...); an IssueRecord keeps only the values of the requested
+fields as flat attributes. Repeated names (status, type, assignee, priority)
+are interned, so thousands of records share a handful of string objects.
+
+Used with a field projection, so only the fields a caller needs are
+transferred and decoded:
+
+    for record in jira.iter_issue_records(fields=["status", "issuetype"]):
+        counts[record.status] += 1
+"""
+
+import sys
+from datetime import datetime
+from typing import Dict, Any, Callable, Iterable, Optional
+
+# Projection used when the caller does not name any fields
+RECORD_FIELDS = ["summary", "status", "issuetype"]
+
+# Jira timestamps look like 2025-04-15T10:00:00.000+0000
+JIRA_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.%f%z"
+
+
+def parse_jira_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse a Jira timestamp into an aware datetime
+
+    Args:
+        value: Timestamp such as '2025-04-15T10:00:00.000+0000'
+
+    Returns:
+        The parsed datetime, or None if the value is empty or malformed
+    """
+    if not value:
+        return None
+    # fromisoformat is much faster and accepts Jira's format from Python 3.11 on
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        try:
+            return datetime.strptime(value, JIRA_TIMESTAMP_FORMAT)
+        except ValueError:
+            return None
+
+
+def _interned(value: Optional[str]) -> Optional[str]:
+    """Intern a frequently repeated string"""
+    return sys.intern(value) if value else value
+
+
+def _name_of(value: Optional[Dict[str, Any]], attribute: str = "name") -> Optional[str]:
+    """Interned name of a nested Jira object (status, issue type, priority, ...)"""
+    return _interned(value.get(attribute)) if value else None
+
+
+class IssueRecord:
+    """One issue with the projected fields as attributes (unrequested fields are None)"""
+
+    __slots__ = ("key", "id", "summary", "status", "status_category", "issue_type", "assignee",
+                 "priority", "parent", "labels", "created", "updated", "resolved", "description", "extra")
+
+    def __init__(self, key: str, issue_id: Optional[str] = None):
+        self.key = key
+        self.id = issue_id
+        self.summary = None
+        self.status = None
+        self.status_category = None
+        self.issue_type = None
+        self.assignee = None
+        self.priority = None
+        self.parent = None
+        self.labels = None
+        self.created = None
+        self.updated = None
+        self.resolved = None
+        self.description = None
+        # Requested fields without a dedicated attribute (e.g. custom fields)
+        self.extra = None
+
+    def __repr__(self) -> str:
+        return f"IssueRecord({self.key!r}, status={self.status!r}, issue_type={self.issue_type!r})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Attributes that are set, as a plain dictionary (e.g. for JSON output)"""
+        data = {name: getattr(self, name) for name in self.__slots__ if name != "extra"}
+        data = {name: value for name, value in data.items() if value is not None}
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+
+def _decode_status(record: IssueRecord, value: Optional[Dict[str, Any]]):
+    record.status = _name_of(value)
+    record.status_category = _name_of((value or {}).get("statusCategory"), "key")
+
+
+def _decode_description(record: IssueRecord, value: Any):
+    # Imported here: jira_integration imports this module
+    from jira_integration import adf_to_text
+    record.description = adf_to_text(value) if value else None
+
+
+# Jira field name -> function storing its value on a record
+FIELD_DECODERS: Dict[str, Callable[[IssueRecord, Any], None]] = {
+    "summary": lambda record, value: setattr(record, "summary", value),
+    "status": _decode_status,
+    "issuetype": lambda record, value: setattr(record, "issue_type", _name_of(value)),
+    "assignee": lambda record, value: setattr(record, "assignee", _name_of(value, "displayName")),
+    "priority": lambda record, value: setattr(record, "priority", _name_of(value)),
+    "parent": lambda record, value: setattr(record, "parent", value.get("key") if value else None),
+    "labels": lambda record, value: setattr(record, "labels", tuple(value) if value else ()),
+    "created": lambda record, value: setattr(record, "created", value),
+    "updated": lambda record, value: setattr(record, "updated", value),
+    "resolutiondate": lambda record, value: setattr(record, "resolved", value),
+    "description": _decode_description,
+}
+
+
+def decode_issue(issue: Dict[str, Any], fields: Iterable[str]) -> IssueRecord:
+    """
+    Decode a raw search hit into an IssueRecord
+
+    Args:
+        issue: Issue as returned by the search API
+        fields: The projected field names
+
+    Returns:
+        The record
+    """
+    record = IssueRecord(issue["key"], issue.get("id"))
+    values = issue.get("fields") or {}
+    for field in fields:
+        decoder = FIELD_DECODERS.get(field)
+        if decoder:
+            decoder(record, values.get(field))
+        else:
+            if record.extra is None:
+                record.extra = {}
+            record.extra[field] = values.get(field)
+    return record
+
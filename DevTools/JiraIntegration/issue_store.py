@@ -0,0 +1,483 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+BetterWYD Jira Issue Store
+
+Columnar in-memory store for tens of thousands of issues. Instead of one
+dictionary (or record) per issue, every field is kept in its own column:
+repeated names (status, type, assignee, priority, parent) as integer codes in
+typed arrays backed by a string pool per column, timestamps as epoch seconds
+in float arrays. Hash indexes map issue keys to rows and every coded value to
+the set of rows holding it, so filters and group-bys are set lookups instead
+of loops over every issue:
+
+    store = IssueStore.load(jira)
+    store.count_by("status")                          # {'To Do': 812, ...}
+    store.rows(status="In Progress", issue_type="Story")
+    store.pivot("issue_type", "status")
+    store.children("BWYD-12")
+
+Usage:
+    python issue_store.py --group-by status
+    python issue_store.py --group-by issue_type --pivot status --assignee "Jane Doe"
+    python issue_store.py --live --group-by assignee --status "In Progress"
+"""
+
+import os
+import sys
+import json
+import math
+import argparse
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Any, Iterable, Optional, Set, Union
+
+from issue_records import IssueRecord, parse_jira_timestamp
+
+# Fields requested when loading the store from Jira
+STORE_FIELDS = ["summary", "status", "issuetype", "assignee", "priority", "parent", "labels",
+                "created", "updated", "resolutiondate"]
+
+# Columns holding repeated names; each is coded and indexed
+CATEGORICAL_COLUMNS = ("status", "status_category", "issue_type", "assignee", "priority", "parent")
+
+# Columns holding timestamps (epoch seconds, NaN when missing)
+TIME_COLUMNS = ("created", "updated", "resolved")
+
+# Value of a filter: one value, or several (matched like JQL IN)
+FilterValue = Union[Optional[str], Iterable[Optional[str]]]
+
+
+def to_epoch(value: Union[None, str, float, datetime]) -> float:
+    """
+    Convert a timestamp to epoch seconds
+
+    Args:
+        value: Jira timestamp string, datetime (naive means UTC) or epoch seconds
+
+    Returns:
+        Seconds since the epoch, or NaN if the value is empty or malformed
+    """
+    if value is None or value == "":
+        return math.nan
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        value = parse_jira_timestamp(value)
+        if value is None:
+            return math.nan
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def from_epoch(seconds: float) -> Optional[str]:
+    """Format epoch seconds as a Jira timestamp (UTC), or None for NaN"""
+    if math.isnan(seconds):
+        return None
+    moment = datetime.fromtimestamp(seconds, timezone.utc)
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.") + f"{moment.microsecond // 1000:03d}+0000"
+
+
+class StringPool:
+    """Bidirectional mapping between strings and small integer codes (0 is None)"""
+
+    __slots__ = ("codes", "values")
+
+    def __init__(self):
+        self.codes: Dict[str, int] = {}
+        self.values: List[Optional[str]] = [None]
+
+    def __len__(self) -> int:
+        return len(self.values) - 1
+
+    def intern(self, value: Optional[str]) -> int:
+        """Code of a value, assigning a new one on first use"""
+        if value is None:
+            return 0
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(sys.intern(value))
+        return code
+
+    def code(self, value: Optional[str]) -> Optional[int]:
+        """Code of a value, or None if it has never been stored"""
+        return 0 if value is None else self.codes.get(value)
+
+    def value(self, code: int) -> Optional[str]:
+        """Value of a code"""
+        return self.values[code]
+
+
+class IssueStore:
+    """Columnar issue table with hash indexes by key and by every categorical column"""
+
+    def __init__(self):
+        self.keys: List[str] = []
+        self.ids = array("q")
+        self.summaries: List[Optional[str]] = []
+        self.labels: List[tuple] = []
+        self.pools: Dict[str, StringPool] = {column: StringPool() for column in CATEGORICAL_COLUMNS}
+        self.columns: Dict[str, array] = {column: array("I") for column in CATEGORICAL_COLUMNS}
+        self.times: Dict[str, array] = {column: array("d") for column in TIME_COLUMNS}
+
+        # Hash indexes: issue key -> row, and per column: code -> rows
+        self.by_key: Dict[str, int] = {}
+        self.indexes: Dict[str, Dict[int, Set[int]]] = {column: {} for column in CATEGORICAL_COLUMNS}
+
+        # Rows ordered by each time column, built on first range query
+        self._time_order: Dict[str, tuple] = {}
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.by_key
+
+    @classmethod
+    def from_records(cls, records: Iterable[IssueRecord]) -> "IssueStore":
+        """
+        Build a store from issue records
+
+        Args:
+            records: IssueRecord objects (e.g. from JiraAPI.iter_issue_records)
+
+        Returns:
+            The populated store
+        """
+        store = cls()
+        store.extend(records)
+        return store
+
+    @classmethod
+    def load(cls, jira, jql: Optional[str] = None, fields: Optional[List[str]] = None) -> "IssueStore":
+        """
+        Build a store from a live search
+
+        Args:
+            jira: JiraAPI instance
+            jql: JQL query (defaults to all project issues)
+            fields: Field projection (defaults to STORE_FIELDS)
+
+        Returns:
+            The populated store
+        """
+        return cls.from_records(jira.iter_issue_records(jql=jql, fields=fields or STORE_FIELDS))
+
+    @classmethod
+    def from_mirror(cls, mirror) -> "IssueStore":
+        """
+        Build a store from the local SQLite mirror (no network access)
+
+        Args:
+            mirror: Open IssueMirror
+
+        Returns:
+            The populated store (the mirror does not keep resolution dates)
+        """
+        store = cls()
+        rows = mirror.conn.execute(
+            "SELECT key, id, summary, status, status_category, issue_type, assignee, priority, "
+            "parent_key, labels, created, updated FROM issues WHERE project = ?",
+            (mirror.project_key,)
+        )
+        for row in rows:
+            record = IssueRecord(row["key"], row["id"])
+            record.summary = row["summary"]
+            record.status = row["status"]
+            record.status_category = row["status_category"]
+            record.issue_type = row["issue_type"]
+            record.assignee = row["assignee"]
+            record.priority = row["priority"]
+            record.parent = row["parent_key"]
+            record.labels = tuple(json.loads(row["labels"] or "[]"))
+            record.created = row["created"]
+            record.updated = row["updated"]
+            store.upsert(record)
+        return store
+
+    def extend(self, records: Iterable[IssueRecord]) -> int:
+        """
+        Upsert several records
+
+        Args:
+            records: IssueRecord objects
+
+        Returns:
+            Number of records stored
+        """
+        count = 0
+        for record in records:
+            self.upsert(record)
+            count += 1
+        return count
+
+    def upsert(self, record: IssueRecord) -> int:
+        """
+        Insert a record, or replace every column of the row with the same key
+
+        Args:
+            record: The issue record; attributes that are None are stored as missing
+
+        Returns:
+            The row number
+        """
+        row = self.by_key.get(record.key)
+        if row is None:
+            row = self.by_key[record.key] = len(self.keys)
+            self.keys.append(record.key)
+            self.ids.append(0)
+            self.summaries.append(None)
+            self.labels.append(())
+            for column in CATEGORICAL_COLUMNS:
+                self.columns[column].append(0)
+                self.indexes[column].setdefault(0, set()).add(row)
+            for column in TIME_COLUMNS:
+                self.times[column].append(math.nan)
+
+        issue_id = record.id
+        self.ids[row] = int(issue_id) if issue_id and str(issue_id).isdigit() else 0
+        self.summaries[row] = record.summary
+        self.labels[row] = tuple(sys.intern(label) for label in record.labels) if record.labels else ()
+
+        for column in CATEGORICAL_COLUMNS:
+            code = self.pools[column].intern(getattr(record, column))
+            codes = self.columns[column]
+            previous = codes[row]
+            if code != previous:
+                index = self.indexes[column]
+                rows = index[previous]
+                rows.discard(row)
+                if not rows:
+                    del index[previous]
+                index.setdefault(code, set()).add(row)
+                codes[row] = code
+
+        for column in TIME_COLUMNS:
+            self.times[column][row] = to_epoch(getattr(record, column))
+        self._time_order.clear()
+        return row
+
+    def row_of(self, key: str) -> Optional[int]:
+        """Row of an issue key, or None if the issue is not stored"""
+        return self.by_key.get(key)
+
+    def get(self, row: int, column: str) -> Any:
+        """
+        Value of one cell
+
+        Args:
+            row: Row number
+            column: 'key', 'id', 'summary', 'labels', a categorical column or a time column
+
+        Returns:
+            The decoded value (timestamps as epoch seconds, NaN when missing)
+        """
+        if column in self.columns:
+            return self.pools[column].value(self.columns[column][row])
+        if column in self.times:
+            return self.times[column][row]
+        if column == "key":
+            return self.keys[row]
+        if column == "id":
+            return str(self.ids[row]) if self.ids[row] else None
+        if column == "summary":
+            return self.summaries[row]
+        if column == "labels":
+            return self.labels[row]
+        raise ValueError(f"Unknown column {column}")
+
+    def record(self, row: int) -> IssueRecord:
+        """Materialize one row as an IssueRecord"""
+        record = IssueRecord(self.keys[row], self.get(row, "id"))
+        record.summary = self.summaries[row]
+        record.labels = self.labels[row]
+        for column in CATEGORICAL_COLUMNS:
+            setattr(record, column, self.pools[column].value(self.columns[column][row]))
+        for column in TIME_COLUMNS:
+            setattr(record, column, from_epoch(self.times[column][row]))
+        return record
+
+    def matching(self, column: str, value: FilterValue) -> Set[int]:
+        """
+        Rows whose column holds a value (index lookup)
+
+        Args:
+            column: Categorical column
+            value: One value, or a list/tuple/set of values (any of them matches)
+
+        Returns:
+            Set of rows; do not modify it, it may be the index itself
+        """
+        if column not in self.indexes:
+            raise ValueError(f"Column {column} is not indexed")
+        pool = self.pools[column]
+        index = self.indexes[column]
+        if isinstance(value, (list, tuple, set, frozenset)):
+            rows: Set[int] = set()
+            for item in value:
+                code = pool.code(item)
+                if code is not None:
+                    rows |= index.get(code, set())
+            return rows
+        code = pool.code(value)
+        return index.get(code, set()) if code is not None else set()
+
+    def rows(self, **filters: FilterValue) -> List[int]:
+        """
+        Rows matching every filter, in insertion order
+
+        Args:
+            **filters: Categorical column -> value or list of values,
+                       e.g. rows(status=["To Do", "In Progress"], issue_type="Story")
+
+        Returns:
+            Sorted list of row numbers
+        """
+        if not filters:
+            return list(range(len(self.keys)))
+        candidates = sorted((self.matching(column, value) for column, value in filters.items()), key=len)
+        result = set(candidates[0])
+        for rows in candidates[1:]:
+            if not result:
+                break
+            result &= rows
+        return sorted(result)
+
+    def count_by(self, column: str, rows: Optional[Iterable[int]] = None) -> Dict[Optional[str], int]:
+        """
+        Count issues grouped by a categorical column
+
+        Args:
+            column: Categorical column
+            rows: Only count these rows (defaults to all issues, answered from the index)
+
+        Returns:
+            Dictionary mapping column value to issue count
+        """
+        if column not in self.indexes:
+            raise ValueError(f"Cannot group by {column}")
+        pool = self.pools[column]
+        if rows is None:
+            return {pool.value(code): len(members) for code, members in self.indexes[column].items()}
+        codes = self.columns[column]
+        counts = Counter(codes[row] for row in rows)
+        return {pool.value(code): count for code, count in counts.items()}
+
+    def pivot(self, row_column: str, col_column: str,
+              rows: Optional[Iterable[int]] = None) -> Dict[Optional[str], Dict[Optional[str], int]]:
+        """
+        Count issues grouped by two categorical columns
+
+        Args:
+            row_column: Outer grouping column
+            col_column: Inner grouping column
+            rows: Only count these rows (defaults to all issues)
+
+        Returns:
+            Nested dictionary {row value: {column value: count}}
+        """
+        subset = set(rows) if rows is not None else None
+        table = {}
+        for code, members in self.indexes[row_column].items():
+            if subset is not None:
+                members = members & subset
+                if not members:
+                    continue
+            table[self.pools[row_column].value(code)] = self.count_by(col_column, members)
+        return table
+
+    def children(self, key: str) -> List[str]:
+        """Keys of the issues whose parent is the given issue"""
+        return [self.keys[row] for row in self.rows(parent=key)]
+
+    def rows_between(self, column: str, start: Union[None, str, float, datetime] = None,
+                     end: Union[None, str, float, datetime] = None) -> List[int]:
+        """
+        Rows whose timestamp lies in [start, end) (binary search)
+
+        Args:
+            column: 'created', 'updated' or 'resolved'
+            start: Lower bound (inclusive), or None for no lower bound
+            end: Upper bound (exclusive), or None for no upper bound
+
+        Returns:
+            Rows ordered by the timestamp; issues without one are never included
+        """
+        if column not in self.times:
+            raise ValueError(f"Column {column} is not a time column")
+        order = self._time_order.get(column)
+        if order is None:
+            values = self.times[column]
+            rows = sorted((row for row in range(len(values)) if not math.isnan(values[row])),
+                          key=values.__getitem__)
+            order = self._time_order[column] = (rows, array("d", (values[row] for row in rows)))
+        rows, values = order
+        low = 0 if start is None else bisect_left(values, to_epoch(start))
+        high = len(values) if end is None else bisect_left(values, to_epoch(end))
+        return rows[low:high]
+
+
+def print_counts(counts: Dict[Optional[str], int]):
+    """Print grouped counts, largest first"""
+    for value, count in sorted(counts.items(), key=lambda item: -item[1]):
+        print(f"  {value or '(none)'}: {count}")
+
+
+def main():
+    """Group and filter project issues from the mirror or from Jira"""
+    parser = argparse.ArgumentParser(description="Group and filter issues in the columnar issue store")
+    parser.add_argument("--live", action="store_true", help="Load from Jira instead of the local mirror")
+    parser.add_argument("--db", type=Path, help="Mirror database file")
+    parser.add_argument("--group-by", default="status", choices=CATEGORICAL_COLUMNS, help="Grouping column")
+    parser.add_argument("--pivot", choices=CATEGORICAL_COLUMNS, help="Second grouping column")
+    parser.add_argument("--status", action="append", help="Only issues in this status (repeatable)")
+    parser.add_argument("--type", dest="issue_type", action="append", help="Only issues of this type (repeatable)")
+    parser.add_argument("--assignee", action="append", help="Only issues assigned to this person (repeatable)")
+    parser.add_argument("--parent", help="Only children of this issue")
+    args = parser.parse_args()
+
+    # Imported here so the store itself (and local_jql, which builds on it) does
+    # not depend on the Jira client, requests or the .env file
+    from jira_integration import JiraAPI
+    from issue_mirror import IssueMirror, MIRROR_DB
+
+    if args.live:
+        try:
+            jira = JiraAPI()
+        except ValueError as e:
+            print(f"Error initializing Jira API: {e}")
+            sys.exit(1)
+        store = IssueStore.load(jira)
+    else:
+        project_key = os.getenv("JIRA_PROJECT_KEY")
+        if not project_key:
+            print("Please set JIRA_PROJECT_KEY in your .env file.")
+            sys.exit(1)
+        with IssueMirror(project_key, args.db or MIRROR_DB) as mirror:
+            store = IssueStore.from_mirror(mirror)
+        if not len(store):
+            print("The mirror is empty; run 'python issue_mirror.py sync' first or pass --live.")
+            sys.exit(1)
+
+    filters = {column: value for column, value in (("status", args.status), ("issue_type", args.issue_type),
+                                                   ("assignee", args.assignee), ("parent", args.parent))
+               if value is not None}
+    rows = store.rows(**filters) if filters else None
+    print(f"{len(rows) if rows is not None else len(store)} of {len(store)} issues")
+
+    if args.pivot:
+        for value, counts in store.pivot(args.group_by, args.pivot, rows).items():
+            print(f"{value or '(none)'}:")
+            print_counts(counts)
+    else:
+        print_counts(store.count_by(args.group_by, rows))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+BetterWYD Async Jira Client
+
+Asyncio front end for JiraAPI with a configurable concurrency limit, so scripts
+can fan out hundreds of create/update/comment/transition/search operations at
+once instead of processing tickets one at a time.
+
+Calls run on a bounded worker pool that shares JiraAPI's pooled keep-alive
+session, so the number of in-flight requests (and open connections) never
+exceeds the configured limit.
+
+Usage:
+    import asyncio
+    from jira_async import AsyncJiraAPI
+
+    async def main():
+        async with AsyncJiraAPI(concurrency=16) as jira:
+            await asyncio.gather(*(jira.add_comment(key, "Deployed") for key in keys))
+
+    asyncio.run(main())
+"""
+
+import os
+import sys
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import islice
+from pathlib import Path
+from typing import Dict, List, Any, AsyncIterator, Optional, Tuple
+
+# Get the script directory
+SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+
+# Add the JiraIntegration directory to the Python path
+sys.path.append(str(SCRIPT_DIR))
+
+from issue_records import IssueRecord
+from jira_integration import JiraAPI
+
+# Default number of Jira requests allowed in flight at once
+DEFAULT_CONCURRENCY = int(os.getenv("JIRA_CONCURRENCY", 16))
+
+
+class AsyncJiraAPI:
+    """Asyncio client with the same surface as JiraAPI and bounded concurrency"""
+
+    def __init__(self, concurrency: int = DEFAULT_CONCURRENCY, jira: Optional[JiraAPI] = None, **transport_options):
+        """
+        Initialize the async client
+
+        Args:
+            concurrency: Maximum number of requests in flight at once
+            jira: Existing JiraAPI instance to wrap (a new one is created if omitted;
+                  a wrapped instance stays open when this client is closed)
+            **transport_options: Extra JiraAPI transport settings (timeouts, keep_alive, ...)
+        """
+        self.concurrency = concurrency
+        # Size the connection pool so every worker can hold its own keep-alive connection
+        self._owns_jira = jira is None
+        self.jira = jira or JiraAPI(pool_maxsize=concurrency, **transport_options)
+        self.jira.ensure_pool_size(concurrency)
+        self.project_key = self.jira.project_key
+        self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="jira")
+
+    async def _call(self, func, *args, **kwargs):
+        """Run a blocking JiraAPI call on the bounded worker pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    async def close(self):
+        """Wait for in-flight calls and release the worker pool (and connections, if owned)"""
+        await asyncio.get_running_loop().run_in_executor(None, self._executor.shutdown)
+        if self._owns_jira:
+            self.jira.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def test_connection(self) -> bool:
+        """Test the connection to the Jira API"""
+        return await self._call(self.jira.test_connection)
+
+    async def get_issue_types(self) -> List[Dict[str, Any]]:
+        """Get all available issue types in the Jira instance"""
+        return await self._call(self.jira.get_issue_types)
+
+    async def get_project_issues(self, max_results: int = 50, fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Get up to max_results issues from the project"""
+        return await self._call(self.jira.get_project_issues, max_results, fields)
+
+    async def get_issue_records(self, max_results: int = 50, fields: Optional[List[str]] = None,
+                                jql: Optional[str] = None) -> List[IssueRecord]:
+        """Get up to max_results issues as compact records (see JiraAPI.get_issue_records)"""
+        return await self._call(self.jira.get_issue_records, max_results, fields, jql)
+
+    async def iter_project_issues(self, jql: Optional[str] = None, fields: Optional[List[str]] = None,
+                                  page_size: int = 100) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Asynchronously iterate over every issue matching a query
+
+        Args:
+            jql: JQL query (defaults to all project issues, newest first)
+            fields: Issue fields to return
+            page_size: Issues requested per page
+
+        Yields:
+            Issue dictionaries
+        """
+        issues = self.jira.iter_project_issues(jql=jql, fields=fields, page_size=page_size)
+        try:
+            while True:
+                batch = await self._call(lambda: list(islice(issues, page_size)))
+                if not batch:
+                    break
+                for issue in batch:
+                    yield issue
+        finally:
+            issues.close()
+
+    async def search_issues(self, jql: str, fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Collect every issue matching a JQL query
+
+        Args:
+            jql: JQL query
+            fields: Issue fields to return
+
+        Returns:
+            List of issue dictionaries
+        """
+        return [issue async for issue in self.iter_project_issues(jql=jql, fields=fields)]
+
+    async def search_records(self, jql: str, fields: Optional[List[str]] = None) -> List[IssueRecord]:
+        """
+        Collect every issue matching a JQL query as compact records
+
+        Args:
+            jql: JQL query
+            fields: Field projection (defaults to summary, status and issue type)
+
+        Returns:
+            List of IssueRecord objects
+        """
+        records = self.jira.iter_issue_records(jql=jql, fields=fields)
+        try:
+            return await self._call(list, records)
+        finally:
+            records.close()
+
+    async def create_issue(self, summary: str, description: str, issue_type=None,
+                           parent_key: Optional[str] = None, priority: Optional[str] = None,
+                           assignee: Optional[str] = None, labels: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+        """Create a new issue in the Jira project (see JiraAPI.create_issue)"""
+        return await self._call(self.jira.create_issue, summary, description, issue_type,
+                                parent_key, priority, assignee, labels)
+
+    async def update_issue(self, issue_key: str, fields_to_update: Dict[str, Any]) -> bool:
+        """Update an existing issue (see JiraAPI.update_issue)"""
+        return await self._call(self.jira.update_issue, issue_key, fields_to_update)
+
+    async def add_comment(self, issue_key: str, comment_text: str) -> Optional[Dict[str, Any]]:
+        """Add a comment to an issue (see JiraAPI.add_comment)"""
+        return await self._call(self.jira.add_comment, issue_key, comment_text)
+
+    async def get_transitions(self, issue_key: str, issue_type: Optional[str] = None,
+                              status: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get available transitions for an issue (see JiraAPI.get_transitions)"""
+        return await self._call(self.jira.get_transitions, issue_key, issue_type, status)
+
+    async def transition_issue(self, issue_key: str, transition_id: str) -> bool:
+        """Transition an issue to a new status (see JiraAPI.transition_issue)"""
+        return await self._call(self.jira.transition_issue, issue_key, transition_id)
+
+    async def transition_issue_to(self, issue_key: str, target: str, issue_type: Optional[str] = None,
+                                  status: Optional[str] = None) -> Tuple[Optional[bool], List[Dict[str, Any]]]:
+        """Move an issue to a status, through intermediate statuses if needed (see JiraAPI.transition_issue_to)"""
+        return await self._call(self.jira.transition_issue_to, issue_key, target, issue_type, status)
+
+    async def get_issue_changelog(self, issue_key: str) -> Optional[List[Dict[str, Any]]]:
+        """Get an issue's complete changelog (see JiraAPI.get_issue_changelog)"""
+        return await self._call(self.jira.get_issue_changelog, issue_key)
+
+    async def count_issues(self, jql: str) -> Optional[int]:
+        """Count the issues matching a JQL query (see JiraAPI.count_issues)"""
+        return await self._call(self.jira.count_issues, jql)
+
+    async def generate_progress_report(self, server_side: bool = False) -> Dict[str, Any]:
+        """Generate a report on project progress (see JiraAPI.generate_progress_report)"""
+        return await self._call(self.jira.generate_progress_report, server_side, self.concurrency)
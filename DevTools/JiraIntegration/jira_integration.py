@@ -8,11 +8,14 @@ This script provides integration with Jira for the BetterWYD project using
 the Jira REST API v3 with API token authentication.
 
 Features:
-- Fetch issues from Jira project
-- Create new issues
+- Pooled, keep-alive HTTP transport shared by all API calls
+- Client-side rate limiting, Retry-After handling and retries (request_scheduler.py)
+- Request hooks for latency and payload metrics (request_metrics.py)
+- Fetch issues from Jira project (streamed page by page, optionally as compact records)
+- Create new issues (one at a time or in bulk)
 - Update existing issues
 - Add comments to issues
-- Transition issues between statuses
+- Transition issues between statuses (through intermediate statuses if needed)
 - Generate reports on project progress
 
 Usage:
@@ -23,14 +26,26 @@ Usage:
 
 import os
 import json
+import time
 import base64
 import requests
+from requests.adapters import HTTPAdapter
 import sys
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from itertools import islice
+from typing import Callable, Dict, List, Any, Iterator, Optional, Tuple
 from pathlib import Path
 from dotenv import load_dotenv
 
+from issue_records import IssueRecord, RECORD_FIELDS, decode_issue
+from metadata_cache import MetadataCache, make_key, KEY_SEPARATOR
+from request_metrics import endpoint_template, process_metrics
+from request_scheduler import RequestScheduler
+from workflow_graph import WorkflowGraph, transition_target
+
 # Get the script directory for proper file path handling
 SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
 
@@ -38,11 +53,58 @@ SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
 env_path = SCRIPT_DIR / '.env'
 load_dotenv(dotenv_path=env_path)
 
+# Directory for local state (issue mirror, caches, queues); not committed
+CACHE_DIR = Path(os.getenv("JIRA_CACHE_DIR") or SCRIPT_DIR / '.jira_cache')
+
+# Default transport settings (can be overridden via environment variables or
+# JiraAPI constructor arguments)
+DEFAULT_POOL_CONNECTIONS = 4
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_CONNECT_TIMEOUT = 5.0
+DEFAULT_READ_TIMEOUT = 30.0
+
+# Fields returned by issue searches unless the caller asks for others
+DEFAULT_SEARCH_FIELDS = ["summary", "description", "status", "assignee", "priority", "issuetype", "created", "updated"]
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    """Read a boolean flag (1/0, true/false, yes/no) from the environment"""
+    value = os.getenv(name)
+    if value is None or value.strip() == "":
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+class JiraAPIError(RuntimeError):
+    """Raised when Jira fails a request that cannot be answered partially"""
+
+
 class JiraAPI:
     """Class to handle all Jira API interactions"""
     
-    def __init__(self):
-        """Initialize the Jira API with credentials from environment variables"""
+    def __init__(self, pool_connections: Optional[int] = None, pool_maxsize: Optional[int] = None,
+                 keep_alive: Optional[bool] = None, connect_timeout: Optional[float] = None,
+                 read_timeout: Optional[float] = None, metadata_cache: Optional[MetadataCache] = None,
+                 scheduler: Optional[RequestScheduler] = None):
+        """
+        Initialize the Jira API with credentials from environment variables
+        
+        All requests go through a single pooled requests.Session, so the TCP and
+        TLS handshakes are paid once per connection instead of once per call.
+        
+        Args:
+            pool_connections: Number of host pools to cache (JIRA_POOL_CONNECTIONS)
+            pool_maxsize: Maximum connections kept open per host (JIRA_POOL_MAXSIZE)
+            keep_alive: Reuse connections between calls (JIRA_KEEP_ALIVE)
+            connect_timeout: Seconds to wait for a connection (JIRA_CONNECT_TIMEOUT)
+            read_timeout: Seconds to wait for a response (JIRA_READ_TIMEOUT)
+            metadata_cache: Cache for issue types, create metadata and transitions
+                            (defaults to the shared on-disk cache; set
+                            JIRA_METADATA_CACHE=0 to disable)
+            scheduler: Rate limiter and retry policy for all requests (defaults to
+                       one configured from JIRA_RATE_LIMIT, JIRA_RATE_BURST and
+                       JIRA_MAX_RETRIES)
+        """
         self.jira_email = os.getenv("JIRA_EMAIL")
         self.api_token = os.getenv("JIRA_API_TOKEN")
         self.jira_url = os.getenv("JIRA_URL")
@@ -62,14 +124,155 @@ class JiraAPI:
             "Content-Type": "application/json",
             "Accept": "application/json"
         }
+        
+        # Transport settings: explicit arguments win over environment variables
+        self.pool_connections = pool_connections or int(os.getenv("JIRA_POOL_CONNECTIONS", DEFAULT_POOL_CONNECTIONS))
+        self.pool_maxsize = pool_maxsize or int(os.getenv("JIRA_POOL_MAXSIZE", DEFAULT_POOL_MAXSIZE))
+        self.keep_alive = keep_alive if keep_alive is not None else _env_flag("JIRA_KEEP_ALIVE", True)
+        self.timeout = (
+            connect_timeout or float(os.getenv("JIRA_CONNECT_TIMEOUT", DEFAULT_CONNECT_TIMEOUT)),
+            read_timeout or float(os.getenv("JIRA_READ_TIMEOUT", DEFAULT_READ_TIMEOUT))
+        )
+        
+        self.session = self._create_session()
+        self.scheduler = scheduler or RequestScheduler()
+        
+        if metadata_cache is not None:
+            self.metadata_cache = metadata_cache
+        elif _env_flag("JIRA_METADATA_CACHE", True):
+            self.metadata_cache = MetadataCache(CACHE_DIR / 'metadata_cache.json')
+        else:
+            self.metadata_cache = None
+        
+        # Called after every request with a sample of its timing and size
+        self.request_hooks: List[Callable[[Dict[str, Any]], None]] = []
+        metrics = process_metrics()
+        if metrics is not None:
+            self.add_request_hook(metrics.record)
+    
+    def add_request_hook(self, hook: Callable[[Dict[str, Any]], None]):
+        """
+        Register a function called after every request
+        
+        The hook receives a dictionary with 'method', 'endpoint' (path template,
+        e.g. '/rest/api/3/issue/{key}'), 'path', 'status' (None if no response
+        was received), 'seconds' (wall time including throttling and retries),
+        'request_bytes' and 'response_bytes'. Exceptions raised by hooks are
+        printed and otherwise ignored.
+        
+        Args:
+            hook: Function taking the sample dictionary
+        """
+        self.request_hooks.append(hook)
+    
+    def _run_request_hooks(self, method: str, path: str, response: Optional[requests.Response], seconds: float):
+        """Report a finished request to the registered hooks"""
+        if path.startswith(self.jira_url):
+            path = path[len(self.jira_url):]
+        request_bytes = 0
+        if response is not None and response.request is not None and response.request.body:
+            request_bytes = len(response.request.body)
+        sample = {
+            "method": method.upper(),
+            "endpoint": endpoint_template(path),
+            "path": path,
+            "status": response.status_code if response is not None else None,
+            "seconds": seconds,
+            "request_bytes": request_bytes,
+            "response_bytes": len(response.content) if response is not None else 0,
+        }
+        for hook in self.request_hooks:
+            try:
+                hook(sample)
+            except Exception as e:
+                print(f"Request hook failed: {str(e)}")
+    
+    def _create_session(self) -> requests.Session:
+        """
+        Create the pooled HTTP session used for every API call
+        
+        Returns:
+            A requests.Session with a sized connection pool mounted for http and https
+        """
+        session = requests.Session()
+        session.headers.update(self.headers)
+        
+        if not self.keep_alive:
+            # Ask the server to close the socket after every response
+            session.headers["Connection"] = "close"
+        
+        self._mount_adapter(session)
+        return session
+    
+    def _mount_adapter(self, session: requests.Session):
+        """Mount a connection pool sized from the current settings for http and https"""
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+    
+    def ensure_pool_size(self, maxsize: int):
+        """
+        Grow the connection pool so that maxsize threads can each hold a connection
+        
+        The session itself is kept: a larger adapter is mounted on it, so
+        requests already in flight on other threads finish on the old pool
+        (which is released once they return it) and new requests use the new one.
+        
+        Args:
+            maxsize: Minimum number of pooled connections per host
+        """
+        if self.pool_maxsize >= maxsize:
+            return
+        self.pool_maxsize = maxsize
+        self._mount_adapter(self.session)
+    
+    def request(self, method: str, path: str, idempotent: Optional[bool] = None, **kwargs) -> requests.Response:
+        """
+        Send a request through the pooled session
+        
+        The request scheduler applies the client-side rate limit, waits out
+        HTTP 429 responses and retries idempotent requests on server errors.
+        
+        Args:
+            method: HTTP method (GET, POST, PUT, ...)
+            path: API path (e.g., '/rest/api/3/myself') or an absolute URL
+            idempotent: Whether the request is safe to repeat after a server
+                        error (defaults to True for GET, PUT and DELETE)
+            **kwargs: Extra arguments passed to requests (json, params, ...)
+            
+        Returns:
+            The requests.Response object
+        """
+        url = path if path.startswith(("http://", "https://")) else f"{self.jira_url}{path}"
+        kwargs.setdefault("timeout", self.timeout)
+        if not self.request_hooks:
+            return self.scheduler.send(lambda: self.session.request(method, url, **kwargs), method, idempotent)
+        
+        started = time.perf_counter()
+        response = None
+        try:
+            response = self.scheduler.send(lambda: self.session.request(method, url, **kwargs), method, idempotent)
+            return response
+        finally:
+            self._run_request_hooks(method, url, response, time.perf_counter() - started)
+    
+    def close(self):
+        """Close all pooled connections"""
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def test_connection(self) -> bool:
         """Test the connection to the Jira API"""
         try:
-            response = requests.get(
-                f"{self.jira_url}/rest/api/3/myself",
-                headers=self.headers
-            )
+            response = self.request("GET", "/rest/api/3/myself")
             
             if response.status_code == 200:
                 user_data = response.json()
@@ -83,46 +286,349 @@ class JiraAPI:
             print(f"Error connecting to Jira: {str(e)}")
             return False
     
-    def get_project_issues(self, max_results: int = 50) -> List[Dict[str, Any]]:
+    def _search_page(self, jql: str, fields: List[str], start_at: int, page_size: int,
+                     expand: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a single page of search results
+        
+        Args:
+            jql: JQL query
+            fields: Issue fields to return
+            start_at: Index of the first issue to return
+            page_size: Number of issues requested (the server may cap it)
+            expand: Extra data to include per issue (e.g. ["changelog"])
+            
+        Returns:
+            The decoded search response, or None on error
+        """
+        payload = {
+            "jql": jql,
+            "startAt": start_at,
+            "maxResults": page_size,
+            "fields": fields
+        }
+        if expand:
+            payload["expand"] = expand
+        
+        response = self.request("POST", "/rest/api/3/search", json=payload, idempotent=True)
+        
+        if response.status_code == 200:
+            return response.json()
+        
+        print(f"Error fetching issues: {response.status_code}")
+        print(response.text)
+        return None
+    
+    def iter_project_issues(self, jql: Optional[str] = None, fields: Optional[List[str]] = None,
+                            page_size: int = 100, prefetch: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterate over every issue matching a query, page by page
+        
+        Only the current page (and, with prefetch, the next one) is held in
+        memory, so memory use stays flat regardless of project size.
+        
+        Args:
+            jql: JQL query (defaults to all project issues, newest first)
+            fields: Issue fields to return (defaults to DEFAULT_SEARCH_FIELDS)
+            page_size: Issues requested per page; the server may return fewer
+            prefetch: Fetch the next page in the background while the caller
+                      works on the current one
+            
+        Yields:
+            Issue dictionaries
+            
+        Raises:
+            JiraAPIError: If a page could not be fetched, so a failure part way
+                          through never looks like the end of the results
+        """
+        jql = jql or f"project = {self.project_key} ORDER BY created DESC"
+        fields = fields or DEFAULT_SEARCH_FIELDS
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        
+        def fetch(start_at: int) -> Dict[str, Any]:
+            page = self._search_page(jql, fields, start_at, page_size)
+            if page is None:
+                raise JiraAPIError(f"Could not fetch the page of issues at {start_at}")
+            return page
+        
+        try:
+            page = fetch(0)
+            start_at = 0
+            
+            while page:
+                issues = page.get("issues", [])
+                total = page.get("total")
+                if not issues:
+                    if total is not None and start_at < total:
+                        raise JiraAPIError(f"Search stopped after {start_at} of {total} issues")
+                    break
+                
+                start_at += len(issues)
+                if total is not None:
+                    has_more = start_at < total
+                else:
+                    # The server caps maxResults; a full page means there may be more
+                    has_more = len(issues) >= page.get("maxResults", page_size)
+                page = None
+                
+                next_page = None
+                if has_more and executor:
+                    next_page = executor.submit(fetch, start_at)
+                
+                yield from issues
+                
+                if next_page:
+                    page = next_page.result()
+                elif has_more:
+                    page = fetch(start_at)
+        finally:
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+    
+    def get_project_issues(self, max_results: int = 50, fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """
         Get issues from the project
         
         Args:
             max_results: Maximum number of results to return
+            fields: Issue fields to return (defaults to DEFAULT_SEARCH_FIELDS)
             
         Returns:
             List of issue dictionaries
+            
+        Raises:
+            JiraAPIError: If a page could not be fetched (see iter_project_issues)
+        """
+        page_size = min(max_results, 100)
+        with closing(self.iter_project_issues(fields=fields, page_size=page_size,
+                                              prefetch=max_results > page_size)) as issues:
+            return list(islice(issues, max_results))
+    
+    def iter_issue_records(self, jql: Optional[str] = None, fields: Optional[List[str]] = None,
+                           page_size: int = 100, prefetch: bool = True) -> Iterator[IssueRecord]:
         """
+        Lazily iterate over the issues matching a query as compact records
+        
+        Only the projected fields are requested, and each hit is decoded into
+        a slot-based IssueRecord as soon as it arrives, so neither the payload
+        nor the per-issue memory grows with fields the caller does not use.
+        
+        Args:
+            jql: JQL query (defaults to all project issues, newest first)
+            fields: Field projection (defaults to summary, status and issue type)
+            page_size: Issues requested per page; the server may return fewer
+            prefetch: Fetch the next page in the background
+            
+        Yields:
+            IssueRecord objects
+        """
+        fields = list(fields or RECORD_FIELDS)
+        issues = self.iter_project_issues(jql=jql, fields=fields, page_size=page_size, prefetch=prefetch)
         try:
-            url = f"{self.jira_url}/rest/api/3/search"
-            jql_query = f"project = {self.project_key} ORDER BY created DESC"
+            for issue in issues:
+                yield decode_issue(issue, fields)
+        finally:
+            issues.close()
+    
+    def get_issue_records(self, max_results: int = 50, fields: Optional[List[str]] = None,
+                          jql: Optional[str] = None) -> List[IssueRecord]:
+        """
+        Get up to max_results issues as compact records
+        
+        Args:
+            max_results: Maximum number of results to return
+            fields: Field projection (defaults to summary, status and issue type)
+            jql: JQL query (defaults to all project issues, newest first)
             
-            payload = {
-                "jql": jql_query,
-                "maxResults": max_results,
-                "fields": ["summary", "description", "status", "assignee", "priority", "issuetype", "created", "updated"]
-            }
+        Returns:
+            List of IssueRecord objects
             
-            response = requests.post(
-                url,
-                headers=self.headers,
-                json=payload
-            )
+        Raises:
+            JiraAPIError: If a page could not be fetched (see iter_project_issues)
+        """
+        page_size = min(max_results, 100)
+        with closing(self.iter_issue_records(jql=jql, fields=fields, page_size=page_size,
+                                             prefetch=max_results > page_size)) as records:
+            return list(islice(records, max_results))
+    
+    def get_issue_changelog(self, issue_key: str, start_at: int = 0) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get an issue's changelog, following every page
+        
+        Args:
+            issue_key: Issue key (e.g., 'BWYD-123')
+            start_at: Index of the first history entry to return
             
-            if response.status_code == 200:
-                data = response.json()
-                return data.get("issues", [])
-            else:
-                print(f"Error fetching issues: {response.status_code}")
-                print(response.text)
-                return []
+        Returns:
+            List of history entries (oldest first), or None on error
+        """
+        histories = []
+        try:
+            while True:
+                response = self.request("GET", f"/rest/api/3/issue/{issue_key}/changelog",
+                                        params={"startAt": start_at, "maxResults": 100})
+                if response.status_code != 200:
+                    print(f"Error fetching changelog of {issue_key}: {response.status_code}")
+                    print(response.text)
+                    return None
+                page = response.json()
+                values = page.get("values", [])
+                histories.extend(values)
+                start_at += len(values)
+                if page.get("isLast", True) or not values:
+                    return histories
         except Exception as e:
-            print(f"Exception when fetching issues: {str(e)}")
-            return []
+            print(f"Exception when fetching changelog of {issue_key}: {str(e)}")
+            return None
+    
+    def iter_issue_changelogs(self, jql: Optional[str] = None, fields: Optional[List[str]] = None,
+                              page_size: int = 100, max_workers: int = 8) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the issues matching a query with their complete changelogs
+        
+        Searches with expand=changelog, fetching up to max_workers of the
+        following pages ahead, concurrently. Jira embeds only the first page of each changelog, so
+        issues with longer histories get the rest from the changelog endpoint,
+        also concurrently.
+        
+        Args:
+            jql: JQL query (defaults to all project issues)
+            fields: Issue fields to return (defaults to DEFAULT_SEARCH_FIELDS)
+            page_size: Issues requested per page
+            max_workers: Maximum number of requests in flight
+            
+        Yields:
+            Issue dictionaries whose 'changelog' holds every history entry
+            
+        Raises:
+            JiraAPIError: If a page or changelog could not be fetched
+        """
+        jql = jql or f"project = {self.project_key} ORDER BY key ASC"
+        fields = fields or DEFAULT_SEARCH_FIELDS
+        self.ensure_pool_size(max_workers)
+        
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        # Pages requested ahead of the one being yielded: (startAt, future)
+        pending = deque()
+        try:
+            first = self._search_page(jql, fields, 0, page_size, ["changelog"])
+            if first is None:
+                raise JiraAPIError("Could not fetch the page of issues at 0")
+            served = len(first.get("issues", []))
+            total = first.get("total", served)
+            starts = iter(range(served, total, served or page_size))
+            
+            def request_next_page():
+                start_at = next(starts, None)
+                if start_at is not None:
+                    pending.append((start_at, executor.submit(self._search_page, jql, fields,
+                                                              start_at, page_size, ["changelog"])))
+            
+            # Only a window of max_workers pages is in flight (and held in memory)
+            for _ in range(max_workers):
+                request_next_page()
+            
+            start_at, page = 0, first
+            while True:
+                if page is None:
+                    raise JiraAPIError(f"Could not fetch the page of issues at {start_at}")
+                issues = page.get("issues", [])
+                
+                truncated = {}
+                for issue in issues:
+                    changelog = issue.setdefault("changelog", {"histories": []})
+                    if changelog.get("total", 0) > len(changelog.get("histories", [])):
+                        truncated[issue["key"]] = executor.submit(self.get_issue_changelog, issue["key"])
+                for issue in issues:
+                    if issue["key"] in truncated:
+                        histories = truncated[issue["key"]].result()
+                        if histories is None:
+                            raise JiraAPIError(f"Could not fetch the changelog of {issue['key']}")
+                        issue["changelog"] = {"startAt": 0, "total": len(histories), "histories": histories}
+                    yield issue
+                
+                if not pending:
+                    break
+                start_at, future = pending.popleft()
+                request_next_page()
+                page = future.result()
+        finally:
+            # A caller that stops early (or fails) does not wait for queued pages
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _build_issue_fields(self, summary: str, description: str, issue_type=None,
+                            parent_key: Optional[str] = None, priority: Optional[str] = None,
+                            assignee: Optional[str] = None, labels: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Build the "fields" object of an issue creation request
+        
+        Args:
+            summary: Issue summary/title
+            description: Detailed description
+            issue_type: Type of issue (ID or dict with type info)
+            parent_key: Parent issue key (required for sub-tasks)
+            priority: Priority level (optional)
+            assignee: Account ID of assignee (optional)
+            labels: Labels to set on the issue (optional)
+            
+        Returns:
+            Dictionary of issue fields
+            
+        Raises:
+            ValueError: If a sub-task issue type is given without a parent key
+        """
+        fields = {
+            "project": {
+                "key": self.project_key
+            },
+            "summary": summary,
+            "description": text_to_adf(description)
+        }
+        
+        # Handle different formats of issue_type
+        if isinstance(issue_type, dict):
+            # If issue_type is a dict with ID and subtask info
+            issue_type_id = issue_type.get('id')
+            is_subtask = issue_type.get('subtask', False)
+            
+            if issue_type_id:
+                fields["issuetype"] = {"id": issue_type_id}
+                
+                # If this is a sub-task, parent is required
+                if is_subtask and parent_key:
+                    fields["parent"] = {"key": parent_key}
+                elif is_subtask and not parent_key:
+                    raise ValueError("Parent key is required for sub-task issue types")
+        elif issue_type:
+            # If issue_type is a string (ID or name)
+            if isinstance(issue_type, str) and issue_type.isdigit():
+                # If it's an ID, use the ID directly
+                fields["issuetype"] = {"id": issue_type}
+            else:
+                # If it's a name, use the name
+                fields["issuetype"] = {"name": issue_type}
+            
+            # If parent_key is provided, assume this is a sub-task
+            if parent_key:
+                fields["parent"] = {"key": parent_key}
+        
+        # Add priority if provided
+        if priority:
+            fields["priority"] = {"name": priority}
+        
+        # Add assignee if provided
+        if assignee:
+            fields["assignee"] = {"id": assignee}
+        
+        # Add labels if provided
+        if labels:
+            fields["labels"] = list(labels)
+        
+        return fields
     
     def create_issue(self, summary: str, description: str, issue_type=None, 
                      parent_key: Optional[str] = None, priority: Optional[str] = None, 
-                     assignee: Optional[str] = None) -> Optional[Dict[str, Any]]:
+                     assignee: Optional[str] = None, labels: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
         """
         Create a new issue in the Jira project
         
@@ -133,81 +639,18 @@ class JiraAPI:
             parent_key: Parent issue key (required for sub-tasks)
             priority: Priority level (optional)
             assignee: Account ID of assignee (optional)
+            labels: Labels to set on the issue (optional)
             
         Returns:
             Issue data if successful, None otherwise
         """
         try:
-            url = f"{self.jira_url}/rest/api/3/issue"
-            
-            # Convert description to Jira's ADFV3 format
-            description_adf = {
-                "type": "doc",
-                "version": 1,
-                "content": [
-                    {
-                        "type": "paragraph",
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": description
-                            }
-                        ]
-                    }
-                ]
-            }
-            
-            # Prepare the payload
             payload = {
-                "fields": {
-                    "project": {
-                        "key": self.project_key
-                    },
-                    "summary": summary,
-                    "description": description_adf
-                }
+                "fields": self._build_issue_fields(summary, description, issue_type,
+                                                   parent_key, priority, assignee, labels)
             }
             
-            # Handle different formats of issue_type
-            if isinstance(issue_type, dict):
-                # If issue_type is a dict with ID and subtask info
-                issue_type_id = issue_type.get('id')
-                is_subtask = issue_type.get('subtask', False)
-                
-                if issue_type_id:
-                    payload["fields"]["issuetype"] = {"id": issue_type_id}
-                    
-                    # If this is a sub-task, parent is required
-                    if is_subtask and parent_key:
-                        payload["fields"]["parent"] = {"key": parent_key}
-                    elif is_subtask and not parent_key:
-                        raise ValueError("Parent key is required for sub-task issue types")
-            elif issue_type:
-                # If issue_type is a string (ID or name)
-                if isinstance(issue_type, str) and issue_type.isdigit():
-                    # If it's an ID, use the ID directly
-                    payload["fields"]["issuetype"] = {"id": issue_type}
-                else:
-                    # If it's a name, use the name
-                    payload["fields"]["issuetype"] = {"name": issue_type}
-                
-                # If parent_key is provided, assume this is a sub-task
-                if parent_key:
-                    payload["fields"]["parent"] = {"key": parent_key}
-            
-            # Add priority if provided
-            if priority:
-                payload["fields"]["priority"] = {"name": priority}
-            
-            # Add assignee if provided
-            if assignee:
-                payload["fields"]["assignee"] = {"id": assignee}
-            
-            response = requests.post(
-                url,
-                headers=self.headers,
-                json=payload
-            )
+            response = self.request("POST", "/rest/api/3/issue", json=payload)
             
             if response.status_code in [200, 201]:
                 data = response.json()
@@ -224,6 +667,160 @@ class JiraAPI:
             print(f"Exception when creating issue: {str(e)}")
             return None
     
+    def needs_parent_key(self, item: Dict[str, Any]) -> bool:
+        """
+        Check whether creating an item requires its parent's key
+        
+        Args:
+            item: Issue spec as accepted by bulk_create_issues
+            
+        Returns:
+            True if the create request would carry a parent field
+        """
+        try:
+            fields = self._build_issue_fields(
+                item.get("summary", ""), item.get("description", ""), item.get("issue_type"),
+                parent_key="PENDING"
+            )
+        except ValueError:
+            return True
+        return "parent" in fields
+    
+    def _post_bulk_chunk(self, chunk: List[Dict[str, Any]], fields_list: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Send one /issue/bulk request and match results back to the chunk items
+        
+        Args:
+            chunk: Items being created (in request order)
+            fields_list: Issue fields for each item, same order as chunk
+            
+        Returns:
+            Dictionary with 'created' (index -> issue data) and 'failed' (index -> error)
+        """
+        payload = {"issueUpdates": [{"fields": fields} for fields in fields_list]}
+        response = self.request("POST", "/rest/api/3/issue/bulk", json=payload)
+        
+        if response.status_code not in [200, 201, 400]:
+            print(f"Error bulk creating issues: {response.status_code}")
+            print(response.text)
+            return {"created": {}, "failed": {i: f"HTTP {response.status_code}" for i in range(len(chunk))}}
+        
+        data = response.json()
+        failed = {}
+        for error in data.get("errors", []):
+            index = error.get("failedElementNumber")
+            details = error.get("elementErrors", {})
+            message = "; ".join(details.get("errorMessages", []) +
+                                [f"{field}: {msg}" for field, msg in details.get("errors", {}).items()])
+            failed[index] = message or f"HTTP {error.get('status')}"
+        
+        # Created issues are returned in request order, skipping the failed elements
+        created_issues = iter(data.get("issues", []))
+        created = {}
+        for index in range(len(chunk)):
+            if index not in failed:
+                issue = next(created_issues, None)
+                if issue is None:
+                    failed[index] = "No result returned for this item"
+                else:
+                    created[index] = issue
+        
+        return {"created": created, "failed": failed}
+    
+    def bulk_create_issues(self, items: List[Dict[str, Any]], chunk_size: int = 50) -> Dict[str, Any]:
+        """
+        Create many issues with Jira's bulk endpoint (/rest/api/3/issue/bulk)
+        
+        Items are sent in chunks of up to chunk_size (Jira's limit is 50). An item
+        can reference another item in the same call through 'parent_ref'; it is
+        held back until its parent has been created, and the parent's key is then
+        filled in, so a whole epic -> story -> sub-task tree needs one round of
+        chunks per level that actually requires a parent key.
+        
+        Args:
+            items: Issue specs with keys 'summary', 'description', and optionally
+                   'ref', 'issue_type', 'parent_ref', 'parent_key', 'priority', 'assignee', 'labels'
+            chunk_size: Maximum number of issues per bulk request
+            
+        Returns:
+            Dictionary with 'created' (ref -> issue key), 'failed' (list of
+            {'ref', 'summary', 'error'}) and 'requests' (number of bulk calls)
+        """
+        chunk_size = max(1, min(chunk_size, 50))
+        items = [dict(item, ref=item.get("ref", str(index))) for index, item in enumerate(items)]
+        known_refs = {item["ref"] for item in items}
+        
+        created = {}
+        failed = []
+        failed_refs = set()
+        requests_sent = 0
+        pending = items
+        
+        while pending:
+            ready = []
+            waiting = []
+            
+            for item in pending:
+                parent_ref = item.get("parent_ref")
+                if parent_ref and parent_ref not in known_refs:
+                    failed.append({"ref": item["ref"], "summary": item.get("summary"),
+                                   "error": f"Unknown parent_ref '{parent_ref}'"})
+                    failed_refs.add(item["ref"])
+                elif parent_ref and parent_ref in failed_refs and self.needs_parent_key(item):
+                    failed.append({"ref": item["ref"], "summary": item.get("summary"),
+                                   "error": f"Parent '{parent_ref}' was not created"})
+                    failed_refs.add(item["ref"])
+                elif not parent_ref or parent_ref in created or not self.needs_parent_key(item):
+                    ready.append(item)
+                else:
+                    waiting.append(item)
+            
+            if not ready:
+                # Whatever is left is waiting on a parent that can never be created
+                for item in waiting:
+                    failed.append({"ref": item["ref"], "summary": item.get("summary"),
+                                   "error": f"Parent '{item.get('parent_ref')}' was never created"})
+                    failed_refs.add(item["ref"])
+                break
+            
+            for start in range(0, len(ready), chunk_size):
+                chunk = []
+                fields_list = []
+                for item in ready[start:start + chunk_size]:
+                    parent_key = item.get("parent_key") or created.get(item.get("parent_ref"))
+                    try:
+                        fields_list.append(self._build_issue_fields(
+                            item.get("summary", ""), item.get("description", ""), item.get("issue_type"),
+                            parent_key, item.get("priority"), item.get("assignee"), item.get("labels")
+                        ))
+                        chunk.append(item)
+                    except ValueError as e:
+                        failed.append({"ref": item["ref"], "summary": item.get("summary"), "error": str(e)})
+                        failed_refs.add(item["ref"])
+                
+                if not chunk:
+                    continue
+                
+                try:
+                    result = self._post_bulk_chunk(chunk, fields_list)
+                except Exception as e:
+                    print(f"Exception when bulk creating issues: {str(e)}")
+                    result = {"created": {}, "failed": {i: str(e) for i in range(len(chunk))}}
+                requests_sent += 1
+                
+                for index, issue in result["created"].items():
+                    created[chunk[index]["ref"]] = issue.get("key")
+                for index, error in result["failed"].items():
+                    item = chunk[index]
+                    print(f"Failed to create '{item.get('summary')}' (item {index} of chunk): {error}")
+                    failed.append({"ref": item["ref"], "summary": item.get("summary"), "error": error})
+                    failed_refs.add(item["ref"])
+            
+            pending = waiting
+        
+        print(f"Bulk created {len(created)} issues in {requests_sent} requests ({len(failed)} failed)")
+        return {"created": created, "failed": failed, "requests": requests_sent}
+    
     def update_issue(self, issue_key: str, fields_to_update: Dict[str, Any]) -> bool:
         """
         Update an existing issue
@@ -236,19 +833,13 @@ class JiraAPI:
             True if successful, False otherwise
         """
         try:
-            url = f"{self.jira_url}/rest/api/3/issue/{issue_key}"
-            
             # Build the payload based on provided fields
             payload = {"fields": {}}
             
             for field, value in fields_to_update.items():
                 payload["fields"][field] = value
             
-            response = requests.put(
-                url,
-                headers=self.headers,
-                json=payload
-            )
+            response = self.request("PUT", f"/rest/api/3/issue/{issue_key}", json=payload)
             
             if response.status_code in [200, 204]:
                 print(f"Successfully updated issue: {issue_key}")
@@ -273,32 +864,12 @@ class JiraAPI:
             Comment data if successful, None otherwise
         """
         try:
-            url = f"{self.jira_url}/rest/api/3/issue/{issue_key}/comment"
-            
             # Convert comment to Jira's ADFV3 format
             comment_adf = {
-                "body": {
-                    "type": "doc",
-                    "version": 1,
-                    "content": [
-                        {
-                            "type": "paragraph",
-                            "content": [
-                                {
-                                    "type": "text",
-                                    "text": comment_text
-                                }
-                            ]
-                        }
-                    ]
-                }
+                "body": text_to_adf(comment_text)
             }
             
-            response = requests.post(
-                url,
-                headers=self.headers,
-                json=comment_adf
-            )
+            response = self.request("POST", f"/rest/api/3/issue/{issue_key}/comment", json=comment_adf)
             
             if response.status_code in [200, 201]:
                 data = response.json()
@@ -312,34 +883,172 @@ class JiraAPI:
             print(f"Exception when adding comment: {str(e)}")
             return None
     
-    def get_transitions(self, issue_key: str) -> List[Dict[str, Any]]:
+    def _cached(self, key_parts: tuple, fetch):
+        """Serve a metadata lookup from the cache, fetching it on a miss"""
+        if self.metadata_cache is None:
+            return fetch()
+        return self.metadata_cache.get_or_fetch(make_key(self.jira_url, *key_parts), fetch)
+    
+    def _transitions_cache_key(self, issue_type: str, status: str) -> tuple:
+        """Cache key parts for the transitions available from a workflow status"""
+        return ("transitions", self.project_key, issue_type, status)
+    
+    def get_transitions(self, issue_key: str, issue_type: Optional[str] = None,
+                        status: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Get available transitions for an issue
         
+        Transitions depend on the issue's type and current status, so they are
+        cached per (project, issue type, status). When the caller already knows
+        both (e.g., from the issue mirror) a cached answer needs no request;
+        otherwise the issue is fetched together with its transitions, which
+        also fills the cache for the next issue in the same state.
+        
         Args:
             issue_key: The key of the issue (e.g., 'BWYD-123')
+            issue_type: Name of the issue's type, if known
+            status: Name of the issue's current status, if known
             
         Returns:
             List of available transitions
         """
-        try:
-            url = f"{self.jira_url}/rest/api/3/issue/{issue_key}/transitions"
+        if issue_type and status and self.metadata_cache is not None:
+            cached = self.metadata_cache.get(make_key(self.jira_url, *self._transitions_cache_key(issue_type, status)))
+            if cached is not None:
+                return cached
+        
+        return self._discover_transitions(issue_key)[2]
+    
+    def _discover_transitions(self, issue_key: str) -> Tuple[Optional[str], Optional[str], List[Dict[str, Any]]]:
+        """
+        Fetch an issue's type, status and available transitions in one request
+        
+        The transitions are cached for the (issue type, status) pair, which
+        also adds that status to the learned workflow graph.
+        
+        Args:
+            issue_key: The key of the issue
             
-            response = requests.get(
-                url,
-                headers=self.headers
+        Returns:
+            Tuple of (issue type name, status name, transitions); the names are
+            None if the request failed
+        """
+        try:
+            response = self.request(
+                "GET",
+                f"/rest/api/3/issue/{issue_key}",
+                params={"fields": "status,issuetype", "expand": "transitions"}
             )
             
             if response.status_code == 200:
                 data = response.json()
-                return data.get("transitions", [])
+                transitions = data.get("transitions", [])
+                fields = data.get("fields", {})
+                current_type = (fields.get("issuetype") or {}).get("name")
+                current_status = (fields.get("status") or {}).get("name")
+                if self.metadata_cache is not None and transitions and current_type and current_status:
+                    self.metadata_cache.set(
+                        make_key(self.jira_url, *self._transitions_cache_key(current_type, current_status)),
+                        transitions
+                    )
+                return current_type, current_status, transitions
             else:
                 print(f"Error getting transitions: {response.status_code}")
                 print(response.text)
-                return []
+                return None, None, []
         except Exception as e:
             print(f"Exception when getting transitions: {str(e)}")
+            return None, None, []
+    
+    def get_workflow_graph(self, issue_type: str) -> WorkflowGraph:
+        """
+        Get the part of an issue type's workflow learned so far
+        
+        Every status whose transitions are in the metadata cache is a node of
+        the graph, so it grows as issues in new statuses are looked up.
+        
+        Args:
+            issue_type: Name of the issue type
+            
+        Returns:
+            WorkflowGraph (empty if the metadata cache is disabled)
+        """
+        graph = WorkflowGraph(issue_type)
+        if self.metadata_cache is None:
+            return graph
+        prefix = make_key(self.jira_url, *self._transitions_cache_key(issue_type, ""))
+        for key in self.metadata_cache.keys():
+            if key.startswith(prefix):
+                transitions = self.metadata_cache.get(key)
+                if transitions:
+                    graph.add_status(key[len(prefix):], transitions)
+        return graph
+    
+    def learned_issue_types(self) -> List[str]:
+        """Issue types with at least one learned workflow status"""
+        if self.metadata_cache is None:
             return []
+        prefix = make_key(self.jira_url, "transitions", self.project_key, "")
+        issue_types = {key[len(prefix):].split(KEY_SEPARATOR, 1)[0] for key in self.metadata_cache.keys() if key.startswith(prefix)}
+        return sorted(issue_types)
+    
+    def transition_issue_to(self, issue_key: str, target: str, issue_type: Optional[str] = None,
+                            status: Optional[str] = None) -> Tuple[Optional[bool], List[Dict[str, Any]]]:
+        """
+        Move an issue to a status, through intermediate statuses if needed
+        
+        The shortest path is searched in the learned workflow graph. When the
+        caller knows the issue's type and status (e.g., from the issue mirror)
+        and the graph already knows that status, no discovery request is made;
+        otherwise the issue's state is fetched once. After every transition the
+        new status is known from the workflow, so the following hops are read
+        from the cache as well.
+        
+        Args:
+            issue_key: The key of the issue (e.g., 'BWYD-123')
+            target: Name of the wanted status (or of the transition leading to it)
+            issue_type: Name of the issue's type, if known
+            status: Name of the issue's current status, if known
+            
+        Returns:
+            Tuple of (True if the issue reached the target, False if a request
+            failed, None if the learned workflow has no path; transitions
+            available from the status the search started at)
+        """
+        path = None
+        transitions = []
+        if issue_type and status:
+            graph = self.get_workflow_graph(issue_type)
+            if graph.knows(status):
+                transitions = graph.transitions_from(status)
+                path = graph.shortest_path(status, target)
+        
+        # A hinted status equal to the target may be stale, so only trust it live
+        if not path:
+            issue_type, status, transitions = self._discover_transitions(issue_key)
+            if not status:
+                return False, []
+            if status.casefold() == target.casefold():
+                print(f"{issue_key} is already in status '{status}'")
+                return True, transitions
+            graph = self.get_workflow_graph(issue_type) if issue_type else WorkflowGraph()
+            graph.add_status(status, transitions)
+            path = graph.shortest_path(status, target)
+            if path is None:
+                return None, transitions
+        
+        if len(path) > 1:
+            hops = " -> ".join([status] + [transition_target(t) or t["name"] for t in path])
+            print(f"Moving {issue_key} through {len(path)} transitions: {hops}")
+        for transition in path:
+            if not self.transition_issue(issue_key, transition["id"]):
+                return False, transitions
+        return True, transitions
+    
+    def invalidate_transitions(self):
+        """Forget all cached transitions of the project (e.g., after a workflow change)"""
+        if self.metadata_cache is not None:
+            self.metadata_cache.invalidate(make_key(self.jira_url, "transitions", self.project_key))
     
     def transition_issue(self, issue_key: str, transition_id: str) -> bool:
         """
@@ -353,19 +1062,13 @@ class JiraAPI:
             True if successful, False otherwise
         """
         try:
-            url = f"{self.jira_url}/rest/api/3/issue/{issue_key}/transitions"
-            
             payload = {
                 "transition": {
                     "id": transition_id
                 }
             }
             
-            response = requests.post(
-                url,
-                headers=self.headers,
-                json=payload
-            )
+            response = self.request("POST", f"/rest/api/3/issue/{issue_key}/transitions", json=payload)
             
             if response.status_code in [200, 204]:
                 print(f"Successfully transitioned issue: {issue_key}")
@@ -373,76 +1076,146 @@ class JiraAPI:
             else:
                 print(f"Error transitioning issue: {response.status_code}")
                 print(response.text)
+                # The cached workflow may be stale
+                self.invalidate_transitions()
                 return False
         except Exception as e:
             print(f"Exception when transitioning issue: {str(e)}")
             return False
     
-    def generate_progress_report(self) -> Dict[str, Any]:
+    def count_issues(self, jql: str) -> Optional[int]:
+        """
+        Count the issues matching a JQL query without downloading them
+        
+        Args:
+            jql: JQL query
+            
+        Returns:
+            Number of matching issues, or None on error
+        """
+        try:
+            payload = {"jql": jql, "maxResults": 0, "fields": ["id"]}
+            response = self.request("POST", "/rest/api/3/search", json=payload, idempotent=True)
+            
+            if response.status_code == 200:
+                return response.json().get("total", 0)
+            else:
+                print(f"Error counting issues: {response.status_code}")
+                print(response.text)
+                return None
+        except Exception as e:
+            print(f"Exception when counting issues: {str(e)}")
+            return None
+    
+    def get_project_statuses(self) -> List[Dict[str, Any]]:
+        """
+        Get the issue types of the project with the statuses each one can have
+        
+        Returns:
+            List of issue types, each with a 'statuses' list
+        """
+        try:
+            response = self.request("GET", f"/rest/api/3/project/{self.project_key}/statuses")
+            
+            if response.status_code == 200:
+                return response.json()
+            else:
+                print(f"Error fetching project statuses: {response.status_code}")
+                print(response.text)
+                return []
+        except Exception as e:
+            print(f"Exception when fetching project statuses: {str(e)}")
+            return []
+    
+    def _generate_server_side_report(self, max_workers: int) -> Dict[str, Any]:
+        """
+        Build the progress report from count-only searches run concurrently
+        
+        Args:
+            max_workers: Maximum number of count requests in flight
+            
+        Returns:
+            Dictionary with project statistics
+        """
+        issue_types = self.get_project_statuses()
+        if not issue_types:
+            raise RuntimeError("Could not fetch the project's statuses")
+        
+        type_names = sorted({issue_type["name"] for issue_type in issue_types})
+        status_names = sorted({status["name"] for issue_type in issue_types
+                               for status in issue_type.get("statuses", [])})
+        
+        def quote(value: str) -> str:
+            return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+        
+        project_jql = f"project = {self.project_key}"
+        queries = {("total", None): project_jql}
+        queries.update({("status", name): f"{project_jql} AND status = {quote(name)}" for name in status_names})
+        queries.update({("issuetype", name): f"{project_jql} AND issuetype = {quote(name)}" for name in type_names})
+        
+        self.ensure_pool_size(max_workers)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            counts = dict(zip(queries, executor.map(self.count_issues, queries.values())))
+        
+        if any(count is None for count in counts.values()):
+            raise RuntimeError("One or more count queries failed")
+        
+        status_counts = {name: counts[("status", name)] for name in status_names if counts[("status", name)]}
+        issue_type_counts = {name: counts[("issuetype", name)] for name in type_names if counts[("issuetype", name)]}
+        return build_progress_report(self.project_key, counts[("total", None)], status_counts, issue_type_counts)
+    
+    def generate_progress_report(self, server_side: bool = False, max_workers: int = 8) -> Dict[str, Any]:
         """
         Generate a report on project progress
         
+        Args:
+            server_side: Let Jira do the counting with count-only searches (one
+                         per status and issue type, run concurrently) instead
+                         of downloading every issue. Payload and latency then
+                         stay constant as the project grows.
+            max_workers: Maximum number of concurrent count requests (server_side only)
+        
         Returns:
             Dictionary with project statistics
         """
         try:
-            # Get project issues
-            issues = self.get_project_issues(max_results=1000)
-            
-            # Initialize counters
-            total_issues = len(issues)
-            status_counts = {}
-            issue_type_counts = {}
+            if server_side:
+                return self._generate_server_side_report(max_workers)
             
-            # Calculate metrics
-            for issue in issues:
-                # Count by status
-                status = issue["fields"]["status"]["name"]
-                status_counts[status] = status_counts.get(status, 0) + 1
-                
-                # Count by issue type
-                issue_type = issue["fields"]["issuetype"]["name"]
-                issue_type_counts[issue_type] = issue_type_counts.get(issue_type, 0) + 1
-            
-            # Calculate completion percentage (if "Done" status exists)
-            completion_percentage = 0
-            if "Done" in status_counts and total_issues > 0:
-                completion_percentage = (status_counts["Done"] / total_issues) * 100
-            
-            # Create report
-            report = {
-                "timestamp": datetime.now().isoformat(),
-                "project_key": self.project_key,
-                "total_issues": total_issues,
-                "status_breakdown": status_counts,
-                "issue_type_breakdown": issue_type_counts,
-                "completion_percentage": completion_percentage
-            }
+            # Count while streaming: only the counted fields are requested, and
+            # no page is kept once its records have been counted
+            total_issues = 0
+            status_counts = Counter()
+            issue_type_counts = Counter()
+            for record in self.iter_issue_records(fields=["status", "issuetype"]):
+                total_issues += 1
+                status_counts[record.status] += 1
+                issue_type_counts[record.issue_type] += 1
             
-            return report
+            return build_progress_report(self.project_key, total_issues, dict(status_counts), dict(issue_type_counts))
         except Exception as e:
             print(f"Exception when generating report: {str(e)}")
             return {"error": str(e)}
 
     def get_issue_types(self) -> List[Dict[str, Any]]:
         """
-        Get all available issue types in the Jira instance
+        Get all available issue types in the Jira instance (cached)
         
         Returns:
             List of available issue types
         """
+        issue_types = self._cached(("issuetypes",), self._fetch_issue_types)
+        if issue_types:
+            print(f"Found {len(issue_types)} issue types")
+        return issue_types
+    
+    def _fetch_issue_types(self) -> List[Dict[str, Any]]:
+        """Fetch all issue types from the Jira instance"""
         try:
-            url = f"{self.jira_url}/rest/api/3/issuetype"
-            
-            response = requests.get(
-                url,
-                headers=self.headers
-            )
+            response = self.request("GET", "/rest/api/3/issuetype")
             
             if response.status_code == 200:
-                data = response.json()
-                print(f"Found {len(data)} issue types")
-                return data
+                return response.json()
             else:
                 print(f"Error fetching issue types: {response.status_code}")
                 print(response.text)
@@ -450,6 +1223,117 @@ class JiraAPI:
         except Exception as e:
             print(f"Exception when fetching issue types: {str(e)}")
             return []
+    
+    def get_create_meta(self) -> List[Dict[str, Any]]:
+        """
+        Get the issue types that can be created in the project (cached)
+        
+        Returns:
+            List of issue types from the project's create metadata
+        """
+        return self._cached(("createmeta", self.project_key), self._fetch_create_meta)
+    
+    def _fetch_create_meta(self) -> List[Dict[str, Any]]:
+        """Fetch the project's create metadata"""
+        try:
+            response = self.request(
+                "GET",
+                "/rest/api/3/issue/createmeta",
+                params={"projectKeys": self.project_key, "expand": "projects.issuetypes"}
+            )
+            
+            if response.status_code == 200:
+                projects = response.json().get("projects", [])
+                if not projects:
+                    print(f"No project found with key: {self.project_key}")
+                    return []
+                return projects[0].get("issuetypes", [])
+            else:
+                print(f"Failed to get project metadata. Status code: {response.status_code}")
+                print(f"Response: {response.text}")
+                return []
+        except Exception as e:
+            print(f"Exception when fetching project metadata: {str(e)}")
+            return []
+
+
+def build_progress_report(project_key: str, total_issues: int, status_counts: Dict[str, int],
+                          issue_type_counts: Dict[str, int]) -> Dict[str, Any]:
+    """
+    Assemble a progress report from issue counts
+    
+    Args:
+        project_key: Jira project key
+        total_issues: Number of issues in the project
+        status_counts: Issue count per status name
+        issue_type_counts: Issue count per issue type name
+        
+    Returns:
+        Dictionary with project statistics
+    """
+    # Calculate completion percentage (if "Done" status exists)
+    completion_percentage = 0
+    if "Done" in status_counts and total_issues > 0:
+        completion_percentage = (status_counts["Done"] / total_issues) * 100
+    
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "project_key": project_key,
+        "total_issues": total_issues,
+        "status_breakdown": status_counts,
+        "issue_type_breakdown": issue_type_counts,
+        "completion_percentage": completion_percentage
+    }
+
+
+def text_to_adf(text: str) -> Dict[str, Any]:
+    """
+    Convert plain text to a single-paragraph Atlassian Document Format (ADF) document
+    
+    Args:
+        text: Plain text
+        
+    Returns:
+        ADF document accepted by Jira REST API v3
+    """
+    return {
+        "type": "doc",
+        "version": 1,
+        "content": [
+            {
+                "type": "paragraph",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": text
+                    }
+                ]
+            }
+        ]
+    }
+
+
+def adf_to_text(adf: Any) -> str:
+    """
+    Extract the plain text from an Atlassian Document Format (ADF) value
+    
+    Args:
+        adf: ADF document (dict), plain string or None
+        
+    Returns:
+        Text content, with paragraphs separated by newlines
+    """
+    if adf is None:
+        return ""
+    if isinstance(adf, str):
+        return adf
+    
+    if adf.get("type") == "text":
+        return adf.get("text", "")
+    
+    parts = [adf_to_text(node) for node in adf.get("content", [])]
+    separator = "\n" if adf.get("type") == "doc" else ""
+    return separator.join(parts)
 
 
 def create_env_file():
@@ -460,6 +1344,13 @@ JIRA_API_TOKEN=your-api-token
 JIRA_URL=https://your-domain.atlassian.net
 JIRA_PROJECT_KEY=BWYD
 
+# Optional transport settings (defaults shown)
+# JIRA_POOL_CONNECTIONS=4
+# JIRA_POOL_MAXSIZE=10
+# JIRA_KEEP_ALIVE=true
+# JIRA_CONNECT_TIMEOUT=5
+# JIRA_READ_TIMEOUT=30
+
 # Note: Generate an API token from your Atlassian account:
 # https://id.atlassian.com/manage-profile/security/api-tokens
 """
@@ -524,13 +1415,15 @@ def main():
     
     # Example: List recent issues
     print("\n==== Recent Issues ====")
-    issues = jira.get_project_issues(max_results=5)
-    for issue in issues:
-        print(f"{issue['key']}: {issue['fields']['summary']} - {issue['fields']['status']['name']}")
+    try:
+        for record in jira.get_issue_records(max_results=5, fields=["summary", "status"]):
+            print(f"{record.key}: {record.summary} - {record.status}")
+    except (JiraAPIError, requests.RequestException) as e:
+        print(f"Error fetching issues: {str(e)}")
     
     # Example: Generate progress report
     print("\n==== Project Progress Report ====")
-    report = jira.generate_progress_report()
+    report = jira.generate_progress_report(server_side=True)
     print(json.dumps(report, indent=2))
 
 
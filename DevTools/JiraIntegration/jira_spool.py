@@ -0,0 +1,671 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+BetterWYD Jira Spool
+
+Durable local queue for the commit -> Jira updates. Every comment and transition
+is first written to a SQLite journal (.jira_cache/spool.db, WAL mode), so a
+commit never depends on Jira being reachable and no update is lost while
+offline. A drainer delivers the pending items later:
+
+- One pass delivers everything that is due (e.g. a burst of offline commits)
+  over a single connection pool, with different issues processed concurrently
+  and the items of one issue delivered in order.
+- Failed items are retried with exponential backoff and end up as 'failed'
+  after MAX_ATTEMPTS; `retry` puts them back in the queue.
+- A lease stored in the database ensures only one drainer runs at a time
+  (a lease left behind by a killed drainer is taken over).
+
+Usage:
+    python jira_spool.py status
+    python jira_spool.py list [--all | --failed]
+    python jira_spool.py drain            # deliver everything that is due
+    python jira_spool.py retry            # re-queue failed items
+    python jira_spool.py purge --days 30  # drop delivered items older than 30 days
+    python jira_spool.py commits BWYD-123 # commits that referenced a ticket
+    python jira_spool.py tickets 1a2b3c4  # tickets a commit referenced
+
+The spool database also holds the commit -> ticket index: every (commit,
+ticket) pair ever spooled, and when its comment was delivered. Commits are
+checked against it before anything is queued, so re-runs are free no-ops, and
+it is kept when delivered items are purged.
+"""
+
+import os
+import sys
+import time
+import uuid
+import sqlite3
+import asyncio
+import argparse
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Any, Iterable, Optional, Set, Tuple
+
+# Get the script directory
+SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+
+# Add the JiraIntegration directory to the Python path
+sys.path.append(str(SCRIPT_DIR))
+
+from jira_integration import JiraAPI, CACHE_DIR
+from jira_async import AsyncJiraAPI
+from issue_mirror import IssueMirror, MIRROR_DB
+
+# Default location of the spool database
+SPOOL_DB = CACHE_DIR / 'spool.db'
+
+# Output of background drainers
+DRAIN_LOG = CACHE_DIR / 'spool_drain.log'
+
+# Retry policy: 30s, 1m, 2m, ... capped at 1h, given up after MAX_ATTEMPTS
+RETRY_BASE_DELAY = 30.0
+RETRY_MAX_DELAY = 60 * 60.0
+MAX_ATTEMPTS = 12
+
+# Seconds a drainer holds the drain lease without renewing it (renewed before
+# every delivery, so a throttled pass can take longer than this)
+DRAIN_LEASE = 120.0
+
+# Items delivered per pass
+DRAIN_BATCH_SIZE = 200
+
+# Maximum number of host parameters per lookup query
+LOOKUP_CHUNK_SIZE = 500
+
+# Item kinds
+KIND_COMMENT = "comment"
+KIND_TRANSITION = "transition"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS spool (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    commit_hash TEXT NOT NULL,
+    issue_key TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    last_error TEXT,
+    created_at REAL NOT NULL,
+    done_at REAL,
+    UNIQUE (commit_hash, issue_key, kind)
+);
+CREATE INDEX IF NOT EXISTS idx_spool_status ON spool (status, id);
+
+-- Commit -> ticket index: every (commit, ticket) pair that was spooled, and
+-- when the comment covering it was delivered (comment_commit is the spool key
+-- of that comment, which may list several commits)
+CREATE TABLE IF NOT EXISTS commit_tickets (
+    commit_hash TEXT NOT NULL,
+    issue_key TEXT NOT NULL,
+    subject TEXT,
+    author TEXT,
+    committed_at TEXT,
+    comment_commit TEXT NOT NULL,
+    indexed_at REAL NOT NULL,
+    delivered_at REAL,
+    PRIMARY KEY (commit_hash, issue_key)
+);
+CREATE INDEX IF NOT EXISTS idx_commit_tickets_issue ON commit_tickets (issue_key);
+CREATE INDEX IF NOT EXISTS idx_commit_tickets_comment ON commit_tickets (issue_key, comment_commit);
+
+CREATE TABLE IF NOT EXISTS drain_lock (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    owner TEXT,
+    expires_at REAL
+);
+"""
+
+
+def _owner_alive(owner: str) -> bool:
+    """
+    Check whether the process holding the drain lease is still running
+
+    Only possible on POSIX; elsewhere the lease is trusted until it expires.
+    """
+    if os.name == "nt":
+        return True
+    try:
+        os.kill(int(owner.split("-", 1)[0]), 0)
+    except (ValueError, ProcessLookupError):
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def retry_delay(attempts: int) -> float:
+    """Backoff before the next attempt after `attempts` failures"""
+    return min(RETRY_BASE_DELAY * (2 ** max(attempts - 1, 0)), RETRY_MAX_DELAY)
+
+
+class JiraSpool:
+    """SQLite journal of pending Jira updates"""
+
+    def __init__(self, db_path: Path = SPOOL_DB):
+        """
+        Open (and create if needed) the spool database
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # isolation_level=None: transactions are explicit, every statement else autocommits
+        self.conn = sqlite3.connect(str(self.db_path), timeout=10.0, isolation_level=None,
+                                    check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=FULL")
+        self.conn.executescript(SCHEMA)
+        self.owner = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+
+    def close(self):
+        """Close the database connection"""
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def enqueue(self, items: List[Tuple[str, str, str, str]],
+                links: Optional[List[Tuple[str, str, Optional[str], Optional[str], Optional[str], str]]] = None) -> int:
+        """
+        Journal items, and index the commits they cover, in one transaction
+
+        An item that was already spooled (same kind, commit and issue) is ignored.
+
+        Args:
+            items: (kind, commit hash, issue key, payload) tuples, in delivery order
+            links: (commit hash, issue key, subject, author, commit date, comment commit)
+                   tuples for the commit -> ticket index; 'comment commit' is the
+                   commit hash of the comment item that covers the pair
+
+        Returns:
+            Number of new items
+        """
+        now = time.time()
+        before = self.conn.total_changes
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO spool (kind, commit_hash, issue_key, payload, next_attempt_at, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(kind, commit_hash, issue_key, payload, now, now)
+                 for kind, commit_hash, issue_key, payload in items]
+            )
+            added = self.conn.total_changes - before
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO commit_tickets "
+                "(commit_hash, issue_key, subject, author, committed_at, comment_commit, indexed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [link + (now,) for link in links or []]
+            )
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        return added
+
+    def known_links(self, pairs: Iterable[Tuple[str, str]]) -> Set[Tuple[str, str]]:
+        """
+        Find the (commit, ticket) pairs that are already indexed (spooled or delivered)
+
+        Args:
+            pairs: (commit hash, issue key) pairs to check
+
+        Returns:
+            The subset of pairs found in the index
+        """
+        pairs = set(pairs)
+        commit_hashes = sorted({commit_hash for commit_hash, _ in pairs})
+        known = set()
+        for start in range(0, len(commit_hashes), LOOKUP_CHUNK_SIZE):
+            chunk = commit_hashes[start:start + LOOKUP_CHUNK_SIZE]
+            placeholders = ", ".join("?" * len(chunk))
+            for row in self.conn.execute(
+                f"SELECT commit_hash, issue_key FROM commit_tickets WHERE commit_hash IN ({placeholders})", chunk
+            ):
+                pair = (row["commit_hash"], row["issue_key"])
+                if pair in pairs:
+                    known.add(pair)
+        return known
+
+    def commits_for_ticket(self, issue_key: str) -> List[sqlite3.Row]:
+        """
+        List the indexed commits that reference a ticket
+
+        Args:
+            issue_key: The key of the issue (e.g., 'BWYD-123')
+
+        Returns:
+            Index rows, oldest first
+        """
+        return self.conn.execute(
+            "SELECT * FROM commit_tickets WHERE issue_key = ? ORDER BY indexed_at, rowid", (issue_key,)
+        ).fetchall()
+
+    def tickets_for_commit(self, commit_prefix: str) -> List[sqlite3.Row]:
+        """
+        List the tickets referenced by a commit
+
+        Args:
+            commit_prefix: Full or abbreviated commit hash
+
+        Returns:
+            Index rows
+        """
+        return self.conn.execute(
+            "SELECT * FROM commit_tickets WHERE commit_hash >= ? AND commit_hash < ? ORDER BY issue_key",
+            (commit_prefix, commit_prefix + "\uffff")
+        ).fetchall()
+
+    def due_items(self, now: Optional[float] = None) -> List[sqlite3.Row]:
+        """
+        Get the pending items that can be delivered now
+
+        An issue's items are delivered in order, so once one of them is waiting
+        for its retry time, the items after it wait too.
+
+        Args:
+            now: Current time (defaults to time.time())
+
+        Returns:
+            Due items in spool order
+        """
+        now = time.time() if now is None else now
+        blocked = set()
+        due = []
+        for row in self.conn.execute("SELECT * FROM spool WHERE status = 'pending' ORDER BY id"):
+            if row["issue_key"] in blocked:
+                continue
+            if row["next_attempt_at"] > now:
+                blocked.add(row["issue_key"])
+                continue
+            due.append(row)
+        return due
+
+    def mark_done(self, item: sqlite3.Row, note: Optional[str] = None):
+        """Mark an item as delivered (note records e.g. a skipped transition)"""
+        now = time.time()
+        self.conn.execute(
+            "UPDATE spool SET status = 'done', done_at = ?, last_error = ? WHERE id = ?",
+            (now, note, item["id"])
+        )
+        if item["kind"] == KIND_COMMENT:
+            self.conn.execute(
+                "UPDATE commit_tickets SET delivered_at = ? WHERE issue_key = ? AND comment_commit = ?",
+                (now, item["issue_key"], item["commit_hash"])
+            )
+
+    def mark_failed(self, item: sqlite3.Row, error: str):
+        """Record a failed attempt and schedule the retry (or give up)"""
+        attempts = item["attempts"] + 1
+        status = "failed" if attempts >= MAX_ATTEMPTS else "pending"
+        self.conn.execute(
+            "UPDATE spool SET status = ?, attempts = ?, next_attempt_at = ?, last_error = ? WHERE id = ?",
+            (status, attempts, time.time() + retry_delay(attempts), error, item["id"])
+        )
+
+    def retry_failed(self) -> int:
+        """
+        Put every failed item back in the queue
+
+        Returns:
+            Number of items re-queued
+        """
+        cursor = self.conn.execute(
+            "UPDATE spool SET status = 'pending', attempts = 0, next_attempt_at = ? WHERE status = 'failed'",
+            (time.time(),)
+        )
+        return cursor.rowcount
+
+    def purge(self, older_than_days: float) -> int:
+        """
+        Delete delivered items
+
+        Args:
+            older_than_days: Only delete items delivered at least this many days ago
+
+        Returns:
+            Number of items deleted
+        """
+        cutoff = time.time() - older_than_days * 24 * 60 * 60
+        cursor = self.conn.execute("DELETE FROM spool WHERE status = 'done' AND done_at < ?", (cutoff,))
+        return cursor.rowcount
+
+    def counts(self) -> Dict[str, int]:
+        """Number of items per status"""
+        return {row["status"]: row["count"] for row in
+                self.conn.execute("SELECT status, COUNT(*) AS count FROM spool GROUP BY status")}
+
+    def list_items(self, status: Optional[str] = "pending") -> List[sqlite3.Row]:
+        """
+        List spooled items
+
+        Args:
+            status: Only items with this status (None for all)
+
+        Returns:
+            Items in spool order
+        """
+        if status is None:
+            return self.conn.execute("SELECT * FROM spool ORDER BY id").fetchall()
+        return self.conn.execute("SELECT * FROM spool WHERE status = ? ORDER BY id", (status,)).fetchall()
+
+    def acquire_drain_lock(self) -> bool:
+        """
+        Take (or renew) the drain lease
+
+        Returns:
+            True if this spool instance may drain
+        """
+        now = time.time()
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = self.conn.execute("SELECT owner, expires_at FROM drain_lock WHERE id = 1").fetchone()
+            if (row and row["owner"] and row["owner"] != self.owner and row["expires_at"] > now
+                    and _owner_alive(row["owner"])):
+                self.conn.execute("ROLLBACK")
+                return False
+            self.conn.execute(
+                "INSERT OR REPLACE INTO drain_lock (id, owner, expires_at) VALUES (1, ?, ?)",
+                (self.owner, now + DRAIN_LEASE)
+            )
+            self.conn.execute("COMMIT")
+            return True
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+
+    def renew_drain_lock(self) -> bool:
+        """
+        Extend the drain lease held by this spool instance
+
+        Returns:
+            False if the lease was lost to another drainer
+        """
+        cursor = self.conn.execute("UPDATE drain_lock SET expires_at = ? WHERE id = 1 AND owner = ?",
+                                   (time.time() + DRAIN_LEASE, self.owner))
+        return cursor.rowcount == 1
+
+    def release_drain_lock(self):
+        """Give up the drain lease"""
+        self.conn.execute("UPDATE drain_lock SET owner = NULL, expires_at = 0 WHERE id = 1 AND owner = ?",
+                          (self.owner,))
+
+
+def lookup_issue_state(ticket_id: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Get a ticket's issue type and status from the local issue mirror, if synced
+
+    Args:
+        ticket_id: The key of the issue
+
+    Returns:
+        Tuple of (issue type name, status name), or (None, None) if unknown
+    """
+    if not MIRROR_DB.exists():
+        return None, None
+    try:
+        with IssueMirror(os.getenv("JIRA_PROJECT_KEY", ""), MIRROR_DB) as mirror:
+            row = mirror.get_issue(ticket_id)
+            if row:
+                return row["issue_type"], row["status"]
+    except Exception as e:
+        print(f"Could not read the issue mirror: {e}")
+    return None, None
+
+
+async def deliver_transition(jira: AsyncJiraAPI, ticket_id: str, transition_name: str) -> Tuple[Optional[bool], List[Dict[str, Any]]]:
+    """
+    Move a ticket to the status named by a transition command
+
+    If the transition is not available from the ticket's current status, the
+    shortest path through the learned workflow graph is followed instead.
+
+    Args:
+        jira: AsyncJiraAPI instance
+        ticket_id: The key of the issue
+        transition_name: Name of the transition (or target status)
+
+    Returns:
+        Tuple of (result as returned by JiraAPI.transition_issue_to, available transitions)
+    """
+    print(f"Attempting to transition {ticket_id} to '{transition_name}'")
+
+    # With the ticket's type and status from the local mirror, the cached
+    # workflow answers without a round trip
+    issue_type, status = lookup_issue_state(ticket_id)
+    result, transitions = await jira.transition_issue_to(ticket_id, transition_name, issue_type, status)
+
+    if result is False and issue_type:
+        # The mirror or cache was stale: discover the issue's state again
+        result, transitions = await jira.transition_issue_to(ticket_id, transition_name)
+
+    return result, transitions
+
+
+class RateLimiter:
+    """Spaces out asyncio operations to at most `rate` per second"""
+
+    def __init__(self, rate: float):
+        """
+        Initialize the limiter
+
+        Args:
+            rate: Maximum number of operations per second
+        """
+        self.interval = 1.0 / rate
+        self._next_slot = 0.0
+
+    async def acquire(self):
+        """Wait for the next free slot"""
+        now = time.monotonic()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+async def deliver_issue_items(jira: AsyncJiraAPI, spool: JiraSpool, items: List[sqlite3.Row],
+                              stats: Dict[str, int], limiter: Optional[RateLimiter] = None):
+    """
+    Deliver the due items of one issue in order
+
+    Stops at the first failure so later items (e.g. a following transition)
+    are not applied out of order, and when the drain lease was lost, since
+    the new drainer delivers the remaining items itself.
+    """
+    for item in items:
+        if limiter:
+            await limiter.acquire()
+        if not spool.renew_drain_lock():
+            print("Drain lease lost to another drainer; leaving the remaining items to it")
+            stats["deferred"] += len(items) - items.index(item)
+            return
+        ticket_id = item["issue_key"]
+        if item["kind"] == KIND_COMMENT:
+            if await jira.add_comment(ticket_id, item["payload"]):
+                print(f"Added commit information as a comment to {ticket_id}")
+                spool.mark_done(item)
+                stats["delivered"] += 1
+                continue
+            error = f"Failed to add comment to {ticket_id}"
+        else:
+            transition_name = item["payload"]
+            result, transitions = await deliver_transition(jira, ticket_id, transition_name)
+            if result:
+                print(f"Successfully transitioned {ticket_id} to '{transition_name}'")
+                spool.mark_done(item)
+                stats["delivered"] += 1
+                continue
+            if result is None:
+                # Neither available nor reachable through the learned workflow
+                available = ", ".join(t['name'] for t in transitions)
+                note = f"Transition '{transition_name}' not available and no known path (available: {available})"
+                print(f"{note} for {ticket_id}")
+                spool.mark_done(item, note)
+                stats["skipped"] += 1
+                continue
+            error = f"Failed to transition {ticket_id}"
+
+        print(f"{error} (will retry)")
+        spool.mark_failed(item, error)
+        stats["failed"] += 1
+        stats["deferred"] += len(items) - items.index(item) - 1
+        return
+
+
+def drain_spool(jira: JiraAPI, spool: JiraSpool, check_connection: bool = True,
+                concurrency: Optional[int] = None, max_rate: Optional[float] = None) -> Optional[Dict[str, int]]:
+    """
+    Deliver every due item of the spool
+
+    Args:
+        jira: JiraAPI instance
+        spool: Spool to drain
+        check_connection: Test the connection first and leave the queue
+                          untouched (no attempt counted) when Jira is unreachable
+        concurrency: Maximum number of requests in flight (defaults to JIRA_CONCURRENCY)
+        max_rate: Maximum number of items delivered per second (unlimited if None)
+
+    Returns:
+        Counts of 'delivered', 'skipped', 'failed' and 'deferred' items, or
+        None if another drainer is running or Jira is unreachable
+    """
+    stats = {"delivered": 0, "skipped": 0, "failed": 0, "deferred": 0}
+    limiter = RateLimiter(max_rate) if max_rate else None
+
+    # Failed items wait for their retry time (and block the rest of their
+    # issue), so every pass shrinks the set of due items
+    while spool.due_items():
+        if not spool.acquire_drain_lock():
+            print("Another drainer is delivering the spool")
+            return None
+        try:
+            if check_connection:
+                if not jira.test_connection():
+                    print("Jira is unreachable; spooled updates will be delivered later")
+                    return None
+                check_connection = False
+
+            # Group by issue: issues run concurrently, each issue's items in order
+            by_issue = {}
+            for item in spool.due_items()[:DRAIN_BATCH_SIZE]:
+                by_issue.setdefault(item["issue_key"], []).append(item)
+            if not by_issue:
+                break
+            print(f"Delivering {sum(map(len, by_issue.values()))} spooled updates for {len(by_issue)} issues")
+
+            async def deliver_all():
+                options = {"concurrency": concurrency} if concurrency else {}
+                async with AsyncJiraAPI(jira=jira, **options) as async_jira:
+                    await asyncio.gather(*(
+                        deliver_issue_items(async_jira, spool, items, stats, limiter) for items in by_issue.values()
+                    ))
+
+            asyncio.run(deliver_all())
+        finally:
+            spool.release_drain_lock()
+
+    return stats
+
+
+def start_background_drain() -> Optional[subprocess.Popen]:
+    """
+    Drain the spool in a detached background process
+
+    Returns:
+        The drainer process, or None if it could not be started
+    """
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    options = {}
+    if os.name == "nt":
+        options["creationflags"] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        options["start_new_session"] = True
+
+    try:
+        with open(DRAIN_LOG, "a", encoding="utf-8") as log_file:
+            return subprocess.Popen(
+                [sys.executable, "-u", str(Path(__file__).resolve()), "drain"],
+                stdin=subprocess.DEVNULL,
+                stdout=log_file,
+                stderr=subprocess.STDOUT,
+                cwd=str(SCRIPT_DIR),
+                **options
+            )
+    except OSError as e:
+        print(f"Could not start the spool drainer: {e}")
+        return None
+
+
+def main():
+    """Inspect or drain the spool"""
+    parser = argparse.ArgumentParser(description="Durable queue of commit -> Jira updates")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("status", help="Show item counts")
+    list_parser = subparsers.add_parser("list", help="List pending items")
+    list_group = list_parser.add_mutually_exclusive_group()
+    list_group.add_argument("--all", action="store_true", help="List items of every status")
+    list_group.add_argument("--failed", action="store_true", help="List failed items")
+    subparsers.add_parser("drain", help="Deliver every due item")
+    subparsers.add_parser("retry", help="Re-queue failed items")
+    commits_parser = subparsers.add_parser("commits", help="List the commits that referenced a ticket")
+    commits_parser.add_argument("issue_key", help="Ticket key (e.g., BWYD-123)")
+    tickets_parser = subparsers.add_parser("tickets", help="List the tickets a commit referenced")
+    tickets_parser.add_argument("commit", help="Full or abbreviated commit hash")
+    purge_parser = subparsers.add_parser("purge", help="Delete delivered items")
+    purge_parser.add_argument("--days", type=float, default=30, help="Keep items delivered in the last N days")
+    args = parser.parse_args()
+
+    with JiraSpool() as spool:
+        if args.command == "status":
+            counts = spool.counts()
+            print(f"Pending: {counts.get('pending', 0)}, failed: {counts.get('failed', 0)}, "
+                  f"delivered: {counts.get('done', 0)}")
+        elif args.command == "list":
+            status = None if args.all else "failed" if args.failed else "pending"
+            for item in spool.list_items(status):
+                payload = item["payload"] if item["kind"] == KIND_TRANSITION else "commit comment"
+                error = f" - {item['last_error']}" if item["last_error"] else ""
+                print(f"{item['id']:>5} {item['status']:<8} {item['issue_key']:<12} {item['commit_hash'][:7]} "
+                      f"{item['kind']}: {payload} (attempts: {item['attempts']}){error}")
+        elif args.command == "drain":
+            print(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] Draining {spool.db_path}")
+            try:
+                jira = JiraAPI()
+            except ValueError as e:
+                print(f"Error initializing Jira API: {e}")
+                sys.exit(1)
+            with jira:
+                stats = drain_spool(jira, spool)
+            if stats is not None:
+                print(f"Delivered {stats['delivered']}, skipped {stats['skipped']}, "
+                      f"failed {stats['failed']}, deferred {stats['deferred']}")
+        elif args.command in ("commits", "tickets"):
+            if args.command == "commits":
+                rows = spool.commits_for_ticket(args.issue_key)
+            else:
+                rows = spool.tickets_for_commit(args.commit)
+            for row in rows:
+                state = "delivered" if row["delivered_at"] else "queued"
+                print(f"{row['issue_key']:<12} {row['commit_hash'][:7]} {state:<9} "
+                      f"{row['committed_at'] or ''}  {row['subject'] or ''}")
+            if not rows:
+                print("No indexed commits found")
+        elif args.command == "retry":
+            print(f"Re-queued {spool.retry_failed()} failed items")
+        elif args.command == "purge":
+            print(f"Deleted {spool.purge(args.days)} delivered items")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,832 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+BetterWYD Local JQL
+
+Evaluates a subset of JQL against the locally synced issues (the SQLite
+mirror loaded into a columnar IssueStore), so dashboards and scripts can run
+queries without a round trip to /rest/api/3/search.
+
+Supported:
+    fields      project, key, status, statusCategory, issuetype (type), assignee,
+                priority, parent, labels, summary, created, updated, resolved
+                (resolutiondate)
+    operators   = != IN, NOT IN, IS [NOT] EMPTY, > >= < <= (dates), ~ !~ (summary)
+    logic       AND, OR, NOT, parentheses
+    dates       "2025-04-01", "2025/04/01 14:30", -7d, -2w, -4h, -30m, now(),
+                startOfDay(), startOfWeek(), startOfMonth(), startOfYear()
+                (local time; weeks start on Monday)
+    ORDER BY    any field above except labels, ASC or DESC
+
+Names compare case-insensitively, as in Jira. Assignees are matched by
+display name.
+
+The planner answers equality and IN clauses from the store's hash indexes,
+date ranges by binary search over a sorted time column, and only falls back
+to checking rows one by one for labels and summary text. Within an AND, the
+most selective clause runs first and the others narrow its result. explain()
+shows the chosen plan with row counts.
+
+Usage:
+    python local_jql.py 'status = "In Progress" AND created >= -14d ORDER BY updated DESC'
+    python local_jql.py --explain 'issuetype IN (Story, Task) AND assignee IS EMPTY'
+    python local_jql.py --sync --count 'project = BWYD AND statusCategory != Done'
+"""
+
+import os
+import re
+import sys
+import math
+import time
+import argparse
+from datetime import datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, List, Any, Optional, Set, Tuple
+
+from issue_records import IssueRecord
+from issue_store import IssueStore, TIME_COLUMNS, to_epoch
+
+# JQL field name (lower case) -> store column
+FIELD_COLUMNS = {
+    "project": "project",
+    "key": "key",
+    "issuekey": "key",
+    "status": "status",
+    "statuscategory": "status_category",
+    "issuetype": "issue_type",
+    "type": "issue_type",
+    "assignee": "assignee",
+    "priority": "priority",
+    "parent": "parent",
+    "labels": "labels",
+    "summary": "summary",
+    "created": "created",
+    "createddate": "created",
+    "updated": "updated",
+    "updateddate": "updated",
+    "resolved": "resolved",
+    "resolutiondate": "resolved",
+}
+
+# Operators each kind of column accepts
+CATEGORICAL_OPERATORS = {"=", "!=", "in", "not in", "is", "is not"}
+TIME_OPERATORS = {">", ">=", "<", "<=", "is", "is not"}
+TEXT_OPERATORS = {"~", "!~", "is", "is not"}
+
+# Status category names accepted in place of the keys Jira stores
+STATUS_CATEGORY_NAMES = {"to do": "new", "in progress": "indeterminate", "done": "done"}
+
+# Sort rank of the default priorities (ORDER BY priority DESC puts Highest first)
+PRIORITY_RANKS = {"lowest": 0, "low": 1, "medium": 2, "high": 3, "highest": 4}
+
+# Relative dates such as -7d or 2w
+RELATIVE_DATE = re.compile(r'^([+-]?)(\d+)([wdhm])$')
+RELATIVE_UNITS = {"w": 604800, "d": 86400, "h": 3600, "m": 60}
+DATE_FORMATS = ("%Y-%m-%d %H:%M", "%Y/%m/%d %H:%M", "%Y-%m-%d", "%Y/%m/%d")
+
+TOKEN_PATTERN = re.compile(r'''\s*(?:
+    (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+  | (?P<op>!=|>=|<=|!~|[=<>~(),])
+  | (?P<word>[^\s=!<>~(),"']+)
+)''', re.VERBOSE)
+
+
+def tokenize(query: str) -> List[Tuple[str, str]]:
+    """
+    Split a JQL query into tokens
+
+    Args:
+        query: JQL text
+
+    Returns:
+        List of (kind, text) tuples, kind being 'string', 'op' or 'word'
+    """
+    tokens = []
+    position = 0
+    query = query.rstrip()
+    while position < len(query):
+        match = TOKEN_PATTERN.match(query, position)
+        if not match or match.end() == position:
+            raise ValueError(f"Unexpected character at position {position}: {query[position:position + 10]!r}")
+        kind = match.lastgroup
+        text = match.group(kind)
+        if kind == "string":
+            text = re.sub(r'\\(.)', r'\1', text[1:-1])
+        tokens.append((kind, text))
+        position = match.end()
+    return tokens
+
+
+class Clause:
+    """One comparison, e.g. status IN ("To Do", "In Progress")"""
+
+    __slots__ = ("field", "column", "operator", "values")
+
+    def __init__(self, field: str, operator: str, values: List[Any]):
+        self.field = field
+        self.column = FIELD_COLUMNS[field.lower()]
+        self.operator = operator
+        # Strings, None for EMPTY, or ('function', name) tuples
+        self.values = values
+
+    def __str__(self) -> str:
+        def show(value):
+            if value is None:
+                return "EMPTY"
+            if isinstance(value, tuple):
+                return f"{value[1]}()"
+            return repr(value)
+        if self.operator in ("in", "not in"):
+            return f"{self.field} {self.operator.upper()} ({', '.join(show(v) for v in self.values)})"
+        return f"{self.field} {self.operator.upper()} {show(self.values[0])}"
+
+
+class Junction:
+    """AND / OR of several conditions"""
+
+    __slots__ = ("operator", "children")
+
+    def __init__(self, operator: str, children: List[Any]):
+        self.operator = operator
+        self.children = children
+
+
+class Negation:
+    """NOT condition"""
+
+    __slots__ = ("child",)
+
+    def __init__(self, child: Any):
+        self.child = child
+
+
+class Query:
+    """Parsed query: an optional condition and the ORDER BY terms"""
+
+    __slots__ = ("text", "where", "order_by")
+
+    def __init__(self, text: str, where: Any, order_by: List[Tuple[str, bool]]):
+        self.text = text
+        self.where = where
+        # (store column, descending) pairs
+        self.order_by = order_by
+
+
+class _Parser:
+    """Recursive descent parser for the supported JQL subset"""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.tokens = tokenize(text)
+        self.position = 0
+
+    def peek(self) -> Optional[Tuple[str, str]]:
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def next(self) -> Tuple[str, str]:
+        token = self.peek()
+        if token is None:
+            raise ValueError("Unexpected end of query")
+        self.position += 1
+        return token
+
+    def at_keyword(self, *keywords: str) -> bool:
+        token = self.peek()
+        return token is not None and token[0] == "word" and token[1].upper() in keywords
+
+    def at_op(self, op: str) -> bool:
+        return self.peek() == ("op", op)
+
+    def expect_keyword(self, keyword: str):
+        if not self.at_keyword(keyword):
+            raise ValueError(f"Expected {keyword} near {self._near()}")
+        self.position += 1
+
+    def expect_op(self, op: str):
+        if not self.at_op(op):
+            raise ValueError(f"Expected '{op}' near {self._near()}")
+        self.position += 1
+
+    def _near(self) -> str:
+        token = self.peek()
+        return repr(token[1]) if token else "end of query"
+
+    def parse(self) -> Query:
+        where = None
+        if self.peek() is not None and not self.at_keyword("ORDER"):
+            where = self.parse_or()
+        order_by = []
+        if self.at_keyword("ORDER"):
+            self.position += 1
+            self.expect_keyword("BY")
+            while True:
+                kind, field = self.next()
+                column = FIELD_COLUMNS.get(field.lower()) if kind != "op" else None
+                if column is None or column == "labels":
+                    raise ValueError(f"Cannot order by {field}")
+                descending = False
+                if self.at_keyword("ASC", "DESC"):
+                    descending = self.next()[1].upper() == "DESC"
+                order_by.append((column, descending))
+                if not self.at_op(","):
+                    break
+                self.position += 1
+        if self.peek() is not None:
+            raise ValueError(f"Unexpected {self._near()}")
+        return Query(self.text, where, order_by)
+
+    def parse_or(self) -> Any:
+        children = [self.parse_and()]
+        while self.at_keyword("OR"):
+            self.position += 1
+            children.append(self.parse_and())
+        return children[0] if len(children) == 1 else Junction("or", children)
+
+    def parse_and(self) -> Any:
+        children = [self.parse_not()]
+        while self.at_keyword("AND"):
+            self.position += 1
+            children.append(self.parse_not())
+        return children[0] if len(children) == 1 else Junction("and", children)
+
+    def parse_not(self) -> Any:
+        if self.at_keyword("NOT"):
+            self.position += 1
+            return Negation(self.parse_not())
+        if self.at_op("("):
+            self.position += 1
+            condition = self.parse_or()
+            self.expect_op(")")
+            return condition
+        return self.parse_clause()
+
+    def parse_clause(self) -> Clause:
+        kind, field = self.next()
+        if kind == "op" or field.lower() not in FIELD_COLUMNS:
+            raise ValueError(f"Unsupported field {field!r}")
+
+        if self.at_keyword("IS"):
+            self.position += 1
+            operator = "is"
+            if self.at_keyword("NOT"):
+                self.position += 1
+                operator = "is not"
+            if not self.at_keyword("EMPTY", "NULL"):
+                raise ValueError(f"Expected EMPTY after IS near {self._near()}")
+            self.position += 1
+            clause = Clause(field, operator, [None])
+        elif self.at_keyword("IN", "NOT"):
+            operator = "in"
+            if self.at_keyword("NOT"):
+                self.position += 1
+                operator = "not in"
+            self.expect_keyword("IN")
+            self.expect_op("(")
+            values = [self.parse_value()]
+            while self.at_op(","):
+                self.position += 1
+                values.append(self.parse_value())
+            self.expect_op(")")
+            clause = Clause(field, operator, values)
+        else:
+            kind, operator = self.next()
+            if kind != "op" or operator in ("(", ")", ","):
+                raise ValueError(f"Expected an operator after {field}")
+            clause = Clause(field, operator, [self.parse_value()])
+
+        allowed = (TIME_OPERATORS if clause.column in TIME_COLUMNS
+                   else TEXT_OPERATORS if clause.column == "summary" else CATEGORICAL_OPERATORS)
+        if clause.operator not in allowed:
+            raise ValueError(f"Operator {clause.operator.upper()} is not supported for {field}")
+        return clause
+
+    def parse_value(self) -> Any:
+        kind, text = self.next()
+        if kind == "string":
+            return text
+        if kind != "word":
+            raise ValueError(f"Expected a value, got {text!r}")
+        if text.upper() in ("EMPTY", "NULL"):
+            return None
+        if self.at_op("("):
+            self.position += 1
+            self.expect_op(")")
+            return ("function", text.lower())
+        return text
+
+
+@lru_cache(maxsize=256)
+def parse_jql(text: str) -> Query:
+    """
+    Parse a query (cached, so repeated dashboard queries are parsed once)
+
+    Args:
+        text: JQL text
+
+    Returns:
+        The parsed Query
+
+    Raises:
+        ValueError: If the query uses syntax or fields outside the supported subset
+    """
+    return _Parser(text).parse()
+
+
+def resolve_time(value: Any, now: Optional[float] = None) -> float:
+    """
+    Resolve a date value of a query to epoch seconds
+
+    Args:
+        value: Date string, relative offset (-7d) or ('function', name) tuple
+        now: Current time in epoch seconds (defaults to time.time())
+
+    Returns:
+        Epoch seconds
+    """
+    now = time.time() if now is None else now
+    if value is None:
+        raise ValueError("EMPTY is not a date; use IS EMPTY")
+    if isinstance(value, tuple):
+        moment = datetime.fromtimestamp(now)
+        midnight = moment.replace(hour=0, minute=0, second=0, microsecond=0)
+        functions = {
+            "now": moment,
+            "startofday": midnight,
+            "startofweek": midnight - timedelta(days=midnight.weekday()),
+            "startofmonth": midnight.replace(day=1),
+            "startofyear": midnight.replace(month=1, day=1),
+        }
+        if value[1] not in functions:
+            raise ValueError(f"Unsupported function {value[1]}()")
+        return functions[value[1]].timestamp()
+
+    match = RELATIVE_DATE.match(value)
+    if match:
+        sign, amount, unit = match.groups()
+        offset = int(amount) * RELATIVE_UNITS[unit]
+        return now - offset if sign == "-" else now + offset
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, date_format).timestamp()
+        except ValueError:
+            pass
+    seconds = to_epoch(value)
+    if math.isnan(seconds):
+        raise ValueError(f"Invalid date {value!r}")
+    return seconds
+
+
+class _Plan:
+    """Executable node of a query plan"""
+
+    # 'index', 'range', 'scan' or 'logic'
+    kind = "scan"
+
+    def __init__(self, label: str, estimate: int):
+        self.label = label
+        self.estimate = estimate
+
+    def rows(self, trace: Optional[List[str]], depth: int) -> Set[int]:
+        """Matching rows; the returned set may belong to an index and must not be modified"""
+        raise NotImplementedError
+
+    def test(self, row: int) -> bool:
+        """Whether one row matches"""
+        raise NotImplementedError
+
+    def _trace(self, trace: Optional[List[str]], depth: int, text: str):
+        if trace is not None:
+            trace.append("  " * depth + text)
+
+
+class _IndexPlan(_Plan):
+    """Union of hash index posting lists"""
+
+    kind = "index"
+
+    def __init__(self, label: str, postings: List[Set[int]], test: Callable[[int], bool]):
+        super().__init__(label, sum(len(rows) for rows in postings))
+        self.postings = postings
+        self.test = test
+
+    def rows(self, trace, depth):
+        if len(self.postings) == 1:
+            result = self.postings[0]
+        else:
+            result = set().union(*self.postings)
+        self._trace(trace, depth, f"index {self.label}: {len(self.postings)} posting list(s), {len(result)} rows")
+        return result
+
+
+class _RangePlan(_Plan):
+    """Binary search over a time column ordered by value"""
+
+    kind = "range"
+
+    def __init__(self, label: str, store: IssueStore, column: str, low: float, high: float):
+        self.store = store
+        self.column = column
+        self.low = low
+        self.high = high
+        self.values = store.times[column]
+        self.matches = store.rows_between(column, low, high)
+        super().__init__(label, len(self.matches))
+
+    def rows(self, trace, depth):
+        result = set(self.matches)
+        self._trace(trace, depth, f"range {self.label}: binary search, {len(result)} rows")
+        return result
+
+    def test(self, row):
+        return self.low <= self.values[row] < self.high
+
+
+class _ScanPlan(_Plan):
+    """Row by row check"""
+
+    def __init__(self, label: str, size: int, test: Callable[[int], bool]):
+        super().__init__(label, size)
+        self.size = size
+        self.test = test
+
+    def rows(self, trace, depth):
+        result = {row for row in range(self.size) if self.test(row)}
+        self._trace(trace, depth, f"scan {self.label}: {self.size} rows checked, {len(result)} match")
+        return result
+
+
+class _AndPlan(_Plan):
+    """Intersection, most selective child first"""
+
+    kind = "logic"
+
+    def __init__(self, children: List[_Plan]):
+        # Scans go last so they only check the rows the other clauses left
+        self.children = sorted(children, key=lambda child: (child.kind == "scan", child.estimate))
+        super().__init__("AND", min(child.estimate for child in children))
+
+    def rows(self, trace, depth):
+        self._trace(trace, depth, "AND")
+        result = None
+        for child in self.children:
+            if result is None:
+                result = set(child.rows(trace, depth + 1))
+            elif child.kind == "scan" or child.kind == "logic" or len(result) * 4 < child.estimate:
+                # Cheaper to check the few remaining rows than to build the child's set
+                result = {row for row in result if child.test(row)}
+                self._trace(trace, depth + 1, f"filter {child.label}: {len(result)} rows left")
+            else:
+                result &= child.rows(trace, depth + 1)
+                self._trace(trace, depth + 1, f"intersect: {len(result)} rows left")
+            if not result:
+                self._trace(trace, depth + 1, "empty, remaining clauses skipped")
+                break
+        return result
+
+    def test(self, row):
+        return all(child.test(row) for child in self.children)
+
+
+class _OrPlan(_Plan):
+    """Union of the children's rows"""
+
+    kind = "logic"
+
+    def __init__(self, children: List[_Plan], size: int):
+        self.children = children
+        super().__init__("OR", min(size, sum(child.estimate for child in children)))
+
+    def rows(self, trace, depth):
+        self._trace(trace, depth, "OR")
+        result = set()
+        for child in self.children:
+            result |= child.rows(trace, depth + 1)
+        self._trace(trace, depth + 1, f"union: {len(result)} rows")
+        return result
+
+    def test(self, row):
+        return any(child.test(row) for child in self.children)
+
+
+class _NotPlan(_Plan):
+    """Complement of the child's rows"""
+
+    kind = "logic"
+
+    def __init__(self, child: _Plan, size: int):
+        self.child = child
+        self.size = size
+        super().__init__("NOT", max(size - child.estimate, 0))
+
+    def rows(self, trace, depth):
+        self._trace(trace, depth, "NOT")
+        result = set(range(self.size)) - self.child.rows(trace, depth + 1)
+        self._trace(trace, depth + 1, f"complement: {len(result)} rows")
+        return result
+
+    def test(self, row):
+        return not self.child.test(row)
+
+
+class LocalJQL:
+    """Runs JQL-subset queries against an IssueStore"""
+
+    def __init__(self, store: IssueStore):
+        """
+        Args:
+            store: The issues to query (e.g. IssueStore.from_mirror(mirror))
+        """
+        self.store = store
+        # Lower-cased value -> code per column, rebuilt when a pool grows
+        self._folded: Dict[str, Tuple[int, Dict[str, int]]] = {}
+        # Project key -> rows, rebuilt when issues are added
+        self._projects: Tuple[int, Dict[str, Set[int]]] = (-1, {})
+
+    @classmethod
+    def from_mirror(cls, mirror) -> "LocalJQL":
+        """Query the issues of an open IssueMirror"""
+        return cls(IssueStore.from_mirror(mirror))
+
+    def search(self, jql: str, limit: Optional[int] = None) -> List[IssueRecord]:
+        """
+        Run a query
+
+        Args:
+            jql: Query text
+            limit: Maximum number of issues to return
+
+        Returns:
+            Matching issues as records, in ORDER BY order (insertion order without one)
+        """
+        rows = self.search_rows(jql)
+        if limit is not None:
+            rows = rows[:limit]
+        return [self.store.record(row) for row in rows]
+
+    def search_rows(self, jql: str, trace: Optional[List[str]] = None) -> List[int]:
+        """
+        Run a query and return store rows instead of records
+
+        Args:
+            jql: Query text
+            trace: List the plan steps are appended to
+
+        Returns:
+            Matching rows in ORDER BY order
+        """
+        query = parse_jql(jql)
+        if query.where is None:
+            rows = list(range(len(self.store)))
+            if trace is not None:
+                trace.append(f"all issues: {len(rows)} rows")
+        else:
+            plan = self._plan(query.where, time.time())
+            rows = sorted(plan.rows(trace, 0))
+        for column, descending in reversed(query.order_by):
+            self._sort(rows, column, descending)
+        if trace is not None and query.order_by:
+            terms = ", ".join(f"{column} {'DESC' if descending else 'ASC'}" for column, descending in query.order_by)
+            trace.append(f"order by {terms}: {len(rows)} rows sorted")
+        return rows
+
+    def count(self, jql: str) -> int:
+        """Number of issues matching a query"""
+        query = parse_jql(jql)
+        if query.where is None:
+            return len(self.store)
+        return len(self._plan(query.where, time.time()).rows(None, 0))
+
+    def explain(self, jql: str) -> List[str]:
+        """
+        Run a query and describe how it was answered
+
+        Args:
+            jql: Query text
+
+        Returns:
+            Plan lines: each step with its strategy and row counts, then the timing
+        """
+        trace = [f"query: {jql}"]
+        start = time.perf_counter()
+        rows = self.search_rows(jql, trace)
+        elapsed = (time.perf_counter() - start) * 1000
+        trace.append(f"{len(rows)} of {len(self.store)} issues in {elapsed:.2f} ms")
+        return trace
+
+    def _plan(self, node: Any, now: float) -> _Plan:
+        """Turn a parsed condition into an executable plan"""
+        size = len(self.store)
+        if isinstance(node, Junction):
+            children = [self._plan(child, now) for child in node.children]
+            return _AndPlan(children) if node.operator == "and" else _OrPlan(children, size)
+        if isinstance(node, Negation):
+            return _NotPlan(self._plan(node.child, now), size)
+        if node.column in TIME_COLUMNS:
+            return self._plan_time(node, now)
+        if node.column in ("labels", "summary"):
+            return self._plan_scan(node)
+        return self._plan_index(node)
+
+    def _plan_index(self, clause: Clause) -> _Plan:
+        """Equality, IN and EMPTY clauses on indexed columns"""
+        store = self.store
+        if any(isinstance(value, tuple) for value in clause.values):
+            raise ValueError(f"Functions are not supported for {clause.field}")
+        negated = clause.operator in ("!=", "not in", "is not")
+
+        if clause.column == "key":
+            wanted = {store.row_of(value.upper()) for value in clause.values if value}
+            wanted.discard(None)
+            if negated:
+                return _ScanPlan(str(clause), len(store), lambda row: row not in wanted)
+            return _IndexPlan(str(clause), [{row} for row in wanted], wanted.__contains__)
+
+        if clause.column == "project":
+            index, project_of = self._project_index()
+            if negated:
+                # Like Jira, != and NOT IN never match empty values
+                names = set(index) - {self._fold_project(index, value) for value in clause.values}
+            else:
+                names = {self._fold_project(index, value) for value in clause.values}
+            names.discard(None)
+            return _IndexPlan(str(clause), [index[name] for name in names],
+                              lambda row: project_of(row) in names)
+
+        column = clause.column
+        index = store.indexes[column]
+        codes = {self._code(column, value) for value in clause.values}
+        codes.discard(-1)
+        if negated:
+            # Like Jira, != and NOT IN never match empty values
+            codes = set(index) - codes - {0}
+        postings = [index[code] for code in codes if code in index]
+        values = store.columns[column]
+        return _IndexPlan(str(clause), postings, lambda row: values[row] in codes)
+
+    def _plan_time(self, clause: Clause, now: float) -> _Plan:
+        """Range and EMPTY clauses on created, updated and resolved"""
+        store = self.store
+        values = store.times[clause.column]
+        if clause.operator in ("is", "is not"):
+            empty = clause.operator == "is"
+            return _ScanPlan(str(clause), len(store), lambda row: math.isnan(values[row]) == empty)
+
+        bound = resolve_time(clause.values[0], now)
+        low, high = -math.inf, math.inf
+        if clause.operator == ">":
+            low = math.nextafter(bound, math.inf)
+        elif clause.operator == ">=":
+            low = bound
+        elif clause.operator == "<":
+            high = bound
+        else:
+            high = math.nextafter(bound, math.inf)
+        return _RangePlan(str(clause), store, clause.column, low, high)
+
+    def _plan_scan(self, clause: Clause) -> _Plan:
+        """Clauses on labels and summary, checked row by row"""
+        store = self.store
+        if clause.column == "labels":
+            labels = store.labels
+            wanted = {value.lower() for value in clause.values if value}
+            if clause.operator in ("is", "is not"):
+                empty = clause.operator == "is"
+                test = lambda row: (not labels[row]) == empty
+            elif clause.operator in ("=", "in"):
+                test = lambda row: any(label.lower() in wanted for label in labels[row])
+            else:
+                test = lambda row: not any(label.lower() in wanted for label in labels[row])
+            return _ScanPlan(str(clause), len(store), test)
+
+        summaries = store.summaries
+        if clause.operator in ("is", "is not"):
+            empty = clause.operator == "is"
+            return _ScanPlan(str(clause), len(store), lambda row: (not summaries[row]) == empty)
+        words = (clause.values[0] or "").lower().split()
+        contains = lambda row: all(word in (summaries[row] or "").lower() for word in words)
+        if clause.operator == "~":
+            return _ScanPlan(str(clause), len(store), contains)
+        return _ScanPlan(str(clause), len(store), lambda row: not contains(row))
+
+    def _code(self, column: str, value: Optional[str]) -> int:
+        """Code of a value compared case-insensitively, or -1 if no issue holds it"""
+        if value is None:
+            return 0
+        pool = self.store.pools[column]
+        code = pool.code(value)
+        if code is not None:
+            return code
+        cached = self._folded.get(column)
+        if cached is None or cached[0] != len(pool):
+            folded = {name.lower(): code for name, code in pool.codes.items()}
+            cached = self._folded[column] = (len(pool), folded)
+        folded = cached[1]
+        code = folded.get(value.lower())
+        if code is None and column == "status_category":
+            code = pool.code(STATUS_CATEGORY_NAMES.get(value.lower()))
+        return -1 if code is None else code
+
+    def _project_index(self) -> Tuple[Dict[str, Set[int]], Callable[[int], str]]:
+        """Rows per project key, derived from the issue keys"""
+        keys = self.store.keys
+        if self._projects[0] != len(keys):
+            index: Dict[str, Set[int]] = {}
+            for row, key in enumerate(keys):
+                index.setdefault(key.rsplit("-", 1)[0], set()).add(row)
+            self._projects = (len(keys), index)
+        return self._projects[1], lambda row: keys[row].rsplit("-", 1)[0]
+
+    @staticmethod
+    def _fold_project(index: Dict[str, Set[int]], value: Optional[str]) -> Optional[str]:
+        """Project key as stored, matched case-insensitively"""
+        if value is None:
+            return None
+        upper = value.upper()
+        return upper if upper in index else None
+
+    def _sort(self, rows: List[int], column: str, descending: bool):
+        """Stable in-place sort by one column; issues without a value always go last"""
+        store = self.store
+        if column in TIME_COLUMNS:
+            values = store.times[column]
+            present = lambda row: not math.isnan(values[row])
+            value = lambda row: values[row] if present(row) else 0.0
+        elif column in ("key", "project"):
+            def value(row):
+                project, _, number = store.keys[row].rpartition("-")
+                return (project, int(number)) if column == "key" and number.isdigit() else (project, 0)
+            present = lambda row: True
+        elif column == "summary":
+            summaries = store.summaries
+            present = lambda row: summaries[row] is not None
+            value = lambda row: (summaries[row] or "").lower()
+        else:
+            codes = store.columns[column]
+            names = store.pools[column].values
+            present = lambda row: codes[row] != 0
+            if column == "priority":
+                value = lambda row: (PRIORITY_RANKS.get((names[codes[row]] or "").lower(), -1),
+                                     (names[codes[row]] or "").lower())
+            else:
+                value = lambda row: (names[codes[row]] or "").lower()
+        if descending:
+            rows.sort(key=lambda row: (present(row), value(row)), reverse=True)
+        else:
+            rows.sort(key=lambda row: (not present(row), value(row)))
+
+
+def main():
+    """Run a JQL query against the local mirror"""
+    parser = argparse.ArgumentParser(description="Run JQL queries against the locally synced issues")
+    parser.add_argument("jql", help="Query in the supported JQL subset")
+    parser.add_argument("--db", type=Path, help="Mirror database file")
+    parser.add_argument("--sync", action="store_true", help="Run an incremental mirror sync first")
+    parser.add_argument("--explain", action="store_true", help="Show the query plan instead of the issues")
+    parser.add_argument("--count", action="store_true", help="Only print the number of matching issues")
+    parser.add_argument("--limit", type=int, default=50, help="Maximum number of issues to print")
+    args = parser.parse_args()
+
+    # Imported here so the engine itself does not depend on the Jira client
+    from issue_mirror import IssueMirror, MIRROR_DB
+    import requests
+    from jira_integration import JiraAPI, JiraAPIError
+
+    project_key = os.getenv("JIRA_PROJECT_KEY")
+    if not project_key:
+        print("Please set JIRA_PROJECT_KEY in your .env file.")
+        sys.exit(1)
+
+    with IssueMirror(project_key, args.db or MIRROR_DB) as mirror:
+        if args.sync:
+            try:
+                mirror.sync(JiraAPI())
+            except ValueError as e:
+                print(f"Error initializing Jira API: {e}")
+                sys.exit(1)
+            except (JiraAPIError, requests.RequestException) as e:
+                print(f"Sync failed, mirror unchanged: {e}")
+                sys.exit(1)
+        engine = LocalJQL.from_mirror(mirror)
+
+    if not len(engine.store):
+        print("The mirror is empty; run 'python issue_mirror.py sync' first or pass --sync.")
+        sys.exit(1)
+
+    try:
+        if args.explain:
+            for line in engine.explain(args.jql):
+                print(line)
+        elif args.count:
+            print(engine.count(args.jql))
+        else:
+            for record in engine.search(args.jql, args.limit):
+                print(f"{record.key}: {record.summary} - {record.status}")
+    except ValueError as e:
+        print(f"Invalid query: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
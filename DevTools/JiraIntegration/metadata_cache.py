@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+BetterWYD Jira Metadata Cache
+
+On-disk cache for Jira metadata that almost never changes (issue types,
+create metadata, workflow transitions), shared by all the integration scripts
+so hook and setup runs can skip those round trips.
+
+Features:
+- Per-entry time-to-live
+- LRU eviction once the cache holds more than max_entries (reads count as
+  uses; expired entries are purged first)
+- Explicit invalidation of single keys or key prefixes
+- Atomic writes (safe if a hook is interrupted mid-save) that merge with the
+  entries other processes saved in the meantime
+
+Keys are built from parts with make_key(), e.g.
+    make_key(jira_url, "transitions", project_key, issue_type, status)
+
+Usage:
+    python metadata_cache.py --list
+    python metadata_cache.py --clear                 # drop everything
+    python metadata_cache.py --clear transitions     # drop every 'transitions' entry
+"""
+
+import os
+import json
+import time
+import argparse
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: saves still merge, without the inter-process lock
+    fcntl = None
+
+# Get the script directory
+SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+
+# Default cache file (inside the shared local state directory)
+METADATA_CACHE_FILE = Path(os.getenv("JIRA_CACHE_DIR") or SCRIPT_DIR / '.jira_cache') / 'metadata_cache.json'
+
+# Metadata is refreshed once a day unless invalidated earlier
+DEFAULT_TTL = float(os.getenv("JIRA_METADATA_TTL", 24 * 60 * 60))
+DEFAULT_MAX_ENTRIES = 512
+
+KEY_SEPARATOR = "|"
+
+
+def make_key(*parts: Any) -> str:
+    """
+    Build a cache key from its parts
+
+    Args:
+        *parts: Key components (site, kind, project, issue type, status, ...)
+
+    Returns:
+        The cache key
+    """
+    return KEY_SEPARATOR.join("" if part is None else str(part) for part in parts)
+
+
+class MetadataCache:
+    """Persistent key/value cache with per-entry TTL and an LRU size cap"""
+
+    def __init__(self, path: Path = METADATA_CACHE_FILE, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 default_ttl: float = DEFAULT_TTL):
+        """
+        Initialize the cache (the file is read lazily on first use)
+
+        Args:
+            path: JSON file holding the cache
+            max_entries: Maximum number of entries kept (least recently used are evicted)
+            default_ttl: Default time-to-live in seconds
+        """
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self._entries: Optional[OrderedDict] = None
+        # Changes made by this process since the file was read, replayed onto
+        # the current file contents at save time
+        self._written = set()
+        self._used = set()
+        self._removed = set()
+        self._cleared = False
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _read(self) -> OrderedDict:
+        """Read the entries currently stored in the cache file"""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return OrderedDict(json.load(f))
+        except (OSError, ValueError):
+            return OrderedDict()
+
+    def _load(self) -> OrderedDict:
+        """Read the cache file (once)"""
+        if self._entries is None:
+            self._entries = self._read()
+        return self._entries
+
+    def _merge(self) -> OrderedDict:
+        """
+        Replay this process's changes onto the current file contents
+
+        Other processes (hooks, setup scripts) share the file, so entries they
+        saved since it was read are kept instead of being overwritten.
+        """
+        merged = OrderedDict() if self._cleared else self._read()
+        for key in self._removed:
+            merged.pop(key, None)
+        for key in self._written:
+            if key in self._entries:
+                merged[key] = self._entries[key]
+        for key in self._used - self._written:
+            if key in merged and key in self._entries:
+                merged[key]["used_at"] = max(merged[key].get("used_at", 0),
+                                             self._entries[key].get("used_at", 0))
+        self._evict(merged)
+        return merged
+
+    def _evict(self, entries: OrderedDict):
+        """Purge expired entries, then the least recently used beyond max_entries"""
+        now = time.time()
+        for key in [key for key, entry in entries.items() if entry["expires_at"] < now]:
+            del entries[key]
+        excess = len(entries) - self.max_entries
+        if excess > 0:
+            by_use = sorted(entries, key=lambda key: entries[key].get("used_at", 0))
+            for key in by_use[:excess]:
+                del entries[key]
+
+    def _save(self):
+        """Merge with the cache file and write it atomically"""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path.with_suffix(".lock"), "a") as lock_file:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+                self._entries = self._merge()
+                tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(self._entries, f)
+                os.replace(tmp_path, self.path)
+            self._written.clear()
+            self._used.clear()
+            self._removed.clear()
+            self._cleared = False
+        except OSError as e:
+            print(f"Could not write metadata cache {self.path}: {e}")
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a cached value
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached value, or None if missing or expired
+        """
+        with self._lock:
+            entries = self._load()
+            entry = entries.get(key)
+            now = time.time()
+            if entry is None or entry["expires_at"] < now:
+                self.misses += 1
+                return None
+            # Recorded as a use, and written back with the next save
+            entry["used_at"] = now
+            self._used.add(key)
+            self.hits += 1
+            return entry["value"]
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        """
+        Store a value
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+            ttl: Time-to-live in seconds (defaults to default_ttl)
+        """
+        with self._lock:
+            entries = self._load()
+            now = time.time()
+            entries[key] = {
+                "value": value,
+                "expires_at": now + (self.default_ttl if ttl is None else ttl),
+                "used_at": now
+            }
+            self._written.add(key)
+            self._removed.discard(key)
+            self._evict(entries)
+            self._save()
+
+    def get_or_fetch(self, key: str, fetch: Callable[[], Any], ttl: Optional[float] = None) -> Any:
+        """
+        Get a cached value, or fetch and store it on a miss
+
+        Empty results (None, [] or {}) are returned but not cached, so a failed
+        request is retried on the next call.
+
+        Args:
+            key: Cache key
+            fetch: Function returning the fresh value
+            ttl: Time-to-live in seconds for a fetched value
+
+        Returns:
+            The cached or freshly fetched value
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+        value = fetch()
+        if value:
+            self.set(key, value, ttl)
+        return value
+
+    def invalidate(self, prefix: Optional[str] = None) -> int:
+        """
+        Drop cache entries
+
+        Prefixes match whole key parts, so make_key(site, "transitions", "BWYD")
+        drops the BWYD transitions but not those of a project called BWYD2.
+
+        Args:
+            prefix: Exact key, or leading key parts (see make_key); None drops everything
+
+        Returns:
+            Number of entries removed
+        """
+        if prefix is None:
+            return self._drop(lambda key: True, clear=True)
+        if not prefix.endswith(KEY_SEPARATOR):
+            return self._drop(lambda key: key == prefix or key.startswith(prefix + KEY_SEPARATOR))
+        return self._drop(lambda key: key.startswith(prefix))
+
+    def invalidate_kind(self, kind: str) -> int:
+        """
+        Drop every entry of one kind of metadata, for any site and project
+
+        Args:
+            kind: Key part naming the metadata (e.g. 'transitions', 'createmeta')
+
+        Returns:
+            Number of entries removed
+        """
+        return self._drop(lambda key: kind in key.split(KEY_SEPARATOR))
+
+    def _drop(self, matches: Callable[[str], bool], clear: bool = False) -> int:
+        """Remove the entries whose keys match and save the cache"""
+        with self._lock:
+            entries = self._load()
+            doomed = [key for key in entries if matches(key)]
+            for key in doomed:
+                del entries[key]
+            self._removed.update(doomed)
+            self._written.difference_update(doomed)
+            self._cleared = self._cleared or clear
+            if doomed or clear:
+                self._save()
+            return len(doomed)
+
+    def keys(self):
+        """List the keys of entries that have not expired"""
+        with self._lock:
+            now = time.time()
+            return [key for key, entry in self._load().items() if entry["expires_at"] >= now]
+
+
+def main():
+    """Inspect or clear the metadata cache"""
+    parser = argparse.ArgumentParser(description="Inspect or clear the Jira metadata cache")
+    parser.add_argument("--path", type=Path, default=METADATA_CACHE_FILE, help="Cache file")
+    parser.add_argument("--list", action="store_true", help="List cached keys")
+    parser.add_argument("--clear", nargs="?", const="", metavar="KIND",
+                        help="Remove all entries, or only one kind (issuetypes, createmeta, transitions)")
+    args = parser.parse_args()
+
+    cache = MetadataCache(args.path)
+    if args.clear is not None:
+        removed = cache.invalidate_kind(args.clear) if args.clear else cache.invalidate()
+        print(f"Removed {removed} cache entries")
+    if args.list or args.clear is None:
+        for key in cache.keys():
+            print(key)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,682 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+BetterWYD Mock Jira Server
+
+A small in-memory stand-in for the Jira Cloud REST API v3, used to benchmark and
+exercise the Jira integration scripts without a live Atlassian site.
+
+Features:
+- HTTP/1.1 keep-alive server (one thread per connection)
+- Simulated per-connection handshake cost and per-request latency
+- Search page size cap, like Jira Cloud's server-side limit
+- HTTP 429 throttling: a server-side rate limit and/or randomly injected 429s,
+  both with a Retry-After header
+- In-memory issues with comments and a small To Do -> In Progress -> In Review -> Done workflow
+- Status changelogs (search expand=changelog and /issue/{key}/changelog)
+- Synthetic projects of any size for benchmarks (--seed-issues)
+- Connection, request and throttle counters for benchmarks
+
+Usage:
+    python mock_jira_server.py --port 8089 --connection-latency 0.03
+    python mock_jira_server.py --seed-issues 5000 --page-cap 100 --rate-limit 50
+
+Then point the scripts at it:
+    JIRA_URL=http://127.0.0.1:8089 python jira_integration.py
+
+"""
+
+import re
+import json
+import math
+import time
+import random
+import argparse
+import threading
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Any, Optional, Tuple
+from urllib.parse import urlparse, parse_qs
+
+# Issue types offered by the mock project
+MOCK_ISSUE_TYPES = [
+    {"id": "10000", "name": "Epic", "subtask": False, "description": "A big user story"},
+    {"id": "10001", "name": "Story", "subtask": False, "description": "A user story"},
+    {"id": "10002", "name": "Task", "subtask": False, "description": "A task"},
+    {"id": "10003", "name": "Subtask", "subtask": True, "description": "A sub-task"},
+]
+
+# Workflow statuses and the transitions available from each of them
+MOCK_STATUSES = {
+    "To Do": {"id": "1", "category": "new"},
+    "In Progress": {"id": "3", "category": "indeterminate"},
+    "In Review": {"id": "4", "category": "indeterminate"},
+    "Done": {"id": "5", "category": "done"},
+}
+# (transition id, transition name, target status); like Jira's default
+# workflows, transitions are named after the status they lead to
+MOCK_WORKFLOW = {
+    "To Do": [("21", "In Progress", "In Progress")],
+    "In Progress": [("31", "In Review", "In Review"), ("11", "To Do", "To Do")],
+    "In Review": [("41", "Done", "Done"), ("21", "In Progress", "In Progress")],
+    "Done": [("11", "To Do", "To Do")],
+}
+
+
+def _now() -> str:
+    """Current time in Jira's timestamp format"""
+    return _timestamp(datetime.now(timezone.utc))
+
+
+def _timestamp(moment: datetime) -> str:
+    """Format a UTC datetime in Jira's timestamp format"""
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.000+0000")
+
+
+def _status_payload(name: str) -> Dict[str, Any]:
+    """Build a Jira status object"""
+    status = MOCK_STATUSES[name]
+    return {"id": status["id"], "name": name, "statusCategory": {"key": status["category"]}}
+
+
+class MockJiraState:
+    """In-memory project data shared by all request handler threads"""
+
+    def __init__(self, project_key: str = "BWYD"):
+        self.project_key = project_key
+        self.lock = threading.Lock()
+        self.issues: Dict[str, Dict[str, Any]] = {}
+        self.comments: Dict[str, List[Dict[str, Any]]] = {}
+        self.histories: Dict[str, List[Dict[str, Any]]] = {}
+        self.next_id = 10000
+        self.next_history_id = 1
+        self.connections = 0
+        self.requests = 0
+        self.throttled = 0
+
+    def reset_counters(self):
+        """Reset the connection, request and throttle counters"""
+        with self.lock:
+            self.connections = 0
+            self.requests = 0
+            self.throttled = 0
+
+    def add_issue(self, fields: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Store a new issue
+
+        Args:
+            fields: Issue fields as sent by the client
+
+        Returns:
+            The stored issue
+        """
+        with self.lock:
+            self.next_id += 1
+            issue_id = str(self.next_id)
+            key = f"{self.project_key}-{len(self.issues) + 1}"
+
+            issue_type = fields.get("issuetype") or {"name": "Task"}
+            type_info = next(
+                (t for t in MOCK_ISSUE_TYPES
+                 if t["id"] == issue_type.get("id") or t["name"] == issue_type.get("name")),
+                MOCK_ISSUE_TYPES[2]
+            )
+
+            now = _now()
+            stored_fields = dict(fields)
+            stored_fields.update({
+                "project": {"key": self.project_key},
+                "issuetype": dict(type_info),
+                "status": _status_payload("To Do"),
+                "assignee": fields.get("assignee"),
+                "priority": fields.get("priority") or {"name": "Medium"},
+                "labels": fields.get("labels", []),
+                "created": now,
+                "updated": now,
+            })
+            if "parent" in fields:
+                stored_fields["parent"] = {"key": fields["parent"].get("key")}
+
+            issue = {"id": issue_id, "key": key, "fields": stored_fields}
+            self.issues[key] = issue
+            self.histories[key] = []
+            return issue
+
+    def set_status(self, key: str, name: str, when: Optional[str] = None):
+        """
+        Move an issue to a status and record the change in its changelog
+
+        The caller holds the lock.
+
+        Args:
+            key: Issue key
+            name: Target status name
+            when: Timestamp of the change (defaults to now)
+        """
+        issue = self.issues[key]
+        old = issue["fields"]["status"]
+        if old["name"] == name:
+            return
+        when = when or _now()
+        self.histories[key].append({
+            "id": str(self.next_history_id),
+            "author": {"displayName": "Mock User"},
+            "created": when,
+            "items": [{"field": "status", "fieldtype": "jira", "from": old["id"], "fromString": old["name"],
+                       "to": MOCK_STATUSES[name]["id"], "toString": name}],
+        })
+        self.next_history_id += 1
+        issue["fields"]["status"] = _status_payload(name)
+        issue["fields"]["updated"] = when
+
+    def seed_issues(self, count: int, seed: int = 0, description_words: int = 40) -> List[str]:
+        """
+        Fill the project with synthetic issues
+
+        Every tenth issue is an epic; the others are stories, tasks and
+        sub-tasks spread over the workflow statuses, with a few assignees.
+        Issues are created up to 120 days ago and their changelogs walk the
+        workflow to their status, sometimes sending a review back to work.
+
+        Args:
+            count: Number of issues to create
+            seed: Random seed (the same seed gives the same project)
+            description_words: Length of each issue's description
+
+        Returns:
+            Keys of the created issues
+        """
+        rng = random.Random(seed)
+        history_rng = random.Random(seed + 1)
+        now = datetime.now(timezone.utc)
+        statuses = list(MOCK_STATUSES)
+        assignees = [None, {"displayName": "Ana"}, {"displayName": "Bo"}, {"displayName": "Chen"}]
+        words = ["drop", "table", "guild", "mob", "spawn", "item", "refine", "quest", "packet", "server"]
+        keys = []
+        epic_key = None
+        for index in range(count):
+            if index % 10 == 0:
+                issue_type = {"name": "Epic"}
+            else:
+                issue_type = {"name": rng.choice(["Story", "Task", "Task", "Subtask"])}
+            text = " ".join(rng.choice(words) for _ in range(description_words))
+            fields = {
+                "summary": f"Synthetic issue {index + 1}",
+                "description": {"type": "doc", "version": 1, "content": [
+                    {"type": "paragraph", "content": [{"type": "text", "text": text}]}
+                ]},
+                "issuetype": issue_type,
+                "assignee": rng.choice(assignees),
+            }
+            if epic_key and issue_type["name"] != "Epic":
+                fields["parent"] = {"key": epic_key}
+            issue = self.add_issue(fields)
+            if issue_type["name"] == "Epic":
+                epic_key = issue["key"]
+            target = rng.choice(statuses)
+
+            created = now - timedelta(days=history_rng.uniform(1, 120))
+            path = statuses[1:statuses.index(target) + 1]
+            if target == "Done" and history_rng.random() < 0.2:
+                path[2:2] = ["In Progress", "In Review"]
+            span = (now - created).total_seconds()
+            moments = sorted(history_rng.uniform(0, span) for _ in path)
+            with self.lock:
+                issue["fields"]["created"] = _timestamp(created)
+                for name, offset in zip(path, moments):
+                    self.set_status(issue["key"], name, _timestamp(created + timedelta(seconds=offset)))
+                issue["fields"]["updated"] = _now()
+            keys.append(issue["key"])
+        return keys
+
+    def touch(self, key: str):
+        """Bump the updated timestamp of an issue"""
+        self.issues[key]["fields"]["updated"] = _now()
+
+    def search(self, jql: str) -> List[Dict[str, Any]]:
+        """
+        Evaluate a very small JQL subset: AND-joined `field = value` clauses
+        and an optional `ORDER BY key|created|updated [ASC|DESC]`
+
+        Args:
+            jql: JQL query string
+
+        Returns:
+            Matching issues in ORDER BY order (newest first without one)
+        """
+        parts = re.split(r"\s+ORDER\s+BY\s+", jql, maxsplit=1, flags=re.IGNORECASE)
+        where = parts[0]
+        clauses = [c.strip() for c in re.split(r"\s+AND\s+", where, flags=re.IGNORECASE) if c.strip()]
+
+        with self.lock:
+            issues = list(self.issues.values())
+
+        for clause in clauses:
+            match = re.match(r'(\w+)\s*(>=|<=|!=|=|>|<)\s*"?([^"]*)"?$', clause)
+            if not match:
+                continue
+            field, op, value = match.groups()
+            issues = [i for i in issues if self._matches(i, field.lower(), op, value)]
+
+        order = re.match(r"(\w+)(?:\s+(ASC|DESC))?", parts[1].strip(), re.IGNORECASE) if len(parts) > 1 else None
+        field = order.group(1).lower() if order else "key"
+        descending = (order.group(2) or "ASC").upper() == "DESC" if order else True
+        if field in ("created", "updated"):
+            # Timestamps share one format, so they sort as strings; ties by id
+            return sorted(issues, key=lambda i: (i["fields"][field], int(i["id"])), reverse=descending)
+        return sorted(issues, key=lambda i: int(i["id"]), reverse=descending)
+
+    def _matches(self, issue: Dict[str, Any], field: str, op: str, value: str) -> bool:
+        """Check a single JQL clause against an issue"""
+        fields = issue["fields"]
+        if field == "project":
+            actual = self.project_key
+        elif field == "status":
+            actual = fields["status"]["name"]
+        elif field in ("issuetype", "type"):
+            actual = fields["issuetype"]["name"]
+        elif field == "labels":
+            return (value in fields.get("labels", [])) == (op == "=")
+        elif field in ("updated", "created"):
+            # Compare on minute granularity, like Jira does
+            actual = fields[field][:16].replace("T", " ")
+            value = value.replace("/", "-")[:16]
+        else:
+            return True
+
+        if op == "=":
+            return actual.lower() == value.lower()
+        if op == "!=":
+            return actual.lower() != value.lower()
+        if op == ">=":
+            return actual >= value
+        if op == ">":
+            return actual > value
+        if op == "<=":
+            return actual <= value
+        return actual < value
+
+
+class MockJiraHandler(BaseHTTPRequestHandler):
+    """Request handler emulating the subset of Jira REST API v3 used by the scripts"""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "MockJira/1.0"
+    # Headers and body are written separately; avoid Nagle/delayed-ACK stalls
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        """Called once per accepted connection: emulate the TCP/TLS handshake cost"""
+        super().setup()
+        with self.server.state.lock:
+            self.server.state.connections += 1
+        if self.server.connection_latency:
+            time.sleep(self.server.connection_latency)
+
+    def log_message(self, format, *args):
+        """Keep the console quiet unless verbose logging is enabled"""
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    # Route table: (method, path regex, handler name)
+    ROUTES = [
+        ("GET", r"/rest/api/3/myself$", "handle_myself"),
+        ("GET", r"/rest/api/3/issuetype$", "handle_issue_types"),
+        ("GET", r"/rest/api/3/issue/createmeta$", "handle_createmeta"),
+        ("POST", r"/rest/api/3/search$", "handle_search"),
+        ("GET", r"/rest/api/3/project/(?P<key>[^/]+)/statuses$", "handle_project_statuses"),
+        ("POST", r"/rest/api/3/issue$", "handle_create_issue"),
+        ("POST", r"/rest/api/3/issue/bulk$", "handle_bulk_create"),
+        ("GET", r"/rest/api/3/issue/(?P<key>[^/]+)/transitions$", "handle_get_transitions"),
+        ("GET", r"/rest/api/3/issue/(?P<key>[^/]+)/changelog$", "handle_get_changelog"),
+        ("POST", r"/rest/api/3/issue/(?P<key>[^/]+)/transitions$", "handle_do_transition"),
+        ("POST", r"/rest/api/3/issue/(?P<key>[^/]+)/comment$", "handle_add_comment"),
+        ("GET", r"/rest/api/3/issue/(?P<key>[^/]+)$", "handle_get_issue"),
+        ("PUT", r"/rest/api/3/issue/(?P<key>[^/]+)$", "handle_update_issue"),
+    ]
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def _dispatch(self, method: str):
+        """Route a request to its handler and write the response"""
+        with self.server.state.lock:
+            self.server.state.requests += 1
+        if self.server.latency:
+            time.sleep(self.server.latency)
+
+        retry_after = self.server.throttle()
+        if retry_after is not None:
+            self._read_body()
+            with self.server.state.lock:
+                self.server.state.throttled += 1
+            self._send(429, {"errorMessages": ["Rate limit exceeded."]}, {"Retry-After": f"{retry_after:g}"})
+            return
+
+        parsed = urlparse(self.path)
+        self.query = {k: v[-1] for k, v in parse_qs(parsed.query).items()}
+        self.body = self._read_body()
+
+        for route_method, pattern, handler_name in self.ROUTES:
+            match = re.match(pattern, parsed.path)
+            if route_method == method and match:
+                status, payload = getattr(self, handler_name)(**match.groupdict())
+                self._send(status, payload)
+                return
+
+        self._send(404, {"errorMessages": [f"No route for {method} {parsed.path}"]})
+
+    def _read_body(self) -> Any:
+        """Read and decode the JSON request body, if any"""
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return None
+        raw = self.rfile.read(length)
+        try:
+            return json.loads(raw)
+        except ValueError:
+            return None
+
+    def _send(self, status: int, payload: Any, headers: Optional[Dict[str, str]] = None):
+        """Write a JSON response (or an empty body for 204)"""
+        data = b"" if payload is None else json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if self.headers.get("Connection", "").lower() == "close":
+            self.send_header("Connection", "close")
+            self.close_connection = True
+        self.end_headers()
+        self.wfile.write(data)
+
+    # ---- Handlers ---------------------------------------------------------
+
+    def handle_myself(self) -> Tuple[int, Any]:
+        return 200, {"accountId": "mock-account", "displayName": "Mock User"}
+
+    def handle_issue_types(self) -> Tuple[int, Any]:
+        return 200, MOCK_ISSUE_TYPES
+
+    def handle_createmeta(self) -> Tuple[int, Any]:
+        state = self.server.state
+        return 200, {"projects": [{"key": state.project_key, "issuetypes": MOCK_ISSUE_TYPES}]}
+
+    def handle_project_statuses(self, key: str) -> Tuple[int, Any]:
+        if key != self.server.state.project_key:
+            return 404, {"errorMessages": [f"No project could be found with key '{key}'."]}
+        statuses = [{"id": status["id"], "name": name} for name, status in MOCK_STATUSES.items()]
+        return 200, [dict(issue_type, statuses=statuses) for issue_type in MOCK_ISSUE_TYPES]
+
+    def handle_search(self) -> Tuple[int, Any]:
+        body = self.body or {}
+        start_at = int(body.get("startAt", 0))
+        max_results = min(int(body.get("maxResults", 50)), self.server.page_cap)
+        if self.server.on_search:
+            self.server.on_search(start_at)
+        failure = self.server.search_failures.get(start_at)
+        if failure and max_results:
+            return failure, {"errorMessages": [f"Injected failure at startAt={start_at}"]}
+
+        matches = self.server.state.search(body.get("jql", ""))
+        page = matches[start_at:start_at + max_results]
+
+        requested = body.get("fields")
+        expand = body.get("expand") or ""
+        expand = expand if isinstance(expand, list) else expand.split(",")
+        issues = []
+        for issue in page:
+            fields = issue["fields"]
+            if requested:
+                fields = {name: fields.get(name) for name in requested}
+            hit = {"id": issue["id"], "key": issue["key"], "fields": fields}
+            if "changelog" in expand:
+                # Like Jira, only the first page of each changelog is embedded
+                histories = self.server.state.histories.get(issue["key"], [])
+                hit["changelog"] = {"startAt": 0, "maxResults": self.server.changelog_cap,
+                                    "total": len(histories), "histories": histories[:self.server.changelog_cap]}
+            issues.append(hit)
+
+        return 200, {
+            "startAt": start_at,
+            "maxResults": max_results,
+            "total": len(matches),
+            "issues": issues
+        }
+
+    def handle_create_issue(self) -> Tuple[int, Any]:
+        fields = (self.body or {}).get("fields") or {}
+        if not fields.get("summary"):
+            return 400, {"errors": {"summary": "You must specify a summary of the issue."}}
+        issue = self.server.state.add_issue(fields)
+        return 201, {"id": issue["id"], "key": issue["key"], "self": f"/rest/api/3/issue/{issue['id']}"}
+
+    def handle_bulk_create(self) -> Tuple[int, Any]:
+        updates = (self.body or {}).get("issueUpdates") or []
+        if len(updates) > 50:
+            return 400, {"errorMessages": ["The number of issues to create exceeds the limit of 50."]}
+
+        created = []
+        errors = []
+        for index, update in enumerate(updates):
+            fields = update.get("fields") or {}
+            if not fields.get("summary"):
+                errors.append({
+                    "status": 400,
+                    "elementErrors": {"errorMessages": [], "errors": {"summary": "You must specify a summary of the issue."}},
+                    "failedElementNumber": index
+                })
+                continue
+            if fields.get("parent") and fields["parent"].get("key") not in self.server.state.issues:
+                errors.append({
+                    "status": 400,
+                    "elementErrors": {"errorMessages": [], "errors": {"parent": "Could not find issue by id or key."}},
+                    "failedElementNumber": index
+                })
+                continue
+            issue = self.server.state.add_issue(fields)
+            created.append({"id": issue["id"], "key": issue["key"], "self": f"/rest/api/3/issue/{issue['id']}"})
+
+        return (201 if created else 400), {"issues": created, "errors": errors}
+
+    def _find_issue(self, key: str) -> Optional[Dict[str, Any]]:
+        return self.server.state.issues.get(key)
+
+    def handle_get_issue(self, key: str) -> Tuple[int, Any]:
+        issue = self._find_issue(key)
+        if not issue:
+            return 404, {"errorMessages": ["Issue does not exist or you do not have permission to see it."]}
+        fields = issue["fields"]
+        if self.query.get("fields"):
+            fields = {name: fields.get(name) for name in self.query["fields"].split(",")}
+        payload = {"id": issue["id"], "key": issue["key"], "fields": fields}
+        if "transitions" in self.query.get("expand", ""):
+            payload["transitions"] = self._transitions_for(issue)
+        return 200, payload
+
+    def handle_get_changelog(self, key: str) -> Tuple[int, Any]:
+        if not self._find_issue(key):
+            return 404, {"errorMessages": ["Issue does not exist or you do not have permission to see it."]}
+        histories = self.server.state.histories.get(key, [])
+        start_at = int(self.query.get("startAt", 0))
+        max_results = min(int(self.query.get("maxResults", 100)), self.server.changelog_cap)
+        values = histories[start_at:start_at + max_results]
+        return 200, {"startAt": start_at, "maxResults": max_results, "total": len(histories),
+                     "isLast": start_at + len(values) >= len(histories), "values": values}
+
+    def handle_update_issue(self, key: str) -> Tuple[int, Any]:
+        issue = self._find_issue(key)
+        if not issue:
+            return 404, {"errorMessages": ["Issue does not exist or you do not have permission to see it."]}
+        with self.server.state.lock:
+            issue["fields"].update((self.body or {}).get("fields") or {})
+            self.server.state.touch(key)
+        return 204, None
+
+    def handle_add_comment(self, key: str) -> Tuple[int, Any]:
+        if not self._find_issue(key):
+            return 404, {"errorMessages": ["Issue does not exist or you do not have permission to see it."]}
+        with self.server.state.lock:
+            comments = self.server.state.comments.setdefault(key, [])
+            comment = {"id": str(len(comments) + 1), "body": (self.body or {}).get("body"), "created": _now()}
+            comments.append(comment)
+            self.server.state.touch(key)
+        return 201, comment
+
+    def _transitions_for(self, issue: Dict[str, Any]) -> List[Dict[str, Any]]:
+        current = issue["fields"]["status"]["name"]
+        return [
+            {"id": transition_id, "name": name, "to": _status_payload(target)}
+            for transition_id, name, target in MOCK_WORKFLOW[current]
+        ]
+
+    def handle_get_transitions(self, key: str) -> Tuple[int, Any]:
+        issue = self._find_issue(key)
+        if not issue:
+            return 404, {"errorMessages": ["Issue does not exist or you do not have permission to see it."]}
+        return 200, {"transitions": self._transitions_for(issue)}
+
+    def handle_do_transition(self, key: str) -> Tuple[int, Any]:
+        issue = self._find_issue(key)
+        if not issue:
+            return 404, {"errorMessages": ["Issue does not exist or you do not have permission to see it."]}
+        transition_id = ((self.body or {}).get("transition") or {}).get("id")
+        target = next((t["to"] for t in self._transitions_for(issue) if t["id"] == transition_id), None)
+        if not target:
+            return 400, {"errorMessages": [f"Transition id '{transition_id}' is not valid for this issue."]}
+        with self.server.state.lock:
+            self.server.state.set_status(key, target["name"])
+        return 204, None
+
+
+class MockJiraServer(ThreadingHTTPServer):
+    """Threaded mock Jira server that can run in the background of a benchmark"""
+
+    daemon_threads = True
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0,
+                 connection_latency: float = 0.0, page_cap: int = 100,
+                 project_key: str = "BWYD", verbose: bool = False, rate_limit: float = 0.0,
+                 throttle_rate: float = 0.0, retry_after: float = 1.0, seed: Optional[int] = None):
+        """
+        Create the server (port 0 picks a free port)
+
+        Args:
+            host: Interface to bind
+            port: Port to bind
+            latency: Seconds added to every request
+            connection_latency: Seconds added once per new connection (handshake cost)
+            page_cap: Maximum page size returned by search
+            project_key: Key of the mock project
+            verbose: Log every request to stderr
+            rate_limit: Requests per second accepted before answering 429 (0 = unlimited)
+            throttle_rate: Fraction of requests randomly answered with 429
+            retry_after: Retry-After seconds sent with injected 429s
+            seed: Random seed for the injected 429s
+        """
+        super().__init__((host, port), MockJiraHandler)
+        self.latency = latency
+        self.connection_latency = connection_latency
+        self.page_cap = page_cap
+        self.verbose = verbose
+        self.rate_limit = rate_limit
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        # Changelog entries per page (and embedded in search results)
+        self.changelog_cap = 100
+        # Injected search failures: startAt -> HTTP status answered for that
+        # page instead of results (count-only searches are still answered)
+        self.search_failures: Dict[int, int] = {}
+        # Called with each search's startAt before it is answered (lets tests
+        # change issues between the pages of a search)
+        self.on_search: Optional[Callable[[int], None]] = None
+        self.state = MockJiraState(project_key)
+        self._thread = None
+        self._random = random.Random(seed)
+        self._throttle_lock = threading.Lock()
+        # Server-side token bucket: one second's worth of burst
+        self._tokens = rate_limit
+        self._tokens_updated = time.monotonic()
+
+    def throttle(self) -> Optional[float]:
+        """
+        Decide whether to reject the current request with 429
+
+        Returns:
+            Seconds to send as Retry-After, or None to serve the request
+        """
+        with self._throttle_lock:
+            if self.throttle_rate and self._random.random() < self.throttle_rate:
+                return self.retry_after
+            if self.rate_limit:
+                now = time.monotonic()
+                self._tokens = min(self.rate_limit, self._tokens + (now - self._tokens_updated) * self.rate_limit)
+                self._tokens_updated = now
+                if self._tokens < 1:
+                    # Like Jira, only whole seconds
+                    return float(math.ceil((1 - self._tokens) / self.rate_limit))
+                self._tokens -= 1
+        return None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server"""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockJiraServer":
+        """Serve requests on a background thread"""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and release the socket"""
+        self.shutdown()
+        self.server_close()
+
+
+def main():
+    """Run the mock server in the foreground"""
+    parser = argparse.ArgumentParser(description="In-memory stand-in for the Jira REST API v3")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind")
+    parser.add_argument("--port", type=int, default=8089, help="Port to bind")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every request")
+    parser.add_argument("--connection-latency", type=float, default=0.0,
+                        help="Seconds added once per new connection (handshake cost)")
+    parser.add_argument("--page-cap", type=int, default=100, help="Maximum page size returned by search")
+    parser.add_argument("--project-key", default="BWYD", help="Key of the mock project")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    parser.add_argument("--rate-limit", type=float, default=0.0,
+                        help="Requests per second accepted before answering 429 (0 = unlimited)")
+    parser.add_argument("--throttle-rate", type=float, default=0.0,
+                        help="Fraction of requests randomly answered with 429")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After seconds for injected 429s")
+    parser.add_argument("--seed-issues", type=int, default=0, help="Create this many synthetic issues")
+    args = parser.parse_args()
+
+    server = MockJiraServer(args.host, args.port, args.latency, args.connection_latency,
+                            args.page_cap, args.project_key, args.verbose, args.rate_limit,
+                            args.throttle_rate, args.retry_after)
+    if args.seed_issues:
+        server.state.seed_issues(args.seed_issues)
+    print(f"Mock Jira server listening on {server.url} (project {args.project_key})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nStopping mock Jira server")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,424 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+BetterWYD Jira Report History
+
+Keeps every progress report as a timestamped snapshot in the issue mirror
+database, so trend questions are answered from stored snapshots instead of
+repeated full downloads.
+
+A new snapshot is computed incrementally: the mirror fetches only issues
+changed since the last sync, and the status and type counts of the previous
+snapshot are adjusted by how those issues changed (including which status
+moves happened in between). When the mirror was synced by something else in
+the meantime, the counts are taken from the mirror instead and the snapshot
+is marked as recounted.
+
+Usage:
+    python report_history.py snapshot [--full]
+    python report_history.py deltas [--last 5]
+    python report_history.py trend [--last 20] [--by issue_type]
+"""
+
+import os
+import sys
+import json
+import argparse
+import requests
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+# Get the script directory
+SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+
+# Add the JiraIntegration directory to the Python path
+sys.path.append(str(SCRIPT_DIR))
+
+from jira_integration import JiraAPI, JiraAPIError, build_progress_report
+from issue_mirror import IssueMirror, MIRROR_DB
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS report_snapshots (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    project TEXT NOT NULL,
+    taken_at TEXT NOT NULL,
+    high_water TEXT,
+    total_issues INTEGER NOT NULL,
+    completion_percentage REAL NOT NULL,
+    status_breakdown TEXT NOT NULL,
+    issue_type_breakdown TEXT NOT NULL,
+    transitions TEXT,
+    fetched INTEGER NOT NULL,
+    mode TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_report_snapshots_project ON report_snapshots (project, id);
+"""
+
+# Label for issues without a status or type (JSON object keys cannot be null)
+NO_VALUE = "(none)"
+
+# Characters of the text sparklines, lowest to highest
+SPARK_LEVELS = ".,:-=+*#"
+
+
+def _labelled(counts: Dict[Optional[str], int]) -> Dict[str, int]:
+    """Counts with None keys replaced by NO_VALUE and zero counts dropped"""
+    result: Dict[str, int] = {}
+    for name, count in counts.items():
+        if count:
+            label = NO_VALUE if name is None else name
+            result[label] = result.get(label, 0) + count
+    return result
+
+
+def sparkline(values: List[float]) -> str:
+    """
+    Draw a series as a one-line text chart
+
+    Args:
+        values: The series
+
+    Returns:
+        One character per value
+    """
+    if not values:
+        return ""
+    low, high = min(values), max(values)
+    span = (high - low) or 1.0
+    top = len(SPARK_LEVELS) - 1
+    return "".join(SPARK_LEVELS[round((value - low) / span * top)] if high > low else SPARK_LEVELS[top // 2]
+                   for value in values)
+
+
+def slope_per_week(times: List[float], values: List[float]) -> float:
+    """
+    Least-squares slope of a series
+
+    Args:
+        times: Epoch seconds of each value
+        values: The series
+
+    Returns:
+        Change per week, or 0.0 with fewer than two distinct times
+    """
+    count = len(values)
+    if count < 2:
+        return 0.0
+    mean_time = sum(times) / count
+    mean_value = sum(values) / count
+    variance = sum((t - mean_time) ** 2 for t in times)
+    if not variance:
+        return 0.0
+    covariance = sum((t - mean_time) * (v - mean_value) for t, v in zip(times, values))
+    return covariance / variance * 604800
+
+
+class ReportHistory:
+    """Progress report snapshots stored next to the issue mirror"""
+
+    def __init__(self, mirror: IssueMirror):
+        """
+        Args:
+            mirror: Open issue mirror; snapshots are stored in its database
+        """
+        self.mirror = mirror
+        self.conn = mirror.conn
+        self.conn.executescript(SCHEMA)
+
+    def snapshots(self, last: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Load stored snapshots
+
+        Args:
+            last: Only the most recent snapshots
+
+        Returns:
+            Snapshots, oldest first
+        """
+        query = "SELECT * FROM report_snapshots WHERE project = ? ORDER BY id DESC"
+        params: List[Any] = [self.mirror.project_key]
+        if last:
+            query += " LIMIT ?"
+            params.append(last)
+        rows = self.conn.execute(query, params).fetchall()
+        return [self._decode(row) for row in reversed(rows)]
+
+    def latest(self) -> Optional[Dict[str, Any]]:
+        """The most recent snapshot, or None if there is none"""
+        snapshots = self.snapshots(last=1)
+        return snapshots[0] if snapshots else None
+
+    @staticmethod
+    def _decode(row) -> Dict[str, Any]:
+        """Snapshot row as a report dictionary"""
+        return {
+            "id": row["id"],
+            "project_key": row["project"],
+            "timestamp": row["taken_at"],
+            "high_water": row["high_water"],
+            "total_issues": row["total_issues"],
+            "completion_percentage": row["completion_percentage"],
+            "status_breakdown": json.loads(row["status_breakdown"]),
+            "issue_type_breakdown": json.loads(row["issue_type_breakdown"]),
+            "transitions": json.loads(row["transitions"] or "[]"),
+            "fetched": row["fetched"],
+            "mode": row["mode"],
+        }
+
+    def take_snapshot(self, jira: JiraAPI, full: bool = False) -> Dict[str, Any]:
+        """
+        Sync the mirror and store a new progress report snapshot
+
+        Args:
+            jira: JiraAPI instance
+            full: Rebuild the mirror and count everything from scratch
+
+        Returns:
+            The snapshot (progress report plus 'id', 'transitions', 'fetched'
+            and 'mode': 'incremental', 'recounted' or 'full')
+
+        Raises:
+            JiraAPIError: If the mirror sync did not complete, or a full sync
+                          fetched fewer issues than the server reports; no
+                          snapshot is stored then
+        """
+        previous = self.latest()
+        state = self.mirror.get_sync_state()
+        # The previous counts are only a valid base if nothing else synced the mirror since
+        base_is_current = (previous is not None and state is not None
+                           and previous["high_water"] == state["high_water"])
+
+        full = full or previous is None or state is None or not state["high_water"]
+        expected_total = None
+        if full:
+            expected_total = jira.count_issues(f"project = {self.mirror.project_key}")
+            if expected_total is None:
+                raise JiraAPIError("Could not count the project's issues to check the full sync")
+
+        # Raises (leaving the mirror untouched) unless every issue was fetched
+        result = self.mirror.sync(jira, full=full, expected_total=expected_total)
+        if result["full"] and expected_total is not None and result["fetched"] < expected_total:
+            raise JiraAPIError(f"Full sync fetched {result['fetched']} of {expected_total} issues")
+        deltas = result["deltas"]
+
+        if result["full"]:
+            mode = "full"
+        elif base_is_current:
+            mode = "incremental"
+        else:
+            mode = "recounted"
+
+        if mode == "incremental":
+            status_counts = Counter(previous["status_breakdown"])
+            issue_type_counts = Counter(previous["issue_type_breakdown"])
+            status_counts.update(_labelled(deltas["status"]))
+            issue_type_counts.update(_labelled(deltas["issue_type"]))
+            status_counts = _labelled(status_counts)
+            issue_type_counts = _labelled(issue_type_counts)
+        else:
+            status_counts = _labelled(self.mirror.count_by("status"))
+            issue_type_counts = _labelled(self.mirror.count_by("issue_type"))
+
+        # After a full rebuild every issue looks new, so its moves are not recorded
+        transitions = [] if mode == "full" else [
+            [old, new, count] for (old, new), count in sorted(deltas["transitions"].items(),
+                                                             key=lambda item: -item[1])
+        ]
+
+        report = build_progress_report(self.mirror.project_key, sum(status_counts.values()),
+                                       status_counts, issue_type_counts)
+        report["timestamp"] = datetime.now(timezone.utc).isoformat()
+        with self.conn:
+            cursor = self.conn.execute(
+                "INSERT INTO report_snapshots (project, taken_at, high_water, total_issues, "
+                "completion_percentage, status_breakdown, issue_type_breakdown, transitions, fetched, mode) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (self.mirror.project_key, report["timestamp"], result["high_water"], report["total_issues"],
+                 report["completion_percentage"], json.dumps(status_counts), json.dumps(issue_type_counts),
+                 json.dumps(transitions), result["fetched"], mode)
+            )
+        report.update(id=cursor.lastrowid, high_water=result["high_water"], transitions=transitions,
+                      fetched=result["fetched"], mode=mode)
+        return report
+
+    def verify(self, snapshot: Dict[str, Any]) -> List[str]:
+        """
+        Compare a snapshot's counts with a recount of the mirror
+
+        Args:
+            snapshot: The most recent snapshot
+
+        Returns:
+            Descriptions of the differences (empty if the counts agree)
+        """
+        problems = []
+        for column, key in (("status", "status_breakdown"), ("issue_type", "issue_type_breakdown")):
+            actual = _labelled(self.mirror.count_by(column))
+            for name in sorted(set(actual) | set(snapshot[key])):
+                if actual.get(name, 0) != snapshot[key].get(name, 0):
+                    problems.append(f"{column} {name}: snapshot {snapshot[key].get(name, 0)}, "
+                                    f"mirror {actual.get(name, 0)}")
+        return problems
+
+
+def compare_snapshots(older: Dict[str, Any], newer: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Compute the change between two snapshots
+
+    Args:
+        older: Earlier snapshot
+        newer: Later snapshot
+
+    Returns:
+        Dictionary with the changes of the total, the completion percentage and
+        every status and type count (unchanged counts are left out), plus the
+        status moves recorded by the newer snapshot
+    """
+    def changed(key: str) -> Dict[str, int]:
+        names = set(older[key]) | set(newer[key])
+        differences = {name: newer[key].get(name, 0) - older[key].get(name, 0) for name in names}
+        return {name: delta for name, delta in sorted(differences.items()) if delta}
+
+    return {
+        "from": older["timestamp"],
+        "to": newer["timestamp"],
+        "total_issues": newer["total_issues"] - older["total_issues"],
+        "completion_percentage": round(newer["completion_percentage"] - older["completion_percentage"], 2),
+        "status_breakdown": changed("status_breakdown"),
+        "issue_type_breakdown": changed("issue_type_breakdown"),
+        "transitions": newer["transitions"],
+    }
+
+
+def trend_lines(snapshots: List[Dict[str, Any]], by: str = "status") -> List[Dict[str, Any]]:
+    """
+    Build one trend line per series across snapshots
+
+    Args:
+        snapshots: Snapshots, oldest first
+        by: 'status' or 'issue_type' breakdown
+
+    Returns:
+        List of dictionaries with 'name', 'values', 'first', 'last',
+        'per_week' (least-squares slope) and 'spark'
+    """
+    key = "status_breakdown" if by == "status" else "issue_type_breakdown"
+    times = [datetime.fromisoformat(snapshot["timestamp"]).timestamp() for snapshot in snapshots]
+    series = {
+        "completion %": [snapshot["completion_percentage"] for snapshot in snapshots],
+        "total issues": [snapshot["total_issues"] for snapshot in snapshots],
+    }
+    names = sorted({name for snapshot in snapshots for name in snapshot[key]})
+    for name in names:
+        series[name] = [snapshot[key].get(name, 0) for snapshot in snapshots]
+
+    return [
+        {
+            "name": name,
+            "values": values,
+            "first": values[0],
+            "last": values[-1],
+            "per_week": round(slope_per_week(times, values), 2),
+            "spark": sparkline(values),
+        }
+        for name, values in series.items()
+    ] if snapshots else []
+
+
+def format_delta(delta: Dict[str, Any]) -> List[str]:
+    """Format the change between two snapshots as text lines"""
+    lines = [f"{delta['from']} -> {delta['to']}: {delta['total_issues']:+d} issues, "
+             f"{delta['completion_percentage']:+.1f} pts completion"]
+    for label, key in (("status", "status_breakdown"), ("type", "issue_type_breakdown")):
+        if delta[key]:
+            changes = ", ".join(f"{name} {count:+d}" for name, count in delta[key].items())
+            lines.append(f"  {label}: {changes}")
+    for old, new, count in delta["transitions"]:
+        lines.append(f"  {old or 'new'} -> {new}: {count}")
+    return lines
+
+
+def main():
+    """Command line interface for the report history"""
+    parser = argparse.ArgumentParser(description="Progress report snapshots, deltas and trends")
+    parser.add_argument("--db", type=Path, default=MIRROR_DB, help="Mirror database file")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    snapshot_parser = subparsers.add_parser("snapshot", help="Sync the mirror and store a new snapshot")
+    snapshot_parser.add_argument("--full", action="store_true", help="Rebuild the mirror and count from scratch")
+    snapshot_parser.add_argument("--verify", action="store_true", help="Check the counts against a recount")
+
+    deltas_parser = subparsers.add_parser("deltas", help="Show the changes between consecutive snapshots")
+    deltas_parser.add_argument("--last", type=int, default=5, help="Number of most recent changes")
+    deltas_parser.add_argument("--json", action="store_true", help="Print JSON")
+
+    trend_parser = subparsers.add_parser("trend", help="Show trend lines across snapshots")
+    trend_parser.add_argument("--last", type=int, default=20, help="Number of most recent snapshots")
+    trend_parser.add_argument("--by", choices=["status", "issue_type"], default="status", help="Breakdown")
+    trend_parser.add_argument("--json", action="store_true", help="Print JSON")
+
+    args = parser.parse_args()
+
+    project_key = os.getenv("JIRA_PROJECT_KEY")
+    if not project_key:
+        print("Please set JIRA_PROJECT_KEY in your .env file.")
+        sys.exit(1)
+
+    with IssueMirror(project_key, args.db) as mirror:
+        history = ReportHistory(mirror)
+
+        if args.command == "snapshot":
+            try:
+                jira = JiraAPI()
+            except ValueError as e:
+                print(f"Error initializing Jira API: {e}")
+                sys.exit(1)
+            previous = history.latest()
+            try:
+                snapshot = history.take_snapshot(jira, full=args.full)
+            except (JiraAPIError, requests.RequestException) as e:
+                print(f"Snapshot failed, nothing stored: {e}")
+                sys.exit(1)
+            print(f"Snapshot {snapshot['id']} ({snapshot['mode']}, {snapshot['fetched']} issues fetched): "
+                  f"{snapshot['total_issues']} issues, {snapshot['completion_percentage']:.1f}% complete")
+            if previous:
+                for line in format_delta(compare_snapshots(previous, snapshot)):
+                    print(line)
+            if args.verify:
+                problems = history.verify(snapshot)
+                for problem in problems:
+                    print(f"Mismatch: {problem}")
+                print("Counts verified" if not problems else "Run 'snapshot --full' to recount")
+            return
+
+        snapshots = history.snapshots(last=args.last + 1 if args.command == "deltas" else args.last)
+        if not snapshots:
+            print("No snapshots yet; run 'python report_history.py snapshot' first.")
+            sys.exit(1)
+
+        if args.command == "deltas":
+            deltas = [compare_snapshots(older, newer) for older, newer in zip(snapshots, snapshots[1:])]
+            if args.json:
+                print(json.dumps(deltas, indent=2))
+                return
+            if not deltas:
+                print("Only one snapshot so far.")
+            for delta in deltas:
+                for line in format_delta(delta):
+                    print(line)
+        elif args.command == "trend":
+            lines = trend_lines(snapshots, args.by)
+            if args.json:
+                print(json.dumps(lines, indent=2))
+                return
+            print(f"{len(snapshots)} snapshots from {snapshots[0]['timestamp']} to {snapshots[-1]['timestamp']}")
+            for line in lines:
+                print(f"  {line['name']:<16} {line['spark']:<{len(snapshots)}}  {line['first']:>8g} -> "
+                      f"{line['last']:<8g} {line['per_week']:+.2f}/week")
+
+
+if __name__ == "__main__":
+    main()
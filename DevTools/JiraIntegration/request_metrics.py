@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+BetterWYD Jira Request Metrics
+
+Aggregates the per-request samples reported by JiraAPI request hooks into
+latency histograms per endpoint, so it is visible which calls dominate a hook
+or seeding run. Endpoints are grouped by path template (issue keys and ids are
+replaced, e.g. /rest/api/3/issue/{key}/comment).
+
+Collection is off by default. Set JIRA_METRICS to a file path and every
+JiraAPI in the process records into one shared collector that is written at
+exit, as Prometheus text if the file ends in .prom, otherwise as JSON. The
+hook daemon always collects and serves its metrics on demand
+(python hook_daemon.py metrics).
+
+Usage:
+    JIRA_METRICS=.jira_cache/metrics.json python setup_jira_project.py
+    python request_metrics.py .jira_cache/metrics.json    # top endpoints
+"""
+
+import os
+import re
+import sys
+import json
+import atexit
+import argparse
+import threading
+from bisect import bisect_left
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+# Histogram bucket upper bounds in seconds
+LATENCY_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0]
+
+# Path segments replaced by placeholders when grouping requests by endpoint
+_ISSUE_KEY_SEGMENT = re.compile(r'/[A-Z][A-Z0-9_]*-\d+(?=/|$)')
+_ID_SEGMENT = re.compile(r'(?<!/api)/\d+(?=/|$)')
+_PROJECT_SEGMENT = re.compile(r'/project/[^/]+')
+
+
+def endpoint_template(path: str) -> str:
+    """
+    Group a request path by endpoint
+
+    Args:
+        path: Request path, optionally with a query string
+
+    Returns:
+        The path with issue keys, numeric ids and the project key replaced
+    """
+    path = path.split("?", 1)[0]
+    path = _ISSUE_KEY_SEGMENT.sub("/{key}", path)
+    path = _ID_SEGMENT.sub("/{id}", path)
+    return _PROJECT_SEGMENT.sub("/project/{project}", path)
+
+
+class EndpointStats:
+    """Latency histogram and counters of one (method, endpoint) pair"""
+
+    __slots__ = ("buckets", "count", "seconds", "max_seconds", "request_bytes", "response_bytes", "statuses")
+
+    def __init__(self):
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.statuses: Dict[str, int] = {}
+
+    def add(self, sample: Dict[str, Any]):
+        """Add one request sample"""
+        seconds = sample["seconds"]
+        self.buckets[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.request_bytes += sample.get("request_bytes") or 0
+        self.response_bytes += sample.get("response_bytes") or 0
+        status = str(sample.get("status") or "error")
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+
+    def quantile(self, q: float) -> float:
+        """Estimate a latency quantile (upper bound of the bucket it falls in)"""
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS, self.buckets):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max_seconds)
+        return self.max_seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form"""
+        return {
+            "count": self.count,
+            "seconds": round(self.seconds, 6),
+            "mean_ms": round(self.seconds / self.count * 1000, 3) if self.count else 0.0,
+            "p50_ms": round(self.quantile(0.5) * 1000, 3),
+            "p95_ms": round(self.quantile(0.95) * 1000, 3),
+            "max_ms": round(self.max_seconds * 1000, 3),
+            "request_bytes": self.request_bytes,
+            "response_bytes": self.response_bytes,
+            "statuses": dict(self.statuses),
+            "buckets": {str(bound): count for bound, count in zip(LATENCY_BUCKETS + ["+Inf"], self.buckets)},
+        }
+
+
+class RequestMetrics:
+    """Thread-safe collector of JiraAPI request samples"""
+
+    def __init__(self):
+        self._stats: Dict[tuple, EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, sample: Dict[str, Any]):
+        """
+        Record one request (usable directly as a JiraAPI request hook)
+
+        Args:
+            sample: Dictionary with 'method', 'endpoint', 'status', 'seconds',
+                    'request_bytes' and 'response_bytes'
+        """
+        key = (sample["method"], sample["endpoint"])
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = EndpointStats()
+            stats.add(sample)
+
+    def reset(self):
+        """Forget all samples"""
+        with self._lock:
+            self._stats.clear()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Snapshot of the metrics
+
+        Returns:
+            Dictionary with per-endpoint entries, slowest total time first
+        """
+        with self._lock:
+            endpoints = [
+                dict(method=method, endpoint=endpoint, **stats.to_dict())
+                for (method, endpoint), stats in self._stats.items()
+            ]
+        endpoints.sort(key=lambda entry: entry["seconds"], reverse=True)
+        return {
+            "requests": sum(entry["count"] for entry in endpoints),
+            "seconds": round(sum(entry["seconds"] for entry in endpoints), 6),
+            "endpoints": endpoints,
+        }
+
+    def to_json(self) -> str:
+        """Metrics as JSON"""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def to_prometheus(self) -> str:
+        """Metrics in the Prometheus text exposition format"""
+        with self._lock:
+            items = sorted(self._stats.items())
+            lines = [
+                "# HELP jira_request_duration_seconds Wall time of Jira API requests, including throttling and retries",
+                "# TYPE jira_request_duration_seconds histogram",
+            ]
+            for (method, endpoint), stats in items:
+                labels = f'method="{method}",endpoint="{endpoint}"'
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS, stats.buckets):
+                    cumulative += count
+                    lines.append(f'jira_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f'jira_request_duration_seconds_bucket{{{labels},le="+Inf"}} {stats.count}')
+                lines.append(f"jira_request_duration_seconds_sum{{{labels}}} {stats.seconds:.6f}")
+                lines.append(f"jira_request_duration_seconds_count{{{labels}}} {stats.count}")
+
+            lines += ["# HELP jira_requests_total Jira API requests by response status",
+                      "# TYPE jira_requests_total counter"]
+            for (method, endpoint), stats in items:
+                for status, count in sorted(stats.statuses.items()):
+                    lines.append(f'jira_requests_total{{method="{method}",endpoint="{endpoint}",status="{status}"}} {count}')
+
+            for name, attribute, help_text in (
+                ("jira_request_bytes_total", "request_bytes", "Bytes sent in Jira API request bodies"),
+                ("jira_response_bytes_total", "response_bytes", "Bytes received in Jira API response bodies"),
+            ):
+                lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+                for (method, endpoint), stats in items:
+                    lines.append(f'{name}{{method="{method}",endpoint="{endpoint}"}} {getattr(stats, attribute)}')
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: Path):
+        """
+        Write the metrics to a file
+
+        Args:
+            path: Target file; '.prom' selects the Prometheus format, anything else JSON
+        """
+        path = Path(path)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            text = self.to_prometheus() if path.suffix == ".prom" else self.to_json()
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+        except OSError as e:
+            print(f"Could not write request metrics to {path}: {e}")
+
+
+_process_metrics: Optional[RequestMetrics] = None
+_process_metrics_lock = threading.Lock()
+
+
+def process_metrics() -> Optional[RequestMetrics]:
+    """
+    Get the process-wide collector enabled by JIRA_METRICS
+
+    The first call registers an exit handler that writes the metrics to the
+    JIRA_METRICS path.
+
+    Returns:
+        The shared RequestMetrics, or None if JIRA_METRICS is not set
+    """
+    global _process_metrics
+    path = os.getenv("JIRA_METRICS")
+    if not path:
+        return None
+    with _process_metrics_lock:
+        if _process_metrics is None:
+            _process_metrics = RequestMetrics()
+            atexit.register(_process_metrics.write, Path(path))
+    return _process_metrics
+
+
+def format_table(metrics: Dict[str, Any], limit: int = 20) -> List[str]:
+    """
+    Format a metrics snapshot as a table, slowest total time first
+
+    Args:
+        metrics: Snapshot as returned by RequestMetrics.to_dict()
+        limit: Maximum number of endpoints shown
+
+    Returns:
+        Table lines
+    """
+    total = metrics["seconds"] or 1.0
+    lines = [f"{'Method':<7}{'Endpoint':<44}{'calls':>7}{'total s':>9}{'share':>7}"
+             f"{'mean ms':>9}{'p95 ms':>9}{'KiB in':>9}"]
+    for entry in metrics["endpoints"][:limit]:
+        lines.append(f"{entry['method']:<7}{entry['endpoint']:<44}{entry['count']:>7}{entry['seconds']:>9.2f}"
+                     f"{entry['seconds'] / total:>7.0%}{entry['mean_ms']:>9.1f}{entry['p95_ms']:>9.1f}"
+                     f"{entry['response_bytes'] / 1024:>9.1f}")
+    lines.append(f"{metrics['requests']} requests, {metrics['seconds']:.2f}s in total")
+    return lines
+
+
+def main():
+    """Show the endpoints that dominate a JSON metrics dump"""
+    parser = argparse.ArgumentParser(description="Summarize a Jira request metrics dump")
+    parser.add_argument("path", type=Path, help="JSON file written via JIRA_METRICS")
+    parser.add_argument("--limit", type=int, default=20, help="Number of endpoints to show")
+    args = parser.parse_args()
+
+    try:
+        with open(args.path, encoding="utf-8") as f:
+            metrics = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Could not read {args.path}: {e}")
+        sys.exit(1)
+
+    for line in format_table(metrics, args.limit):
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+BetterWYD Jira Request Scheduler
+
+Every JiraAPI request goes through a RequestScheduler, which keeps batch jobs
+within Jira Cloud's rate limits instead of letting them half-fail:
+
+- A client-side token bucket caps the request rate (JIRA_RATE_LIMIT requests
+  per second, bursts of JIRA_RATE_BURST); 0 disables it
+- HTTP 429 responses pause all requests of the client for the server's
+  Retry-After, then the request is retried (a throttled request was not
+  processed, so this is safe for any method)
+- 5xx responses and connection errors are retried with jittered exponential
+  backoff, but only for idempotent requests (GET, PUT, DELETE and searches)
+- Counters record how often and how long requests were held back
+
+The scheduler is thread-safe, so one instance serves the worker threads of
+AsyncJiraAPI and the parallel report queries.
+"""
+
+import os
+import time
+import random
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Optional
+
+import requests
+
+# Client-side rate limit (requests per second, 0 = unlimited) and burst size
+DEFAULT_RATE_LIMIT = 25.0
+DEFAULT_RATE_BURST = 50
+
+# Retries after a 429, 5xx or connection error
+DEFAULT_MAX_RETRIES = 4
+DEFAULT_BACKOFF_BASE = 0.5
+DEFAULT_BACKOFF_MAX = 30.0
+
+# A Retry-After longer than this is not waited for; the 429 is returned instead
+DEFAULT_MAX_RETRY_AFTER = 120.0
+
+# Methods that can be repeated without changing the result
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+# Server errors worth retrying
+RETRY_STATUS_CODES = {500, 502, 503, 504}
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header
+
+    Args:
+        value: Header value, either seconds or an HTTP date
+
+    Returns:
+        Seconds to wait, or None if the header is missing or malformed
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket:
+    """Thread-safe token bucket"""
+
+    def __init__(self, rate: float, burst: int):
+        """
+        Initialize a full bucket
+
+        Args:
+            rate: Tokens added per second
+            burst: Bucket capacity
+        """
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take one token, going into debt if the bucket is empty
+
+        Returns:
+            Seconds the caller has to wait before using the token
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+class RequestScheduler:
+    """Rate limiting and retries for all requests of one JiraAPI client"""
+
+    def __init__(self, rate_limit: Optional[float] = None, burst: Optional[int] = None,
+                 max_retries: Optional[int] = None, backoff_base: float = DEFAULT_BACKOFF_BASE,
+                 backoff_max: float = DEFAULT_BACKOFF_MAX, max_retry_after: float = DEFAULT_MAX_RETRY_AFTER):
+        """
+        Initialize the scheduler
+
+        Args:
+            rate_limit: Requests per second, 0 for unlimited (JIRA_RATE_LIMIT)
+            burst: Requests allowed back to back (JIRA_RATE_BURST)
+            max_retries: Retries per request (JIRA_MAX_RETRIES)
+            backoff_base: First backoff delay in seconds (doubled on every retry)
+            backoff_max: Longest backoff delay in seconds
+            max_retry_after: Longest Retry-After that is waited for
+        """
+        if rate_limit is None:
+            rate_limit = float(os.getenv("JIRA_RATE_LIMIT", DEFAULT_RATE_LIMIT))
+        if burst is None:
+            burst = int(os.getenv("JIRA_RATE_BURST", DEFAULT_RATE_BURST))
+        self.bucket = TokenBucket(rate_limit, burst) if rate_limit > 0 else None
+        self.max_retries = max_retries if max_retries is not None else int(os.getenv("JIRA_MAX_RETRIES", DEFAULT_MAX_RETRIES))
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_retry_after = max_retry_after
+
+        # Jira throttles per user, so a 429 pauses every thread of the client
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+        self.counters = {
+            "requests": 0,
+            "retries": 0,
+            "throttled": 0,
+            "server_errors": 0,
+            "connection_errors": 0,
+            "rate_limit_wait": 0.0,
+            "retry_after_wait": 0.0,
+            "backoff_wait": 0.0,
+        }
+
+    def _count(self, name: str, amount=1):
+        """Increment a counter"""
+        with self._lock:
+            self.counters[name] += amount
+
+    def _wait_for_slot(self):
+        """Wait out a server-requested pause, then take a token from the bucket"""
+        while True:
+            with self._lock:
+                pause = self._paused_until - time.monotonic()
+            if pause <= 0:
+                break
+            time.sleep(pause)
+            self._count("retry_after_wait", pause)
+
+        if self.bucket:
+            delay = self.bucket.reserve()
+            if delay > 0:
+                time.sleep(delay)
+                self._count("rate_limit_wait", delay)
+
+    def _pause_all(self, seconds: float):
+        """Hold back every request of this client for a number of seconds"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def _backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff delay for a retry attempt (0-based)"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def send(self, send: Callable[[], requests.Response], method: str,
+             idempotent: Optional[bool] = None) -> requests.Response:
+        """
+        Send a request, waiting for rate limits and retrying where safe
+
+        Args:
+            send: Function performing the HTTP request
+            method: HTTP method (decides whether server errors are retried)
+            idempotent: Override the method-based idempotency decision
+
+        Returns:
+            The final response (the last error response if retries ran out)
+
+        Raises:
+            requests.RequestException: If the request could not be sent
+        """
+        if idempotent is None:
+            idempotent = method.upper() in IDEMPOTENT_METHODS
+
+        attempt = 0
+        while True:
+            self._wait_for_slot()
+            self._count("requests")
+            try:
+                response = send()
+            except (requests.ConnectionError, requests.Timeout):
+                self._count("connection_errors")
+                if not idempotent or attempt >= self.max_retries:
+                    raise
+                delay = self._backoff(attempt)
+                self._count("backoff_wait", delay)
+            else:
+                if response.status_code == 429:
+                    self._count("throttled")
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                    delay = retry_after if retry_after is not None else self._backoff(attempt)
+                    if attempt >= self.max_retries or delay > self.max_retry_after:
+                        return response
+                    # A little jitter so parallel workers do not return in lockstep
+                    self._pause_all(delay + random.uniform(0, self.backoff_base))
+                    delay = 0.0
+                elif response.status_code in RETRY_STATUS_CODES:
+                    self._count("server_errors")
+                    if not idempotent or attempt >= self.max_retries:
+                        return response
+                    delay = self._backoff(attempt)
+                    self._count("backoff_wait", delay)
+                else:
+                    return response
+                response.close()
+
+            attempt += 1
+            self._count("retries")
+            if delay:
+                time.sleep(delay)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Get the scheduler counters
+
+        Returns:
+            Dictionary with request, retry and error counts, and the seconds
+            spent waiting for the rate limit, Retry-After pauses and backoff
+        """
+        with self._lock:
+            stats = dict(self.counters)
+        stats["throttled_seconds"] = stats["rate_limit_wait"] + stats["retry_after_wait"] + stats["backoff_wait"]
+        return stats
+
+    def summary(self) -> str:
+        """One-line summary of the counters"""
+        stats = self.stats()
+        return (f"{stats['requests']} requests, {stats['retries']} retries "
+                f"({stats['throttled']} throttled, {stats['server_errors']} server errors, "
+                f"{stats['connection_errors']} connection errors), "
+                f"{stats['throttled_seconds']:.1f}s held back")
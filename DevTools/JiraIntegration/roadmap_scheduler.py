@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+BetterWYD Roadmap Scheduler
+
+Creates a roadmap of Jira items (epic -> story -> sub-task) as a dependency DAG.
+Every item is submitted to a worker pool as soon as the key it depends on exists,
+so independent branches are created in parallel and the total seeding time is
+bounded by the depth of the tree rather than the number of items.
+
+Usage:
+    from roadmap_scheduler import schedule_roadmap
+
+    result = schedule_roadmap(jira, items, max_workers=8)
+    print(result["created"])
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+# Get the script directory
+SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+
+# Add the JiraIntegration directory to the Python path
+sys.path.append(str(SCRIPT_DIR))
+
+from jira_integration import JiraAPI
+
+# Default number of items created in parallel
+DEFAULT_MAX_WORKERS = 8
+
+
+def build_dependency_graph(jira: JiraAPI, items: List[Dict[str, Any]]) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, List[str]], List[str], List[Dict[str, Any]]]:
+    """
+    Turn a list of item specs into a dependency DAG
+
+    An item only depends on its parent when its create request needs the parent's
+    key (e.g., sub-tasks); other items can start immediately.
+
+    Args:
+        jira: JiraAPI instance (used to check which items need a parent key)
+        items: Item specs as accepted by JiraAPI.bulk_create_issues
+
+    Returns:
+        Tuple of (items by ref, child refs by parent ref, root refs, invalid items)
+    """
+    nodes = {}
+    for index, item in enumerate(items):
+        ref = item.get("ref", str(index))
+        nodes[ref] = dict(item, ref=ref)
+
+    children = {}
+    roots = []
+    invalid = []
+    for ref, item in nodes.items():
+        parent_ref = item.get("parent_ref")
+        if parent_ref and parent_ref not in nodes:
+            invalid.append({"ref": ref, "summary": item.get("summary"),
+                            "error": f"Unknown parent_ref '{parent_ref}'"})
+        elif parent_ref and jira.needs_parent_key(item):
+            children.setdefault(parent_ref, []).append(ref)
+        else:
+            roots.append(ref)
+
+    return nodes, children, roots, invalid
+
+
+def _create_node(jira: JiraAPI, item: Dict[str, Any], parent_key: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Create a single roadmap item"""
+    return jira.create_issue(
+        summary=item.get("summary", ""),
+        description=item.get("description", ""),
+        issue_type=item.get("issue_type"),
+        parent_key=item.get("parent_key") or parent_key,
+        priority=item.get("priority"),
+        assignee=item.get("assignee"),
+        labels=item.get("labels")
+    )
+
+
+def schedule_roadmap(jira: JiraAPI, items: List[Dict[str, Any]], max_workers: int = DEFAULT_MAX_WORKERS) -> Dict[str, Any]:
+    """
+    Create roadmap items in parallel, respecting parent -> child dependencies
+
+    Args:
+        jira: JiraAPI instance
+        items: Item specs with 'ref' / 'parent_ref' links (see JiraAPI.bulk_create_issues)
+        max_workers: Maximum number of create requests in flight at once
+
+    Returns:
+        Dictionary with 'created' (ref -> issue key), 'failed' (list of
+        {'ref', 'summary', 'error'}), 'requests' and 'elapsed' (seconds)
+    """
+    started = time.perf_counter()
+    nodes, children, roots, failed = build_dependency_graph(jira, items)
+    created = {}
+    requests_sent = 0
+
+    # Every worker gets its own keep-alive connection
+    jira.ensure_pool_size(max_workers)
+
+    def skip_descendants(ref: str):
+        """Mark every item below a failed parent as failed"""
+        for child_ref in children.get(ref, []):
+            child = nodes[child_ref]
+            failed.append({"ref": child_ref, "summary": child.get("summary"),
+                           "error": f"Parent '{ref}' was not created"})
+            skip_descendants(child_ref)
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="roadmap") as executor:
+        in_flight = {
+            executor.submit(_create_node, jira, nodes[ref], None): ref
+            for ref in roots
+        }
+
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                ref = in_flight.pop(future)
+                requests_sent += 1
+                try:
+                    issue = future.result()
+                except Exception as e:
+                    print(f"Exception when creating '{nodes[ref].get('summary')}': {str(e)}")
+                    issue = None
+
+                if not issue or not issue.get("key"):
+                    failed.append({"ref": ref, "summary": nodes[ref].get("summary"),
+                                   "error": "Create request failed"})
+                    skip_descendants(ref)
+                    continue
+
+                key = issue["key"]
+                created[ref] = key
+
+                # The parent key now exists: release the children
+                for child_ref in children.get(ref, []):
+                    future = executor.submit(_create_node, jira, nodes[child_ref], key)
+                    in_flight[future] = child_ref
+
+    # Anything never reached sits on a dependency cycle
+    reached = set(created) | {failure["ref"] for failure in failed}
+    for ref, item in nodes.items():
+        if ref not in reached:
+            failed.append({"ref": ref, "summary": item.get("summary"), "error": "Dependency cycle"})
+
+    elapsed = time.perf_counter() - started
+    print(f"Created {len(created)} issues in {elapsed:.2f}s with {max_workers} workers ({len(failed)} failed)")
+    return {"created": created, "failed": failed, "requests": requests_sent, "elapsed": elapsed}
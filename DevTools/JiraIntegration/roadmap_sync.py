@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+BetterWYD Roadmap Sync
+
+Loads the Development Roadmap from a data file (roadmap.json) and syncs it to
+Jira idempotently. Every roadmap item has a stable external ID that is stored
+on its Jira issue as the label 'roadmap-<id>'. A sync fetches the project's
+roadmap issues once, diffs them against the file, and only sends requests for
+items that are missing or whose summary/description changed, so re-running it
+on an up-to-date project costs a single search.
+
+Roadmap file format:
+    {
+      "epics": [
+        {"id": "phase1", "summary": "...", "description": "...",
+         "stories": [
+           {"id": "phase1-architecture", "summary": "...", "description": "...",
+            "tasks": [{"id": "phase1-architecture-design", "summary": "...", "description": "..."}]}
+         ]}
+      ]
+    }
+
+Usage:
+    python setup_jira_project.py --dry-run   # show what would change
+    python setup_jira_project.py             # apply the changes
+"""
+
+import os
+import sys
+import json
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+# Get the script directory
+SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+
+# Add the JiraIntegration directory to the Python path
+sys.path.append(str(SCRIPT_DIR))
+
+from jira_integration import JiraAPI, JiraAPIError, adf_to_text, text_to_adf
+from roadmap_scheduler import schedule_roadmap, DEFAULT_MAX_WORKERS
+
+# Default roadmap data file
+ROADMAP_FILE = SCRIPT_DIR / 'roadmap.json'
+
+# Prefix of the label that stores an item's external ID on its Jira issue
+EXTERNAL_ID_LABEL_PREFIX = "roadmap-"
+
+# Fields needed to diff existing issues against the roadmap
+SYNC_FIELDS = ["summary", "description", "labels", "issuetype", "parent"]
+
+
+def load_roadmap(path: Path = ROADMAP_FILE) -> List[Dict[str, Any]]:
+    """
+    Load a roadmap file and flatten it into item specs
+
+    Args:
+        path: Path to the roadmap JSON file
+
+    Returns:
+        Item specs (epics first, then stories, then tasks) with 'ref' set to the
+        external ID, 'category' ('epic', 'story' or 'task'), 'parent_ref' and 'labels'
+
+    Raises:
+        ValueError: If an item has no ID or an ID is used twice
+    """
+    with open(path, encoding="utf-8") as f:
+        roadmap = json.load(f)
+
+    items = []
+    seen = set()
+
+    def add(node: Dict[str, Any], category: str, parent_ref: Optional[str]):
+        external_id = node.get("id")
+        if not external_id:
+            raise ValueError(f"Roadmap {category} '{node.get('summary')}' has no id")
+        if external_id in seen:
+            raise ValueError(f"Duplicate roadmap id '{external_id}'")
+        seen.add(external_id)
+
+        item = {
+            "ref": external_id,
+            "category": category,
+            "summary": node.get("summary", ""),
+            "description": node.get("description", ""),
+            "labels": [f"{EXTERNAL_ID_LABEL_PREFIX}{external_id}"]
+        }
+        if parent_ref:
+            item["parent_ref"] = parent_ref
+        items.append(item)
+
+    for epic in roadmap.get("epics", []):
+        add(epic, "epic", None)
+        for story in epic.get("stories", []):
+            add(story, "story", epic["id"])
+            for task in story.get("tasks", []):
+                add(task, "task", story["id"])
+
+    return items
+
+
+def external_id_of(issue: Dict[str, Any]) -> Optional[str]:
+    """
+    Get the roadmap external ID stored on an issue
+
+    Args:
+        issue: Issue dictionary from a search
+
+    Returns:
+        The external ID, or None if the issue is not a roadmap item
+    """
+    for label in issue.get("fields", {}).get("labels") or []:
+        if label.startswith(EXTERNAL_ID_LABEL_PREFIX):
+            return label[len(EXTERNAL_ID_LABEL_PREFIX):]
+    return None
+
+
+def fetch_roadmap_issues(jira: JiraAPI) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch all issues of the project that carry a roadmap external ID
+
+    Args:
+        jira: JiraAPI instance
+
+    Returns:
+        Dictionary mapping external ID to issue
+
+    Raises:
+        JiraAPIError: If the search failed; an empty result always means the
+                      project has no roadmap issues, never that the lookup failed
+    """
+    jql = f"project = {jira.project_key} AND labels is not EMPTY ORDER BY created ASC"
+    existing = {}
+    for issue in jira.iter_project_issues(jql=jql, fields=SYNC_FIELDS):
+        external_id = external_id_of(issue)
+        # Keep the oldest issue if an ID was ever duplicated
+        if external_id and external_id not in existing:
+            existing[external_id] = issue
+    return existing
+
+
+def diff_roadmap(items: List[Dict[str, Any]], existing: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Compare roadmap items with the issues already in Jira
+
+    Args:
+        items: Item specs from load_roadmap
+        existing: Existing issues by external ID (from fetch_roadmap_issues)
+
+    Returns:
+        Dictionary with 'create' (item specs to create), 'update' (list of
+        (issue key, ref, fields to update)) and 'unchanged' (list of refs)
+    """
+    plan = {"create": [], "update": [], "unchanged": []}
+
+    for item in items:
+        issue = existing.get(item["ref"])
+
+        if issue is None:
+            item = dict(item)
+            parent = existing.get(item.get("parent_ref"))
+            if parent:
+                # The parent already exists in Jira: link to it directly
+                item["parent_key"] = parent["key"]
+                del item["parent_ref"]
+            plan["create"].append(item)
+            continue
+
+        fields = issue.get("fields", {})
+        changes = {}
+        if (fields.get("summary") or "") != item["summary"]:
+            changes["summary"] = item["summary"]
+        if adf_to_text(fields.get("description")).strip() != item["description"].strip():
+            changes["description"] = text_to_adf(item["description"])
+
+        if changes:
+            plan["update"].append((issue["key"], item["ref"], changes))
+        else:
+            plan["unchanged"].append(item["ref"])
+
+    return plan
+
+
+def sync_roadmap(jira: JiraAPI, items: List[Dict[str, Any]], type_map: Dict[str, Any],
+                 strategy: str = "bulk", max_workers: int = DEFAULT_MAX_WORKERS,
+                 dry_run: bool = False) -> Dict[str, Any]:
+    """
+    Bring the Jira project in line with the roadmap
+
+    Args:
+        jira: JiraAPI instance
+        items: Item specs from load_roadmap
+        type_map: Issue types by category ('epic', 'story', 'task'), as returned
+                  by setup_jira_project.get_valid_issue_types
+        strategy: 'bulk' or 'parallel' (see setup_jira_project.py)
+        max_workers: Worker pool size for parallel creates and for updates
+        dry_run: Only print the plan, do not change anything
+
+    Returns:
+        Dictionary with 'created' (ref -> key), 'updated' (refs), 'unchanged'
+        (refs) and 'failed' (list of {'ref', 'summary', 'error'})
+
+    Raises:
+        JiraAPIError: If the existing roadmap issues could not be fetched; the
+                      sync is aborted before any issue is created or updated
+    """
+    for item in items:
+        item["issue_type"] = type_map.get(item["category"])
+
+    print("Fetching existing roadmap issues...")
+    try:
+        existing = fetch_roadmap_issues(jira)
+    except (JiraAPIError, requests.RequestException) as e:
+        # Without the existing issues every item would look new and be created again
+        raise JiraAPIError(f"Could not fetch existing roadmap issues, nothing was changed: {str(e)}") from e
+    plan = diff_roadmap(items, existing)
+
+    print(f"Roadmap: {len(items)} items, {len(existing)} already in Jira")
+    print(f"  To create: {len(plan['create'])}")
+    print(f"  To update: {len(plan['update'])}")
+    print(f"  Unchanged: {len(plan['unchanged'])}")
+
+    result = {"created": {}, "updated": [], "unchanged": plan["unchanged"], "failed": []}
+
+    if dry_run:
+        for item in plan["create"]:
+            print(f"  + {item['ref']}: {item['summary']}")
+        for key, ref, changes in plan["update"]:
+            print(f"  ~ {ref} ({key}): {', '.join(changes)}")
+        return result
+
+    if plan["create"]:
+        if strategy == "parallel":
+            created = schedule_roadmap(jira, plan["create"], max_workers=max_workers)
+        else:
+            created = jira.bulk_create_issues(plan["create"])
+        result["created"] = created["created"]
+        result["failed"].extend(created["failed"])
+
+    if plan["update"]:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            outcomes = executor.map(lambda change: jira.update_issue(change[0], change[2]), plan["update"])
+            for (key, ref, changes), ok in zip(plan["update"], outcomes):
+                if ok:
+                    result["updated"].append(ref)
+                else:
+                    result["failed"].append({"ref": ref, "summary": changes.get("summary", key),
+                                             "error": f"Update of {key} failed"})
+
+    return result
@@ -7,14 +7,25 @@ BetterWYD Jira Project Setup
 This script creates all required Jira items based on the BetterWYD Development Roadmap.
 It automatically detects valid issue types in your Jira project.
 
+The roadmap is read from roadmap.json and synced idempotently: items are matched
+to existing issues by their stable external ID (the 'roadmap-<id>' label), so
+re-running the script only creates missing items and updates changed ones.
+
 Usage:
 1. Ensure your .env file is set up with Jira credentials
-2. Run this script to populate your Jira project with items
+2. Run this script to populate your Jira project with items:
+   python setup_jira_project.py [--roadmap roadmap.json] [--dry-run]
+                                [--strategy bulk|parallel] [--workers 8]
+
+Strategies:
+- bulk: create items with Jira's bulk endpoint, one round of chunks per tree level
+- parallel: create items one by one on a worker pool, each as soon as its parent exists
 """
 
 import os
 import sys
 import json
+import argparse
 from pathlib import Path
 
 # Get the script directory
@@ -27,6 +38,8 @@ sys.path.append(str(SCRIPT_DIR))
 # Import the JiraAPI class from the jira_integration module
 try:
     from jira_integration import JiraAPI, configure_urllib3
+    from roadmap_scheduler import DEFAULT_MAX_WORKERS
+    from roadmap_sync import load_roadmap, sync_roadmap, ROADMAP_FILE
     print("Successfully imported JiraAPI")
 except Exception as e:
     print(f"Error importing JiraAPI: {e}")
@@ -44,28 +57,13 @@ def get_valid_issue_types(jira):
     """
     print("Fetching valid issue types for your project...")
     
-    # Fetch issue creation metadata for this specific project
-    url = f"{jira.jira_url}/rest/api/3/issue/createmeta?projectKeys={jira.project_key}&expand=projects.issuetypes"
-    
+    # Fetch issue creation metadata for this specific project (cached between runs)
     try:
-        import requests
-        response = requests.get(url, headers=jira.headers)
-        
-        if response.status_code != 200:
-            print(f"Failed to get project metadata. Status code: {response.status_code}")
-            print(f"Response: {response.text}")
-            return None
+        issue_types = jira.get_create_meta()
         
-        metadata = response.json()
-        projects = metadata.get('projects', [])
-        
-        if not projects:
-            print(f"No project found with key: {jira.project_key}")
+        if not issue_types:
             return None
         
-        project = projects[0]
-        issue_types = project.get('issuetypes', [])
-        
         print(f"Found {len(issue_types)} issue types available for this project:")
         
         # Build a map of issue type categories to IDs and properties
@@ -164,9 +162,17 @@ def get_valid_issue_types(jira):
         traceback.print_exc()
         return None
 
-def setup_jira_project():
+def setup_jira_project(roadmap_path: Path = ROADMAP_FILE, strategy: str = "bulk",
+                       max_workers: int = DEFAULT_MAX_WORKERS, dry_run: bool = False):
     """
     Set up the Jira project with all required items based on the Development Roadmap
+    
+    Args:
+        roadmap_path: Roadmap data file to sync from
+        strategy: 'bulk' to use the bulk issue endpoint, 'parallel' to use the
+                  dependency-aware worker pool
+        max_workers: Number of parallel workers for the 'parallel' strategy
+        dry_run: Only print what would be created or updated
     """
     print("Starting Jira project setup...")
     
@@ -208,380 +214,47 @@ def setup_jira_project():
         print("Could not determine valid issue types. Aborting setup.")
         return
     
-    # Use the retrieved issue types
-    epic_type = issue_types.get('epic')
-    story_type = issue_types.get('story')
-    task_type = issue_types.get('task')
+    # Load the roadmap and sync it: only missing or changed items produce API calls
+    try:
+        items = load_roadmap(roadmap_path)
+    except (OSError, ValueError) as e:
+        print(f"Error loading roadmap from {roadmap_path}: {str(e)}")
+        return
     
-    # Create Phase Epics
     try:
-        print("Creating Phase 1 Epic...")
-        phase1_epic = jira.create_issue(
-            summary="Phase 1: Foundation & Core Systems",
-            description="This phase focuses on setting up the foundation and core systems of the BetterWYD game. Timeline: April 15 - May 15, 2025",
-            issue_type=epic_type
-        )
-        
-        print("Creating Phase 2 Epic...")
-        phase2_epic = jira.create_issue(
-            summary="Phase 2: Gameplay Implementation",
-            description="This phase focuses on implementing the core gameplay elements of BetterWYD. Timeline: May 16 - June 15, 2025",
-            issue_type=epic_type
-        )
-        
-        print("Creating Phase 3 Epic...")
-        phase3_epic = jira.create_issue(
-            summary="Phase 3: Polishing & Testing",
-            description="This phase focuses on polishing the game, implementing multiplayer features, and preparing for testing. Timeline: June 16 - July 15, 2025",
-            issue_type=epic_type
-        )
-        
-        # Store Epic keys for linking stories
-        epic_keys = {
-            "phase1": phase1_epic.get("key") if phase1_epic else None,
-            "phase2": phase2_epic.get("key") if phase2_epic else None,
-            "phase3": phase3_epic.get("key") if phase3_epic else None
-        }
-        
-        print(f"Created Phase Epics: {epic_keys}")
-        
-        # Create Phase 1 Stories and Tasks
-        print("Creating Phase 1 items...")
-        create_phase1_items(jira, epic_keys["phase1"], story_type, task_type)
-        
-        # Create Phase 2 Stories and Tasks
-        print("Creating Phase 2 items...")
-        create_phase2_items(jira, epic_keys["phase2"], story_type, task_type)
-        
-        # Create Phase 3 Stories and Tasks
-        print("Creating Phase 3 items...")
-        create_phase3_items(jira, epic_keys["phase3"], story_type, task_type)
-        
-        print("Successfully created all Jira items based on the Development Roadmap.")
+        result = sync_roadmap(jira, items, issue_types, strategy=strategy,
+                              max_workers=max_workers, dry_run=dry_run)
+        
+        if dry_run:
+            print("Dry run: no changes were made.")
+            return
+        
+        print(f"Created {len(result['created'])}, updated {len(result['updated'])}, "
+              f"unchanged {len(result['unchanged'])} roadmap items.")
+        
+        if result["failed"]:
+            print(f"{len(result['failed'])} roadmap items could not be synced:")
+            for failure in result["failed"]:
+                print(f"- {failure['summary']}: {failure['error']}")
+        else:
+            print("Jira project is in sync with the Development Roadmap.")
+        print(f"Jira requests: {jira.scheduler.summary()}")
     except Exception as e:
-        print(f"Error creating Jira items: {str(e)}")
+        print(f"Error syncing Jira items: {str(e)}")
         import traceback
         traceback.print_exc()
 
-def create_phase1_items(jira, epic_key, story_type, task_type):
-    """Create Jira items for Phase 1: Foundation & Core Systems"""
-    if not epic_key:
-        print("Warning: Epic key for Phase 1 is missing. Stories will not be linked to an Epic.")
-    
-    # Week 1-2: Project Setup & Architecture
-    architecture_story = jira.create_issue(
-        summary="Project Setup & Architecture",
-        description="Complete the initial project setup and architecture design for BetterWYD. This includes setting up the core systems framework.",
-        issue_type=story_type
-    )
-    
-    if architecture_story:
-        story_key = architecture_story.get('key')
-        # Link the story to the epic
-        if epic_key:
-            # In Jira REST API v3, this would normally require a separate call to link the story to the epic
-            # For simplicity, we're just printing this out
-            print(f"Linked Story {story_key} to Epic {epic_key}")
-        
-        # Create tasks for the story - handle if task type is a sub-task
-        is_subtask = task_type.get('subtask', False) if isinstance(task_type, dict) else False
-        parent_key = story_key if is_subtask else None
-        
-        print(f"Creating tasks for '{architecture_story.get('fields', {}).get('summary')}' (Parent: {parent_key if parent_key else 'None'})")
-        
-        jira.create_issue(
-            summary="Complete project architecture design",
-            description="Design the overall architecture of the game, including core systems, modules, and their interactions.",
-            issue_type=task_type,
-            parent_key=parent_key
-        )
-        
-        jira.create_issue(
-            summary="Set up core systems framework",
-            description="Implement the basic framework for core game systems, including state management, event system, and object pooling.",
-            issue_type=task_type,
-            parent_key=parent_key
-        )
-        
-        jira.create_issue(
-            summary="Implement character controller and basic movement",
-            description="Create a character controller with basic movement functionality, including walking, running, and jumping.",
-            issue_type=task_type,
-            parent_key=parent_key
-        )
-        
-        jira.create_issue(
-            summary="Design and create database schema for character data",
-            description="Design the database schema for storing character data and implement the data access layer.",
-            issue_type=task_type,
-            parent_key=parent_key
-        )
-    
-    # Week 3-4: Core Game Systems
-    core_systems_story = jira.create_issue(
-        summary="Core Game Systems Implementation",
-        description="Implement the core game systems, including inventory, combat, character progression, and UI framework.",
-        issue_type=story_type
-    )
-    
-    if core_systems_story:
-        story_key = core_systems_story.get('key')
-        # Link the story to the epic
-        if epic_key:
-            print(f"Linked Story {story_key} to Epic {epic_key}")
-        
-        # Create tasks for the story - handle if task type is a sub-task
-        is_subtask = task_type.get('subtask', False) if isinstance(task_type, dict) else False
-        parent_key = story_key if is_subtask else None
-        
-        print(f"Creating tasks for '{core_systems_story.get('fields', {}).get('summary')}' (Parent: {parent_key if parent_key else 'None'})")
-        
-        jira.create_issue(
-            summary="Implement inventory system",
-            description="Develop a flexible inventory system that supports different item types, stacking, and management operations.",
-            issue_type=task_type,
-            parent_key=parent_key
-        )
-        
-        jira.create_issue(
-            summary="Develop basic combat system framework",
-            description="Create the framework for the combat system, including attack mechanics, damage calculation, and hit detection.",
-            issue_type=task_type,
-            parent_key=parent_key
-        )
-        
-        jira.create_issue(
-            summary="Create character progression system",
-            description="Implement character progression mechanics, including leveling, attributes (Strength, Dexterity, Intelligence, Constitution), and experience points.",
-            issue_type=task_type,
-            parent_key=parent_key
-        )
-        
-        jira.create_issue(
-            summary="Set up basic UI framework and main menus",
-            description="Design and implement the UI framework and create the main game menus, including character selection and options.",
-            issue_type=task_type,
-            parent_key=parent_key
-        )
-
-def create_phase2_items(jira, epic_key, story_type, task_type):
-    """Create Jira items for Phase 2: Gameplay Implementation"""
-    if not epic_key:
-        print("Warning: Epic key for Phase 2 is missing. Stories will not be linked to an Epic.")
-    
-    # Week 5-6: Class System & Combat
-    class_system_story = jira.create_issue(
-        summary="Class System & Combat",
-        description="Implement the character class system and enhance the combat mechanics with abilities and skills.",
-        issue_type=story_type
-    )
-    
-    if class_system_story:
-        story_key = class_system_story.get('key')
-        # Link the story to the epic
-        if epic_key:
-            print(f"Linked Story {story_key} to Epic {epic_key}")
-        
-        # Create tasks for the story - handle if task type is a sub-task
-        is_subtask = task_type.get('subtask', False) if isinstance(task_type, dict) else False
-        parent_key = story_key if is_subtask else None
-        
-        print(f"Creating tasks for '{class_system_story.get('fields', {}).get('summary')}' (Parent: {parent_key if parent_key else 'None'})")
-        
-        jira.create_issue(
-            summary="Implement Transknight class",
-            description="Create the Transknight class with melee combat specialization, including unique abilities and attributes.",
-            issue_type=task_type,
-            parent_key=parent_key
-        )
-        
-        jira.create_issue(
-            summary="Implement Hunter class",
-            description="Create the Hunter class with ranged damage dealing capabilities, including unique abilities and attributes.",
-            issue_type=task_type,
-            parent_key=parent_key
-        )
-        
-        jira.create_issue(
-            summary="Implement Foema class",
-            description="Create the Foema class with magical abilities and spells, including unique abilities and attributes.",
-            issue_type=task_type,
-            parent_key=parent_key
-        )
-        
-        jira.create_issue(
-            summary="Implement Beastmaster class",
-            description="Create the Beastmaster class with creature summoning and control abilities, including unique abilities and attributes.",
-            issue_type=task_type,
-            parent_key=parent_key
-        )
-        
-        jira.create_issue(
-            summary="Develop class-specific abilities and skills",
-            description="Implement the various abilities and skills for each character class, including visual effects and animations.",
-            issue_type=task_type,
-            parent_key=parent_key
-        )
-        
-        jira.create_issue(
-            summary="Enhance combat system with attacks, skills, and effects",
-            description="Expand the combat system to include special attacks, skill usage, and visual/audio effects for combat actions.",
-            issue_type=task_type,
-            parent_key=parent_key
-        )
-        
-        jira.create_issue(
-            summary="Create skill tree and progression system",
-            description="Implement a skill tree system allowing players to unlock and upgrade their class-specific abilities.",
-            issue_type=task_type,
-            parent_key=parent_key
-        )
-    
-    # Week 7-8: World Building & Environment
-    world_building_story = jira.create_issue(
-        summary="World Building & Environment",
-        description="Create the game world, including terrain, maps, environmental effects, and day/night cycle.",
-        issue_type=story_type
-    )
-    
-    if world_building_story:
-        story_key = world_building_story.get('key')
-        # Link the story to the epic
-        if epic_key:
-            print(f"Linked Story {story_key} to Epic {epic_key}")
-        
-        # Create tasks for the story - handle if task type is a sub-task
-        is_subtask = task_type.get('subtask', False) if isinstance(task_type, dict) else False
-        parent_key = story_key if is_subtask else None
-        
-        print(f"Creating tasks for '{world_building_story.get('fields', {}).get('summary')}' (Parent: {parent_key if parent_key else 'None'})")
-        
-        jira.create_issue(
-            summary="Develop terrain generation system",
-            description="Create a system for generating and rendering terrain with various biomes and features.",
-            issue_type=task_type,
-            parent_key=parent_key
-        )
-        
-        jira.create_issue(
-            summary="Create the first playable map based on Kersef continent",
-            description="Design and implement the first playable map based on the Kersef continent from the original game.",
-            issue_type=task_type,
-            parent_key=parent_key
-        )
-        
-        jira.create_issue(
-            summary="Implement day/night cycle",
-            description="Create a day/night cycle system with appropriate lighting and environmental changes.",
-            issue_type=task_type,
-            parent_key=parent_key
-        )
-        
-        jira.create_issue(
-            summary="Add environmental effects and ambiance",
-            description="Implement environmental effects such as weather, particles, and ambient sounds to enhance immersion.",
-            issue_type=task_type,
-            parent_key=parent_key
-        )
-
-def create_phase3_items(jira, epic_key, story_type, task_type):
-    """Create Jira items for Phase 3: Polishing & Testing"""
-    if not epic_key:
-        print("Warning: Epic key for Phase 3 is missing. Stories will not be linked to an Epic.")
-    
-    # Week 9-10: Multiplayer Framework & Social Features
-    multiplayer_story = jira.create_issue(
-        summary="Multiplayer Framework & Social Features",
-        description="Implement the multiplayer functionality and social features for player interaction.",
-        issue_type=story_type
-    )
-    
-    if multiplayer_story:
-        story_key = multiplayer_story.get('key')
-        # Link the story to the epic
-        if epic_key:
-            print(f"Linked Story {story_key} to Epic {epic_key}")
-        
-        # Create tasks for the story - handle if task type is a sub-task
-        is_subtask = task_type.get('subtask', False) if isinstance(task_type, dict) else False
-        parent_key = story_key if is_subtask else None
-        
-        print(f"Creating tasks for '{multiplayer_story.get('fields', {}).get('summary')}' (Parent: {parent_key if parent_key else 'None'})")
-        
-        jira.create_issue(
-            summary="Implement basic client-server architecture",
-            description="Create the client-server architecture for multiplayer functionality, handling connections and data synchronization.",
-            issue_type=task_type,
-            parent_key=parent_key
-        )
-        
-        jira.create_issue(
-            summary="Add player-to-player interaction",
-            description="Implement mechanics for players to interact with each other, including proximity detection and interaction options.",
-            issue_type=task_type,
-            parent_key=parent_key
-        )
-        
-        jira.create_issue(
-            summary="Develop chat system",
-            description="Create a chat system with different channels (global, local, private) for player communication.",
-            issue_type=task_type,
-            parent_key=parent_key
-        )
-        
-        jira.create_issue(
-            summary="Create basic guild framework",
-            description="Implement a basic guild system allowing players to form groups with shared identity and chat.",
-            issue_type=task_type,
-            parent_key=parent_key
-        )
-    
-    # Week 11-12: Testing & Optimization
-    testing_story = jira.create_issue(
-        summary="Testing & Optimization",
-        description="Focus on testing, optimization, and bug fixing to prepare for alpha release.",
-        issue_type=story_type
-    )
-    
-    if testing_story:
-        story_key = testing_story.get('key')
-        # Link the story to the epic
-        if epic_key:
-            print(f"Linked Story {story_key} to Epic {epic_key}")
-        
-        # Create tasks for the story - handle if task type is a sub-task
-        is_subtask = task_type.get('subtask', False) if isinstance(task_type, dict) else False
-        parent_key = story_key if is_subtask else None
-        
-        print(f"Creating tasks for '{testing_story.get('fields', {}).get('summary')}' (Parent: {parent_key if parent_key else 'None'})")
-        
-        jira.create_issue(
-            summary="Performance optimization",
-            description="Identify and address performance bottlenecks, optimize resource usage, and improve frame rates.",
-            issue_type=task_type,
-            parent_key=parent_key
-        )
-        
-        jira.create_issue(
-            summary="Bug fixing",
-            description="Identify and fix bugs throughout the game, focusing on critical issues that affect gameplay.",
-            issue_type=task_type,
-            parent_key=parent_key
-        )
-        
-        jira.create_issue(
-            summary="Balance adjustments",
-            description="Review and adjust game balance, including character classes, skills, progression, and combat mechanics.",
-            issue_type=task_type,
-            parent_key=parent_key
-        )
-        
-        jira.create_issue(
-            summary="Prepare for alpha testing",
-            description="Set up the infrastructure and processes for alpha testing, including test plans and feedback collection.",
-            issue_type=task_type,
-            parent_key=parent_key
-        )
-
 if __name__ == "__main__":
-    setup_jira_project()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Populate Jira with the BetterWYD Development Roadmap")
+    parser.add_argument("--roadmap", type=Path, default=ROADMAP_FILE,
+                        help="Roadmap data file (default: roadmap.json)")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Show what would be created or updated without changing Jira")
+    parser.add_argument("--strategy", choices=["bulk", "parallel"], default="bulk",
+                        help="How to create the items (default: bulk)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_MAX_WORKERS,
+                        help="Worker pool size for the parallel strategy")
+    args = parser.parse_args()
+    
+    setup_jira_project(roadmap_path=args.roadmap, strategy=args.strategy,
+                       max_workers=args.workers, dry_run=args.dry_run)
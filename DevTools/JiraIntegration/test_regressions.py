@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Regression tests for failed searches, run against the in-process mock Jira
+server (mock_jira_server.py), so no Atlassian site or credentials are needed
+
+A search page that fails part way must never look like the end of the
+results: the stream raises, a full mirror sync rolls back, no report snapshot
+is stored and a roadmap re-sync does not create duplicates.
+
+Usage:
+    python test_regressions.py
+    python -m pytest test_regressions.py
+"""
+
+import io
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Get the script directory
+SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+
+# Add the JiraIntegration directory to the Python path
+sys.path.append(str(SCRIPT_DIR))
+
+from mock_jira_server import MockJiraServer
+
+ISSUE_COUNT = 500
+PAGE_CAP = 100
+FAILING_PAGE = 200
+
+
+class MockJiraTestCase(unittest.TestCase):
+    """Runs each test against a freshly seeded mock server and a temporary cache directory"""
+
+    def setUp(self):
+        self.server = MockJiraServer(page_cap=PAGE_CAP).start()
+        self.addCleanup(self.server.stop)
+        self.tmp_dir = Path(tempfile.mkdtemp(prefix="jira_regressions_"))
+        self.addCleanup(shutil.rmtree, self.tmp_dir, ignore_errors=True)
+
+        # Point the client at the mock, whatever the .env file says
+        environ = {
+            "JIRA_EMAIL": "mock@example.com",
+            "JIRA_API_TOKEN": "mock-token",
+            "JIRA_URL": self.server.url,
+            "JIRA_PROJECT_KEY": self.server.state.project_key,
+        }
+        saved = {name: os.environ.get(name) for name in environ}
+        os.environ.update(environ)
+        self.addCleanup(self._restore_environ, saved)
+
+        from jira_integration import JiraAPI
+        from metadata_cache import MetadataCache
+        from request_scheduler import RequestScheduler
+        self.jira = JiraAPI(metadata_cache=MetadataCache(self.tmp_dir / 'metadata_cache.json'),
+                            scheduler=RequestScheduler(rate_limit=0, max_retries=0))
+        self.addCleanup(self.jira.close)
+
+    @staticmethod
+    def _restore_environ(saved):
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+    def fail_search_page(self, start_at: int = FAILING_PAGE, status: int = 500):
+        """Make the mock answer the search page at start_at with an error"""
+        self.server.search_failures[start_at] = status
+
+    def touch_issues(self, count: int):
+        """Move issues to another status so an incremental sync fetches them again"""
+        for key in list(self.server.state.issues)[:count]:
+            self.server.state.set_status(key, "Done")
+
+
+class FailedSearchPageTest(MockJiraTestCase):
+    """A failed page raises instead of truncating the stream"""
+
+    def setUp(self):
+        super().setUp()
+        self.server.state.seed_issues(ISSUE_COUNT, seed=1)
+
+    def test_complete_stream(self):
+        self.assertEqual(sum(1 for _ in self.jira.iter_project_issues()), ISSUE_COUNT)
+
+    def test_failed_page_raises(self):
+        from jira_integration import JiraAPIError
+        self.fail_search_page()
+        for prefetch in (True, False):
+            with self.subTest(prefetch=prefetch), redirect_stdout(io.StringIO()):
+                with self.assertRaises(JiraAPIError):
+                    for _ in self.jira.iter_project_issues(prefetch=prefetch):
+                        pass
+
+    def test_progress_report_is_an_error(self):
+        self.fail_search_page()
+        with redirect_stdout(io.StringIO()):
+            report = self.jira.generate_progress_report()
+        self.assertIn("error", report)
+        self.assertNotIn("total_issues", report)
+
+
+class MirrorSyncTest(MockJiraTestCase):
+    """A failed mirror sync leaves the mirror and its high-water mark untouched"""
+
+    def setUp(self):
+        super().setUp()
+        from issue_mirror import IssueMirror
+        self.server.state.seed_issues(ISSUE_COUNT, seed=1)
+        self.mirror = IssueMirror(self.server.state.project_key, self.tmp_dir / 'issue_mirror.db')
+        self.addCleanup(self.mirror.close)
+        self.first = self.mirror.sync(self.jira, full=True)
+
+    def mirrored(self) -> int:
+        return self.mirror.conn.execute("SELECT COUNT(*) FROM issues").fetchone()[0]
+
+    def test_full_sync(self):
+        self.assertEqual(self.first["fetched"], ISSUE_COUNT)
+        self.assertEqual(self.first["total"], ISSUE_COUNT)
+        self.assertEqual(self.mirror.progress_report()["total_issues"], ISSUE_COUNT)
+
+    def test_failed_full_sync_rolls_back(self):
+        from jira_integration import JiraAPIError
+        state = self.mirror.get_sync_state()
+        self.fail_search_page()
+        with redirect_stdout(io.StringIO()), self.assertRaises(JiraAPIError):
+            self.mirror.sync(self.jira, full=True)
+        self.assertEqual(self.mirrored(), ISSUE_COUNT)
+        self.assertEqual(self.mirror.get_sync_state()["high_water"], state["high_water"])
+
+    def test_failed_incremental_sync_keeps_high_water(self):
+        from jira_integration import JiraAPIError
+        state = self.mirror.get_sync_state()
+        done_before = self.mirror.count_by("status").get("Done", 0)
+        self.touch_issues(FAILING_PAGE + PAGE_CAP)
+        self.fail_search_page()
+        with redirect_stdout(io.StringIO()), self.assertRaises(JiraAPIError):
+            self.mirror.sync(self.jira)
+        self.assertEqual(self.mirror.get_sync_state()["high_water"], state["high_water"])
+        self.assertEqual(self.mirror.count_by("status").get("Done", 0), done_before)
+
+    def test_issue_updated_between_pages_is_not_skipped(self):
+        key = self.server.state.project_key
+        touched = []
+
+        def touch_first_page(start_at: int):
+            # Update issues on the first page while the second one is requested
+            # (the first in both key and updated order), so that they sort last
+            if start_at == PAGE_CAP and not touched:
+                later = (datetime.now(timezone.utc) + timedelta(minutes=1)).strftime("%Y-%m-%dT%H:%M:%S.000+0000")
+                for order in ("key", "updated"):
+                    issue = self.server.state.search(f"project = {key} ORDER BY {order} ASC")[0]
+                    status = "In Review" if issue["fields"]["status"]["name"] == "Done" else "Done"
+                    self.server.state.set_status(issue["key"], status, later)
+                    touched.append((issue["key"], status))
+
+        self.server.on_search = touch_first_page
+        result = self.mirror.sync(self.jira, full=True)
+        self.server.on_search = None
+        self.assertTrue(touched)
+        self.assertEqual(result["fetched"], ISSUE_COUNT)
+        self.assertEqual(self.mirrored(), ISSUE_COUNT)
+
+        # The updates made during the sync arrive with the next incremental sync
+        self.mirror.sync(self.jira)
+        for issue_key, status in touched:
+            self.assertEqual(self.mirror.get_issue(issue_key)["status"], status)
+
+    def test_short_full_sync_stores_no_snapshot(self):
+        from jira_integration import JiraAPIError
+        from report_history import ReportHistory
+        history = ReportHistory(self.mirror)
+        history.take_snapshot(self.jira)
+
+        self.fail_search_page()
+        with redirect_stdout(io.StringIO()), self.assertRaises(JiraAPIError):
+            history.take_snapshot(self.jira, full=True)
+        self.assertEqual(len(history.snapshots(last=10)), 1)
+        self.assertEqual(self.mirrored(), ISSUE_COUNT)
+
+
+class RoadmapResyncTest(MockJiraTestCase):
+    """Re-syncing the roadmap never creates duplicates"""
+
+    def setUp(self):
+        super().setUp()
+        from roadmap_sync import load_roadmap, sync_roadmap
+        with redirect_stdout(io.StringIO()):
+            from setup_jira_project import get_valid_issue_types
+            self.type_map = get_valid_issue_types(self.jira)
+        self.items = load_roadmap()
+        with redirect_stdout(io.StringIO()):
+            seeded = sync_roadmap(self.jira, self.items, self.type_map)
+        self.assertEqual(len(seeded["created"]), len(self.items))
+        self.assertFalse(seeded["failed"])
+
+    def sync(self):
+        from roadmap_sync import load_roadmap, sync_roadmap
+        with redirect_stdout(io.StringIO()):
+            return sync_roadmap(self.jira, load_roadmap(), self.type_map)
+
+    def test_resync_is_a_no_op(self):
+        result = self.sync()
+        self.assertEqual(result["created"], {})
+        self.assertEqual(result["updated"], [])
+        self.assertEqual(len(result["unchanged"]), len(self.items))
+        self.assertEqual(len(self.server.state.issues), len(self.items))
+
+    def test_failed_lookup_changes_nothing(self):
+        from jira_integration import JiraAPIError
+        self.fail_search_page(0, 503)
+        with self.assertRaises(JiraAPIError):
+            self.sync()
+        self.assertEqual(len(self.server.state.issues), len(self.items))
+
+
+if __name__ == "__main__":
+    unittest.main()
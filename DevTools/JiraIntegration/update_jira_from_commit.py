@@ -11,9 +11,15 @@ to a different status when specific keywords are used.
 
 Usage:
 This script is meant to be called from a Git hook, but can also be run manually:
-python update_jira_from_commit.py [commit_hash]
+python update_jira_from_commit.py [commit_hash ...] [--wait]
+python update_jira_from_commit.py --range origin/main..HEAD
+python update_jira_from_commit.py --pre-push <remote>   (pre-push hook)
+python update_jira_from_commit.py --post-rewrite        (post-rewrite hook)
 
-If no commit hash is provided, it will use the most recent commit.
+If no commit hash is provided, it will use the most recent commit. When several
+commits are processed, each ticket gets one comment listing all its commits. The updates
+are queued in the local spool (see jira_spool.py) and delivered in the
+background, or in the foreground with --wait.
 
 Commit message format:
 - To reference a ticket: "BWYD-123: Add new feature"
@@ -25,9 +31,13 @@ Commit message format:
 import os
 import sys
 import re
+import codecs
+import argparse
+import threading
 import subprocess
+from itertools import chain
 from pathlib import Path
-from typing import Optional, Tuple, List, Dict, Any
+from typing import Optional, Tuple, List, Dict, Any, Iterable, Iterator
 from datetime import datetime
 
 # Add the parent directory to sys.path so we can import the JiraAPI class
@@ -35,6 +45,7 @@ SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(str(SCRIPT_DIR))
 
 from jira_integration import JiraAPI
+from jira_spool import JiraSpool, drain_spool, start_background_drain, DRAIN_LOG, KIND_COMMENT, KIND_TRANSITION
 
 # Regex to match Jira ticket IDs (e.g., BWYD-123)
 JIRA_TICKET_PATTERN = r'([A-Z]+-\d+)'
@@ -42,6 +53,31 @@ JIRA_TICKET_PATTERN = r'([A-Z]+-\d+)'
 # Regex to match transition commands (e.g., #done)
 TRANSITION_PATTERN = r'#(\w+)'
 
+# Single-pass tokenizer: ticket IDs, transition commands and line breaks
+# (the same line boundaries as str.splitlines())
+COMMIT_MESSAGE_TOKENS = re.compile(
+    rf'(?P<ticket>{JIRA_TICKET_PATTERN})'
+    rf'|(?P<command>{TRANSITION_PATTERN})'
+    r'|(?P<newline>\r\n|[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029])'
+)
+
+# Commit fields read from git (the message must stay last: it can contain anything)
+GIT_COMMIT_FIELDS = [
+    ('hash', '%H'),
+    ('short_hash', '%h'),
+    ('author_name', '%an'),
+    ('author_email', '%ae'),
+    ('date', '%ad'),
+    ('subject', '%s'),
+    ('message', '%B')
+]
+
+# Records and fields are delimited with the ASCII record/unit separators,
+# which do not occur in commit metadata
+GIT_RECORD_SEPARATOR = "\x1e"
+GIT_FIELD_SEPARATOR = "\x1f"
+GIT_LOG_FORMAT = "%x1e" + "%x1f".join(format_str for _, format_str in GIT_COMMIT_FIELDS)
+
 # Mapping of command keywords to transition names
 # These should match your actual Jira workflow transitions
 TRANSITION_MAPPING = {
@@ -56,12 +92,127 @@ TRANSITION_MAPPING = {
     'closed': 'Done'
 }
 
-def get_git_commit_info(commit_hash: Optional[str] = None) -> Dict[str, str]:
+def iter_git_commits(commit_hashes: Iterable[str], repo_dir: Optional[str] = None) -> Iterator[Dict[str, str]]:
+    """
+    Stream commit information for many commits from a single `git log` call
+    
+    The hashes are passed on stdin (`--stdin --no-walk=unsorted`), and every
+    record is parsed as soon as git has written it, so N commits cost one
+    subprocess instead of one per field per commit.
+    
+    Args:
+        commit_hashes: Commits to read (hashes or other revisions such as HEAD)
+        repo_dir: Repository to read the commits from (defaults to the current directory)
+        
+    Yields:
+        Dictionaries with commit information (hash, short_hash, author_name,
+        author_email, date, subject, message), in the order given
+        
+    Raises:
+        subprocess.CalledProcessError: If git fails (e.g., an unknown commit)
+    """
+    return stream_git_log(['--no-walk=unsorted', '--stdin'], commit_hashes, repo_dir)
+
+def iter_git_range(revisions: List[str], repo_dir: Optional[str] = None) -> Iterator[Dict[str, str]]:
+    """
+    Stream commit information for every commit in a revision range, oldest first
+    
+    Args:
+        revisions: Revision range arguments for git log (e.g., ['origin/main..HEAD'])
+        repo_dir: Repository to read the commits from (defaults to the current directory)
+        
+    Yields:
+        Dictionaries with commit information (see iter_git_commits)
+        
+    Raises:
+        subprocess.CalledProcessError: If git fails (e.g., an unknown revision)
+    """
+    return stream_git_log(['--reverse'] + list(revisions) + ['--'], None, repo_dir)
+
+def stream_git_log(arguments: List[str], stdin_revisions: Optional[Iterable[str]] = None,
+                   repo_dir: Optional[str] = None) -> Iterator[Dict[str, str]]:
+    """
+    Run one `git log` with GIT_LOG_FORMAT and parse its records as they arrive
+    
+    Args:
+        arguments: Revision arguments for git log
+        stdin_revisions: Revisions to feed on stdin (requires '--stdin' in arguments)
+        repo_dir: Repository to run git in (defaults to the current directory)
+        
+    Yields:
+        Dictionaries with commit information
+        
+    Raises:
+        subprocess.CalledProcessError: If git fails
+    """
+    command = ['git', 'log', f'--format={GIT_LOG_FORMAT}'] + arguments
+    process = subprocess.Popen(
+        command,
+        stdin=subprocess.PIPE if stdin_revisions is not None else subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        cwd=repo_dir
+    )
+    
+    # git reads all revisions before it writes anything, but feed stdin from a
+    # thread anyway so a long list can never deadlock against a full stdout pipe
+    def feed():
+        try:
+            for revision in stdin_revisions:
+                process.stdin.write(f"{revision}\n".encode("utf-8"))
+            process.stdin.close()
+        except OSError:
+            pass  # git exited early; its status is checked below
+    
+    writer = None
+    if stdin_revisions is not None:
+        writer = threading.Thread(target=feed, daemon=True)
+        writer.start()
+    
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    pending = ""
+    try:
+        while True:
+            chunk = process.stdout.read1(65536)
+            if not chunk:
+                break
+            pending += decoder.decode(chunk)
+            # Every record starts with the separator, so all but the last are complete
+            *records, pending = pending.split(GIT_RECORD_SEPARATOR)
+            for record in records:
+                if record:
+                    yield parse_git_record(record)
+        pending += decoder.decode(b"", final=True)
+        if pending:
+            yield parse_git_record(pending)
+    finally:
+        process.stdout.close()
+        if writer:
+            writer.join()
+        returncode = process.wait()
+    
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, command)
+
+def parse_git_record(record: str) -> Dict[str, str]:
+    """
+    Parse one record of GIT_LOG_FORMAT output
+    
+    Args:
+        record: Fields of one commit, separated by GIT_FIELD_SEPARATOR
+        
+    Returns:
+        Dictionary with commit information
+    """
+    values = record.split(GIT_FIELD_SEPARATOR, len(GIT_COMMIT_FIELDS) - 1)
+    return {key: value.strip() for (key, _), value in zip(GIT_COMMIT_FIELDS, values)}
+
+def get_git_commit_info(commit_hash: Optional[str] = None, repo_dir: Optional[str] = None) -> Dict[str, str]:
     """
     Get commit information from Git
     
     Args:
         commit_hash: The hash of the commit to get info for. If None, use the latest commit.
+        repo_dir: Repository to read the commit from (defaults to the current directory)
         
     Returns:
         Dictionary with commit information (hash, author, date, message)
@@ -70,35 +221,10 @@ def get_git_commit_info(commit_hash: Optional[str] = None) -> Dict[str, str]:
     if not commit_hash:
         commit_hash = "HEAD"
     
-    # Get commit info
     try:
-        # Get the full commit message
-        message = subprocess.check_output(
-            ['git', 'log', '--format=%B', '-n', '1', commit_hash],
-            universal_newlines=True
-        ).strip()
-        
-        # Get other commit details
-        commit_format = {
-            'hash': '%H',
-            'short_hash': '%h',
-            'author_name': '%an',
-            'author_email': '%ae',
-            'date': '%ad',
-            'subject': '%s'
-        }
-        
-        commit_info = {}
-        for key, format_str in commit_format.items():
-            commit_info[key] = subprocess.check_output(
-                ['git', 'log', f'--format={format_str}', '-n', '1', commit_hash],
-                universal_newlines=True
-            ).strip()
-        
-        # Add the full message
-        commit_info['message'] = message
-        
-        return commit_info
+        for commit_info in iter_git_commits([commit_hash], repo_dir):
+            return commit_info
+        raise subprocess.CalledProcessError(1, ['git', 'log', commit_hash])
     except subprocess.CalledProcessError as e:
         print(f"Error getting commit info: {e}")
         sys.exit(1)
@@ -107,41 +233,54 @@ def extract_jira_info(commit_message: str) -> List[Dict[str, Any]]:
     """
     Extract Jira ticket IDs and transition commands from a commit message
     
+    The message is tokenized in a single pass. Every ticket is reported once,
+    with the transition command found on the line that mentions it (the first
+    command with a known transition wins). If the first mention has no command,
+    a later line mentioning the same ticket can still supply one.
+    
     Args:
         commit_message: The Git commit message
         
     Returns:
-        List of dictionaries with ticket IDs and transition commands
+        List of dictionaries with ticket IDs and transition commands, in order
+        of first mention
     """
-    # Find all Jira ticket IDs in the commit message
-    ticket_matches = re.finditer(JIRA_TICKET_PATTERN, commit_message)
+    results = {}
+    line_tickets = []
+    line_command = None
     
-    results = []
-    for match in ticket_matches:
-        ticket_id = match.group(1)
-        
-        # Find transition command that might be associated with this ticket ID
-        # Look for #command in the same line as the ticket ID
-        line_with_ticket = next(
-            (line for line in commit_message.splitlines() if ticket_id in line),
-            ""
-        )
-        
-        transition_match = re.search(TRANSITION_PATTERN, line_with_ticket)
-        transition_command = transition_match.group(1).lower() if transition_match else None
-        
-        # Map the transition command to an actual transition name
-        transition_name = None
-        if transition_command and transition_command in TRANSITION_MAPPING:
-            transition_name = TRANSITION_MAPPING[transition_command]
-        
-        results.append({
-            'ticket_id': ticket_id,
-            'transition_command': transition_command,
-            'transition_name': transition_name
-        })
+    def end_of_line():
+        # Attach this line's transition command to the tickets it mentions
+        if line_command:
+            for ticket_id in line_tickets:
+                info = results[ticket_id]
+                if not info['transition_name'] and (
+                        info['transition_command'] is None or line_command in TRANSITION_MAPPING):
+                    info['transition_command'] = line_command
+                    info['transition_name'] = TRANSITION_MAPPING.get(line_command)
+        line_tickets.clear()
+    
+    for token in COMMIT_MESSAGE_TOKENS.finditer(commit_message):
+        ticket_id = token.group('ticket')
+        if ticket_id:
+            if ticket_id not in results:
+                results[ticket_id] = {
+                    'ticket_id': ticket_id,
+                    'transition_command': None,
+                    'transition_name': None
+                }
+            line_tickets.append(ticket_id)
+        elif token.group('newline'):
+            end_of_line()
+            line_command = None
+        else:
+            command = token.group('command')[1:].lower()
+            # Prefer the first command that maps to a transition
+            if line_command is None or (line_command not in TRANSITION_MAPPING and command in TRANSITION_MAPPING):
+                line_command = command
+    end_of_line()
     
-    return results
+    return list(results.values())
 
 def format_commit_comment(commit_info: Dict[str, str]) -> str:
     """
@@ -168,78 +307,254 @@ This comment was automatically added by the BetterWYD Git-Jira integration.
 """
     return comment
 
-def update_jira_issues(commit_hash: Optional[str] = None):
+def format_batch_comment(commits: List[Dict[str, str]]) -> str:
     """
-    Main function to update Jira issues from a Git commit
+    Format several commits referencing the same issue as one Jira comment
     
     Args:
-        commit_hash: The hash of the commit to process. If None, use the latest commit.
+        commits: Commit information dictionaries, oldest first
+        
+    Returns:
+        Formatted comment text
     """
-    # Initialize Jira API
-    try:
-        jira = JiraAPI()
-    except ValueError as e:
-        print(f"Error initializing Jira API: {e}")
-        sys.exit(1)
+    if len(commits) == 1:
+        return format_commit_comment(commits[0])
     
-    # Test the connection to Jira
-    if not jira.test_connection():
-        print("Failed to connect to Jira. Please check your credentials.")
-        sys.exit(1)
+    lines = "\n".join(
+        f"* {commit['short_hash']} - {commit['subject']} ({commit['author_name']}, {commit['date']})"
+        for commit in commits
+    )
+    comment = f"""
+{len(commits)} Git commits referencing this issue:
+
+{lines}
+
+This comment was automatically added by the BetterWYD Git-Jira integration.
+"""
+    return comment
+
+def update_jira_issues(commits: Iterable[Dict[str, str]], wait: bool = False):
+    """
+    Main function to update Jira issues from Git commits
     
-    # Get commit info
-    commit_info = get_git_commit_info(commit_hash)
-    print(f"Processing commit: {commit_info['short_hash']} - {commit_info['subject']}")
+    The updates are written to the local spool first, so they are never lost
+    when Jira is unreachable, and then delivered by a background drainer.
     
-    # Extract Jira ticket IDs and transition commands
-    jira_info = extract_jira_info(commit_info['message'])
+    Args:
+        commits: Commit information dictionaries (see iter_git_commits / iter_git_range)
+        wait: Deliver the updates in the foreground instead of in the background
+    """
+    with JiraSpool() as spool:
+        try:
+            queued = spool_commit_batch(spool, commits)
+        except subprocess.CalledProcessError as e:
+            print(f"Error getting commit info: {e}")
+            sys.exit(1)
+        
+        if not queued:
+            return
+        
+        if not wait:
+            if start_background_drain():
+                print(f"Jira updates queued; delivering in the background (log: {DRAIN_LOG})")
+            return
+        
+        # Initialize Jira API
+        try:
+            jira = JiraAPI()
+        except ValueError as e:
+            print(f"Error initializing Jira API: {e}")
+            sys.exit(1)
+        
+        with jira:
+            drain_spool(jira, spool)
+
+def spool_commit_batch(spool: JiraSpool, commits: Iterable[Dict[str, str]],
+                       transitions: bool = True, verbose: bool = True) -> int:
+    """
+    Journal the Jira updates for a batch of commits, one comment per ticket
     
-    if not jira_info:
-        print("No Jira ticket IDs found in the commit message. Nothing to update.")
-        sys.exit(0)
+    References are grouped by ticket: every ticket gets a single comment listing
+    all of its commits, followed by the requested transitions in commit order.
+    (commit, ticket) pairs found in the spool's commit -> ticket index were
+    already handled (e.g. by the post-commit hook or an earlier run) and are
+    skipped without any network access.
     
-    # Format the comment to add to Jira
-    comment_text = format_commit_comment(commit_info)
+    Args:
+        spool: Spool to write to
+        commits: Commit information dictionaries, oldest first
+        transitions: Also queue the transitions requested by the commits
+        verbose: Print every commit and the outcome
+        
+    Returns:
+        Number of updates queued
+    """
+    by_ticket = {}
+    commit_count = 0
+    for commit_info in commits:
+        commit_count += 1
+        if verbose:
+            print(f"Processing commit: {commit_info['short_hash']} - {commit_info['subject']}")
+        for info in extract_jira_info(commit_info['message']):
+            refs = by_ticket.setdefault(info['ticket_id'], {"commits": [], "transitions": []})
+            # A ticket mentioned twice in one message is listed once
+            if not refs["commits"] or refs["commits"][-1] is not commit_info:
+                refs["commits"].append(commit_info)
+            if transitions and info['transition_name']:
+                refs["transitions"].append((commit_info['hash'], info['transition_name']))
     
-    # Process each ticket
-    for issue_info in jira_info:
-        ticket_id = issue_info['ticket_id']
-        transition_name = issue_info['transition_name']
+    if not by_ticket:
+        if verbose:
+            print("No Jira ticket IDs found in the commit messages. Nothing to update.")
+        return 0
+    
+    # Skip (commit, ticket) pairs that were already spooled or delivered
+    known = spool.known_links(
+        (commit['hash'], ticket_id) for ticket_id, refs in by_ticket.items() for commit in refs["commits"]
+    )
+    
+    items = []
+    links = []
+    for ticket_id, refs in by_ticket.items():
+        new_commits = [commit for commit in refs["commits"] if (commit['hash'], ticket_id) not in known]
+        if not new_commits:
+            continue
+        last_commit = new_commits[-1]['hash']
+        items.append((KIND_COMMENT, last_commit, ticket_id, format_batch_comment(new_commits)))
+        links.extend(
+            (commit['hash'], ticket_id, commit['subject'], commit['author_name'], commit['date'], last_commit)
+            for commit in new_commits
+        )
+        previous = None
+        for commit_hash, transition_name in refs["transitions"]:
+            if (commit_hash, ticket_id) in known:
+                continue
+            # Repeating the same transition would fail once the issue is there
+            if transition_name != previous:
+                items.append((KIND_TRANSITION, commit_hash, ticket_id, transition_name))
+            previous = transition_name
+    
+    if not items:
+        if verbose:
+            print(f"All Jira references in {commit_count} commits were already handled. Nothing to update.")
+        return 0
+    
+    queued = spool.enqueue(items, links)
+    if verbose:
+        tickets = sorted({issue_key for _, _, issue_key, _ in items})
+        print(f"Queued {queued} Jira updates for {', '.join(tickets)} from {commit_count} commits")
+    return queued
+
+def pre_push_revisions(remote: str, push_lines: Iterable[str], repo_dir: Optional[str] = None) -> List[List[str]]:
+    """
+    Work out which commits a push sends, from the pre-push hook's input
+    
+    Args:
+        remote: Name of the remote being pushed to
+        push_lines: Lines of '<local ref> <local sha> <remote ref> <remote sha>'
+        repo_dir: Repository being pushed (defaults to the current directory)
         
-        print(f"Processing Jira ticket: {ticket_id}")
+    Returns:
+        git log revision arguments for every updated ref
+    """
+    ranges = []
+    for line in push_lines:
+        parts = line.split()
+        if len(parts) != 4:
+            continue
+        _, local_sha, _, remote_sha = parts
+        if not local_sha.strip("0"):
+            continue  # ref deletion
+        if remote_sha.strip("0"):
+            ranges.append([f"{remote_sha}..{local_sha}"])
+            continue
+        # New remote branch: everything the remote does not have yet. Without any
+        # remote-tracking refs that would be the whole history, so skip it.
+        tracking = subprocess.run(
+            ['git', 'for-each-ref', '--count=1', f'refs/remotes/{remote}/'],
+            capture_output=True, text=True, cwd=repo_dir
+        ).stdout.strip()
+        if tracking:
+            ranges.append([local_sha, '--not', f'--remotes={remote}'])
+        else:
+            print(f"No remote-tracking branches for '{remote}'; skipping Jira updates for {local_sha[:7]}")
+    return ranges
+
+def post_rewrite_hashes(rewrite_lines: Iterable[str]) -> List[str]:
+    """
+    Get the new commits from the post-rewrite hook's input
+    
+    Args:
+        rewrite_lines: Lines of '<old sha> <new sha> [extra]'
         
-        # Add the commit as a comment
-        comment_result = jira.add_comment(ticket_id, comment_text)
+    Returns:
+        New commit hashes, in order and without duplicates (squashes map several old commits to one)
+    """
+    new_hashes = []
+    for line in rewrite_lines:
+        parts = line.split()
+        if len(parts) >= 2 and parts[1] not in new_hashes:
+            new_hashes.append(parts[1])
+    return new_hashes
+
+def spool_commit(spool: JiraSpool, commit_hash: Optional[str] = None, repo_dir: Optional[str] = None) -> int:
+    """
+    Journal the Jira updates for one commit (no network access)
+    
+    Args:
+        spool: Spool to write to
+        commit_hash: The hash of the commit to process. If None, use the latest commit.
+        repo_dir: Repository containing the commit (defaults to the current directory)
         
-        if comment_result:
-            print(f"Added commit information as a comment to {ticket_id}")
-        else:
-            print(f"Failed to add comment to {ticket_id}")
-        
-        # If a transition was requested, perform it
-        if transition_name:
-            print(f"Attempting to transition {ticket_id} to '{transition_name}'")
-            
-            # Get available transitions
-            transitions = jira.get_transitions(ticket_id)
-            
-            # Find the transition ID
-            transition_id = next(
-                (t['id'] for t in transitions if t['name'].lower() == transition_name.lower()),
-                None
-            )
-            
-            if transition_id:
-                result = jira.transition_issue(ticket_id, transition_id)
-                if result:
-                    print(f"Successfully transitioned {ticket_id} to '{transition_name}'")
-                else:
-                    print(f"Failed to transition {ticket_id}")
-            else:
-                print(f"Transition '{transition_name}' not available for {ticket_id}")
-                print("Available transitions:", ", ".join(t['name'] for t in transitions))
+    Returns:
+        Number of updates queued
+    """
+    return spool_commit_batch(spool, [get_git_commit_info(commit_hash, repo_dir)])
+
+def process_commit(jira: JiraAPI, spool: JiraSpool, commit_hash: Optional[str] = None,
+                   repo_dir: Optional[str] = None):
+    """
+    Spool the Jira updates for one commit and deliver everything that is due
+    
+    Args:
+        jira: JiraAPI instance with a warm connection
+        spool: Spool to write to and drain
+        commit_hash: The hash of the commit to process. If None, use the latest commit.
+        repo_dir: Repository containing the commit (defaults to the current directory)
+    """
+    spool_commit(spool, commit_hash, repo_dir)
+    drain_spool(jira, spool, check_connection=False)
+
+def main():
+    """Parse the command line and spool the referenced commits"""
+    parser = argparse.ArgumentParser(description="Update Jira tickets referenced by Git commits")
+    parser.add_argument("commit_hashes", nargs="*", help="Commits to process (defaults to HEAD)")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--range", dest="revision_range", metavar="RANGE",
+                        help="Process every commit in a revision range (e.g., origin/main..HEAD)")
+    source.add_argument("--pre-push", metavar="REMOTE",
+                        help="Process the commits being pushed (reads the pre-push hook's stdin)")
+    source.add_argument("--post-rewrite", action="store_true",
+                        help="Process rewritten commits (reads the post-rewrite hook's stdin)")
+    parser.add_argument("--wait", action="store_true",
+                        help="Deliver the updates in the foreground instead of in the background")
+    args = parser.parse_args()
+    
+    if args.revision_range:
+        commits = iter_git_range(args.revision_range.split())
+    elif args.pre_push:
+        commits = chain.from_iterable(
+            iter_git_range(revisions) for revisions in pre_push_revisions(args.pre_push, sys.stdin)
+        )
+    elif args.post_rewrite:
+        new_hashes = post_rewrite_hashes(sys.stdin)
+        if not new_hashes:
+            return
+        commits = iter_git_commits(new_hashes)
+    else:
+        commits = iter_git_commits(args.commit_hashes or ["HEAD"])
+    
+    update_jira_issues(commits, args.wait)
 
 if __name__ == "__main__":
-    # Get commit hash from command line if provided
-    commit_hash = sys.argv[1] if len(sys.argv) > 1 else None
-    update_jira_issues(commit_hash)
\ No newline at end of file
+    main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+BetterWYD Jira Workflow Graph
+
+Workflow graph of one issue type, learned from the transitions Jira reports
+for issues in each status (every transitions response lists the outgoing edges
+of one status, including the status each transition leads to). The graph is
+not stored separately: JiraAPI.get_workflow_graph() assembles it from the
+per-status transitions in the metadata cache, so it shares their TTL and
+invalidation.
+
+A breadth-first search finds the shortest chain of transitions to a target
+status, which lets '#done' move a ticket that is still 'To Do' through the
+intermediate statuses instead of giving up.
+
+Usage:
+    python workflow_graph.py                    # learned graph of every issue type
+    python workflow_graph.py --issue-type Task --from "To Do" --to Done
+"""
+
+import os
+import sys
+import argparse
+from collections import deque
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+# Get the script directory
+SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+
+# Add the JiraIntegration directory to the Python path
+sys.path.append(str(SCRIPT_DIR))
+
+
+def _same(a: Optional[str], b: Optional[str]) -> bool:
+    """Compare status or transition names the way Jira does (case-insensitive)"""
+    return a is not None and b is not None and a.casefold() == b.casefold()
+
+
+def transition_target(transition: Dict[str, Any]) -> Optional[str]:
+    """Name of the status a transition leads to, if Jira reported it"""
+    return (transition.get("to") or {}).get("name")
+
+
+class WorkflowGraph:
+    """Statuses of one issue type and the transitions between them"""
+
+    def __init__(self, issue_type: Optional[str] = None):
+        """
+        Initialize an empty graph
+
+        Args:
+            issue_type: Name of the issue type the workflow belongs to
+        """
+        self.issue_type = issue_type
+        self.edges: Dict[str, List[Dict[str, Any]]] = {}
+
+    def add_status(self, status: str, transitions: List[Dict[str, Any]]):
+        """
+        Record the transitions available from a status
+
+        Args:
+            status: Name of the status
+            transitions: Transitions as returned by Jira (with 'id', 'name' and 'to')
+        """
+        self.edges[status] = transitions
+
+    def knows(self, status: str) -> bool:
+        """Whether the outgoing transitions of a status have been learned"""
+        return any(_same(status, known) for known in self.edges)
+
+    def transitions_from(self, status: str) -> List[Dict[str, Any]]:
+        """Outgoing transitions of a status (case-insensitive lookup)"""
+        if status in self.edges:
+            return self.edges[status]
+        return next((transitions for known, transitions in self.edges.items() if _same(status, known)), [])
+
+    def shortest_path(self, start: str, target: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Find the shortest chain of transitions from one status to another
+
+        A transition reaches the target if it leads to a status with that name,
+        or is itself named after it (Jira's default workflows name transitions
+        after their target status), so a direct transition is always preferred.
+
+        Args:
+            start: Current status
+            target: Wanted status (or transition name)
+
+        Returns:
+            List of transitions to perform in order ([] if already there), or
+            None if the learned part of the workflow has no such path
+        """
+        if _same(start, target):
+            return []
+
+        visited = {start.casefold()}
+        queue = deque([(start, [])])
+        while queue:
+            status, path = queue.popleft()
+            for transition in self.transitions_from(status):
+                destination = transition_target(transition)
+                if _same(transition.get("name"), target) or _same(destination, target):
+                    return path + [transition]
+                if destination and destination.casefold() not in visited and self.knows(destination):
+                    visited.add(destination.casefold())
+                    queue.append((destination, path + [transition]))
+        return None
+
+    def describe(self) -> List[str]:
+        """Human-readable edge list"""
+        return [
+            f"{status} --[{transition.get('name')}]--> {transition_target(transition) or '?'}"
+            for status, transitions in sorted(self.edges.items())
+            for transition in transitions
+        ]
+
+
+def main():
+    """Show the learned workflow graphs, or a path through one"""
+    parser = argparse.ArgumentParser(description="Inspect the workflow graphs learned from Jira")
+    parser.add_argument("--issue-type", help="Only this issue type")
+    parser.add_argument("--from", dest="start", help="Start status for a path lookup")
+    parser.add_argument("--to", dest="target", help="Target status for a path lookup")
+    args = parser.parse_args()
+
+    from jira_integration import JiraAPI
+
+    try:
+        jira = JiraAPI()
+    except ValueError as e:
+        print(f"Error initializing Jira API: {e}")
+        sys.exit(1)
+
+    with jira:
+        issue_types = [args.issue_type] if args.issue_type else jira.learned_issue_types()
+        if not issue_types:
+            print("No workflow transitions have been learned yet")
+        for issue_type in issue_types:
+            graph = jira.get_workflow_graph(issue_type)
+            print(f"{issue_type} ({len(graph.edges)} statuses learned)")
+            for edge in graph.describe():
+                print(f"  {edge}")
+            if args.start and args.target:
+                path = graph.shortest_path(args.start, args.target)
+                if path is None:
+                    print(f"  No known path from '{args.start}' to '{args.target}'")
+                else:
+                    print(f"  Path: {' -> '.join([args.start] + [transition_target(t) or t['name'] for t in path])}")
+
+
+if __name__ == "__main__":
+    main()